@@ -5,6 +5,7 @@ Full natal chart, transits, and relationship compatibility
 """
 
 import swisseph as swe # type: ignore
+import numpy as np
 from datetime import datetime, timedelta
 import pytz # type: ignore
 from geopy.geocoders import Nominatim # type: ignore
@@ -14,8 +15,18 @@ import json
 import random
 import os
 import sys
-from collections import Counter
+from collections import Counter, OrderedDict, deque
+from collections.abc import Mapping
 import traceback
+import hashlib
+import sqlite3
+import pickle
+import csv
+import itertools
+import functools
+import bisect
+import argparse
+import multiprocessing
 
 # SET EPHEMERIS PATH - tell pyswisseph where to find ephemeris files
 # This looks in the same directory as your script
@@ -109,13 +120,233 @@ HYPOTHETICAL_BODY_MAP = {
     # there are more in seorbel.txt if you ever want them
 }
 
+# Common first names, nicknames and mythological names -> asteroid number
+NAME_ASTEROID_ALIASES = {
+    # Male names
+    "michael": 4793, "mike": 4793,
+    "james": 2335, "jim": 2335, "jimmy": 2335,
+    "john": 1583,
+    "robert": 2071, "rob": 2071, "bob": 2071,
+    "david": 2603, "dave": 2603,
+    "william": 2866, "will": 2866, "bill": 2866,
+    "richard": 3972, "rick": 3972, "dick": 3972,
+    "joseph": 3556, "joe": 3556,
+    "thomas": 2555, "tom": 2555,
+    "charles": 2906, "charlie": 2906,
+    "christopher": 4858,
+    "daniel": 2504, "dan": 2504,
+    "matthew": 10133, "matt": 10133,
+    "anthony": 2404, "tony": 2404,
+    "mark": 3791,
+    "donald": 3395, "don": 3395,
+    "steven": 3225, "steve": 3225,
+    "paul": 3317,
+    "andrew": 3671, "andy": 3671,
+    "joshua": 6534, "josh": 6534,
+    "kenneth": 3873, "ken": 3873,
+    "kevin": 6913,
+    "brian": 3225,
+    "george": 2603,
+    "edward": 3205, "ed": 3205, "eddie": 3205,
+    "ronald": 3544, "ron": 3544,
+    "timothy": 4655, "tim": 4655,
+    "jason": 2335,
+    "jeffrey": 21656, "jeff": 21656,
+    "ryan": 5024,
+    "jacob": 12524,
+    "gary": 2700,
+    "nicholas": 3937, "nick": 3937,
+    "eric": 12796,
+    "jonathan": 6446,
+    "stephen": 3225,
+    "larry": 12238,
+    "justin": 3936,
+    "scott": 2597,
+    "brandon": 21656,
+    "benjamin": 11548, "ben": 11548,
+    "samuel": 3097,
+    "frank": 2829,
+    "gregory": 21656, "greg": 21656,
+    "raymond": 2071,
+    "alexander": 8966, "alex": 8966,
+    "patrick": 1687,
+    "jack": 5372,
+    "dennis": 3214,
+    "jerry": 3112,
+    "tyler": 11548,
+    "aaron": 3277,
+    "henry": 3516,
+    "douglas": 3873,
+    "peter": 1987,
+    "adam": 13070,
+    "nathan": 12238,
+    "zachary": 11548, "zach": 11548,
+    "kyle": 21656,
+    "walter": 1677,
+    "harold": 2906,
+    "jeremy": 21656,
+    "ethan": 21656,
+    "carl": 1727,
+    "arthur": 2597,
+    "terry": 3873,
+    
+    # Female names
+    "mary": 2779,
+    "patricia": 436, "pat": 436, "patty": 436,
+    "jennifer": 6249, "jenny": 6249, "jen": 6249,
+    "linda": 882,
+    "barbara": 234, "barb": 234,
+    "elizabeth": 412, "liz": 412, "beth": 412,
+    "susan": 793, "sue": 793,
+    "jessica": 2239, "jess": 2239,
+    "sarah": 1039, "sara": 1039,
+    "karen": 1537,
+    "nancy": 2870,
+    "lisa": 3561,
+    "betty": 2487,
+    "margaret": 371, "maggie": 371, "meg": 371,
+    "sandra": 1288, "sandy": 1288,
+    "ashley": 2569,
+    "kimberly": 2696, "kim": 2696,
+    "emily": 291,
+    "donna": 1323,
+    "michelle": 1376,
+    "carol": 2085,
+    "amanda": 725,
+    "melissa": 1390,
+    "deborah": 1251, "debbie": 1251, "deb": 1251,
+    "stephanie": 1277,
+    "rebecca": 4713, "becky": 4713,
+    "sharon": 1984,
+    "laura": 952,
+    "cynthia": 1143, "cindy": 1143,
+    "kathleen": 2093, "kathy": 2093,
+    "amy": 3375,
+    "angela": 965,
+    "shirley": 2441,
+    "anna": 265,
+    "brenda": 323,
+    "pamela": 1939, "pam": 1939,
+    "emma": 283,
+    "nicole": 1547,
+    "helen": 101,
+    "samantha": 796, "sam": 796,
+    "katherine": 2093, "kate": 2093, "katie": 2093,
+    "christine": 1244, "chris": 1244,
+    "debra": 1251,
+    "rachel": 971,
+    "catherine": 2093,
+    "carolyn": 2085,
+    "janet": 2301,
+    "ruth": 1259,
+    "maria": 170,
+    "heather": 1092,
+    "diane": 1376,
+    "virginia": 50,
+    "julie": 1192,
+    "joyce": 1946,
+    "victoria": 12,
+    "olivia": 224,
+    "kelly": 2907,
+    "christina": 1244,
+    "lauren": 9084,
+    "joan": 1502,
+    "evelyn": 715,
+    "judith": 664,
+    "megan": 2940,
+    "cheryl": 1575,
+    "andrea": 8955,
+    "hannah": 1086,
+    "jacqueline": 8558, "jackie": 8558,
+    "martha": 205,
+    "gloria": 294,
+    "teresa": 295,
+    "ann": 1087, "anne": 1087,
+    "madison": 9387,
+    "frances": 1015,
+    "kathryn": 2093,
+    "janice": 2301,
+    "jean": 1815,
+    "abigail": 21656,
+    "sophia": 251,
+    "grace": 2873,
+    "denise": 1877,
+    "judy": 2301,
+    "rose": 223,
+    "diana": 78,
+    "brittany": 9502,
+    "natalie": 1428,
+    "danielle": 2700,
+    "alexis": 2815,
+    "lori": 3561,
+    
+    # Mythological
+    "apollo": 1862,
+    "athena": 881,
+    "zeus": 5731,
+    "hera": 103,
+    "artemis": 105,
+    "aphrodite": 1388,
+    "hermes": 69230,
+    "ares": 2174,
+    "hades": 27928,
+    "poseidon": 4341,
+    "demeter": 1108,
+    "hestia": 46,
+    "dionysus": 3671,
+    "persephone": 399,
+    "hecate": 100,
+    "pan": 4450,
+    "prometheus": 1809,
+    "orpheus": 3361,
+    "medusa": 149,
+    "pandora": 55,
+    "europa": 52,
+    "io": 85,
+    "ganymede": 1036,
+    "selene": 580,
+    "helios": 895,
+    "eos": 221,
+    "nyx": 3908,
+    "gaia": 1184,
+    "uranus": 2207,
+    "kronos": 10811,
+    "rhea": 577,
+    "titan": 1809,
+    "atlas": 1198,
+    "hercules": 532,
+    "perseus": 9876,
+    "theseus": 1841,
+    "achilles": 588,
+    "hector": 624,
+    "odysseus": 1143,
+    "penelope": 201,
+    "paris": 3317,
+    "cassandra": 114,
+    "electra": 130,
+    "orion": 1327,
+    "andromeda": 31,
+    "pegasus": 1620
+}
+
+
+# Per-user cache directory for snapshots and stores that live outside the install
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".woflstrology")
+
+HOROSCOPE_SNAPSHOT_PATH = os.path.join(CACHE_DIR, "horoscope_database.snapshot")
+
+# Bump whenever the snapshot layout changes
+HOROSCOPE_SNAPSHOT_FORMAT = 1
 
-def load_horoscope_database():
+# Top-level sections that are split one level further in the snapshot
+NESTED_SECTIONS = ("natal_chart",)
+
+
+def horoscope_database_path():
     """
-    Load horoscope content from JSON database
+    Location of horoscope_database.json
     Works both as script and as bundled executable
     """
-    # Determine if we're running as a script or frozen exe
     if getattr(sys, 'frozen', False):
         # Running as compiled executable
         base_path = sys._MEIPASS
@@ -123,15 +354,204 @@ def load_horoscope_database():
         # Running as normal Python script
         base_path = os.path.dirname(os.path.abspath(__file__))
     
-    db_path = os.path.join(base_path, "horoscope_database.json")
+    return os.path.join(base_path, "horoscope_database.json")
+
+
+def write_horoscope_snapshot(data, source_path, snapshot_path=HOROSCOPE_SNAPSHOT_PATH):
+    """
+    Write a section-indexed pickle snapshot of the database
+    Layout: 8-byte header length, pickled header (source mtime/size + offset index),
+    then one pickled blob per section so each can be read with a single seek
+    """
+    blobs = []
+    for name, value in data.items():
+        if name in NESTED_SECTIONS and isinstance(value, dict):
+            for sub_name, sub_value in value.items():
+                blobs.append(((name, sub_name), pickle.dumps(sub_value, pickle.HIGHEST_PROTOCOL)))
+        else:
+            blobs.append(((name,), pickle.dumps(value, pickle.HIGHEST_PROTOCOL)))
+    
+    index = {}
+    offset = 0
+    for key, blob in blobs:
+        index[key] = (offset, len(blob))
+        offset += len(blob)
+    
+    stat = os.stat(source_path)
+    header = pickle.dumps({
+        "format": HOROSCOPE_SNAPSHOT_FORMAT,
+        "source_mtime": stat.st_mtime_ns,
+        "source_size": stat.st_size,
+        "order": list(data.keys()),
+        "index": index,
+    }, pickle.HIGHEST_PROTOCOL)
+    
+    os.makedirs(os.path.dirname(os.path.abspath(snapshot_path)), exist_ok=True)
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for _, blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, snapshot_path)
+
+
+def read_horoscope_snapshot_header(source_path, snapshot_path=HOROSCOPE_SNAPSHOT_PATH):
+    """
+    Read the snapshot header if it is still valid for the JSON source
+    Returns (header, data_offset) or None when missing, stale or unreadable
+    """
+    try:
+        stat = os.stat(source_path)
+        with open(snapshot_path, 'rb') as f:
+            header_length = int.from_bytes(f.read(8), "little")
+            header = pickle.loads(f.read(header_length))
+    except Exception:
+        return None
+    
+    if (header.get("format") != HOROSCOPE_SNAPSHOT_FORMAT
+            or header.get("source_mtime") != stat.st_mtime_ns
+            or header.get("source_size") != stat.st_size):
+        return None
+    
+    return header, 8 + header_length
+
+
+class LazySection(Mapping):
+    """
+    Read-only mapping whose values are fetched from the snapshot on first access
+    Used for the top-level database and for the nested natal_chart section
+    """
+
+    def __init__(self, database, prefix, keys):
+        self._database = database
+        self._prefix = prefix
+        self._keys = list(keys)
+        self._values = {}
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            if key not in self._keys:
+                raise KeyError(key)
+            self._values[key] = self._database._load_section(self._prefix + (key,))
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __repr__(self):
+        loaded = ", ".join(str(key) for key in self._values)
+        return f"<LazySection {'/'.join(self._prefix) or 'root'} loaded=[{loaded}]>"
+
+
+class HoroscopeDatabase(LazySection):
+    """
+    Dict-like horoscope database that loads sections on first access
+    Backed either by an in-memory dict or by the pickle snapshot in CACHE_DIR,
+    which is rebuilt whenever horoscope_database.json changes
+    """
+
+    def __init__(self, data=None, snapshot_path=None, header=None, data_offset=0, source="memory"):
+        self._data = data
+        self._snapshot_path = snapshot_path
+        self._index = header["index"] if header else {}
+        self._data_offset = data_offset
+        self.source = source
+        self.load_seconds = 0.0
+        self.section_seconds = {}
+        
+        if data is not None:
+            keys = list(data.keys())
+        else:
+            keys = header["order"]
+        super().__init__(self, (), keys)
+
+    @classmethod
+    def from_snapshot(cls, source_path, snapshot_path=HOROSCOPE_SNAPSHOT_PATH):
+        """Open a valid snapshot, or return None if it has to be rebuilt"""
+        result = read_horoscope_snapshot_header(source_path, snapshot_path)
+        if result is None:
+            return None
+        header, data_offset = result
+        return cls(snapshot_path=snapshot_path, header=header, data_offset=data_offset, source="snapshot")
+
+    def _load_section(self, key):
+        """Fetch one section (a key path tuple) from memory or the snapshot"""
+        start = time.perf_counter()
+        
+        if self._data is not None:
+            value = self._data
+            for part in key:
+                value = value[part]
+        elif key in self._index:
+            offset, length = self._index[key]
+            with open(self._snapshot_path, 'rb') as f:
+                f.seek(self._data_offset + offset)
+                value = pickle.loads(f.read(length))
+        else:
+            # Nested section: expose its children lazily
+            children = [path[len(key)] for path in self._index if path[:len(key)] == key]
+            value = LazySection(self, key, children)
+        
+        self.section_seconds["/".join(key)] = time.perf_counter() - start
+        return value
+
+    def natal_chart(self):
+        """Natal chart interpretations (planet_in_sign, aspects, asteroids, ...)"""
+        return self.get("natal_chart", {})
+
+    def sabian_symbols(self):
+        """Sabian symbol table keyed by sign, then degree"""
+        return self.natal_chart().get("sabian_symbols", {})
+
+    def fixed_stars(self):
+        """Fixed star descriptions and the per-star table"""
+        return self.natal_chart().get("fixed_stars", {})
+
+    def compatibility(self):
+        """Relationship dynamics, advice and transit influences"""
+        return self.get("compatibility", {})
+
+    def load_stats(self):
+        """Where the database came from and how long loading took"""
+        return {
+            "source": self.source,
+            "load_seconds": self.load_seconds,
+            "sections_loaded": dict(self.section_seconds),
+        }
+
+
+def load_horoscope_database(snapshot_path=HOROSCOPE_SNAPSHOT_PATH):
+    """
+    Load horoscope content as a lazy HoroscopeDatabase
+    Uses the pickle snapshot when it matches the JSON file's mtime and size,
+    otherwise parses the JSON once and refreshes the snapshot
+    """
+    start = time.perf_counter()
+    db_path = horoscope_database_path()
     
     if os.path.exists(db_path):
-        with open(db_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        database = HoroscopeDatabase.from_snapshot(db_path, snapshot_path)
+        
+        if database is None:
+            with open(db_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            database = HoroscopeDatabase(data=data, source="json")
+            
+            try:
+                write_horoscope_snapshot(data, db_path, snapshot_path)
+            except Exception as e:
+                print(f"⚠ Could not write database snapshot: {e}", file=sys.stderr)
     else:
-        print(f"⚠ Warning: {db_path} not found. Using default minimal database.")
+        print(f"⚠ Warning: {db_path} not found. Using default minimal database.", file=sys.stderr)
         # Minimal fallback
-        return {
+        database = HoroscopeDatabase(data={
             "sun_sign_themes": {sign: ["Energies are active"] for sign in ZODIAC_SIGNS},
             "moon_sign_influences": {sign: "influencing emotions" for sign in ZODIAC_SIGNS},
             "element_combinations": {},
@@ -143,7 +563,10 @@ def load_horoscope_database():
                 "compatibility_advice": {"challenging": [], "harmonious": [], "neutral": []},
                 "transit_influences_on_relationships": {}
             }
-        }
+        }, source="fallback")
+    
+    database.load_seconds = time.perf_counter() - start
+    return database
 
 
 def geocode_location(location_name):
@@ -187,81 +610,1001 @@ def get_element(sign):
     return "Unknown"
 
 
-def calculate_natal_positions(year, month, day, hour, minute, second, timezone_str="UTC"):
+# Record layout for batched ephemeris results - one row per (instant, body)
+POSITION_DTYPE = np.dtype([
+    ("jd", "f8"),
+    ("body", "i4"),
+    ("longitude", "f8"),
+    ("latitude", "f8"),
+    ("distance", "f8"),
+    ("speed", "f8"),
+    ("sign", "i1"),
+    ("retrograde", "?")
+])
+
+
+# Root finders stop once the correction is below ~0.1 seconds
+ROOT_TOLERANCE_DAYS = 1e-6
+
+
+def wrap_angle(angle):
+    """Wrap an angle (or array of angles) into the -180..180 range"""
+    return (np.asarray(angle, dtype=np.float64) + 180.0) % 360.0 - 180.0
+
+
+# How a local time inside a daylight-saving change is read:
+#   "standard" - the standard-time reading (what pytz localize() does by default)
+#   "daylight" - the daylight-saving reading
+#   "raise"    - refuse: pytz AmbiguousTimeError / NonExistentTimeError
+DST_POLICIES = ("standard", "daylight", "raise")
+
+# Process-wide defaults for the conversion layer (batch workers set their own)
+time_settings = {"dst_policy": "standard"}
+
+UNIX_EPOCH = datetime(1970, 1, 1)
+UNIX_EPOCH_JD = 2440587.5
+
+# Local times at which a zone without a transition table must report the same offset
+FIXED_OFFSET_SAMPLES = [datetime(year, month, 1) for year in (1900, 1970, 2000, 2100) for month in (1, 7)]
+
+
+class TimezoneTable:
     """
-    Calculate natal Sun and Moon positions from birth data
-    Returns sun_sign and moon_sign
+    One timezone's UTC offset history as NumPy arrays, read once from pytz
+    Converting local wall-clock times to UTC is then a searchsorted over the
+    periods' local start times, for one timestamp or a million of them.
     """
-    # Convert to UTC
-    tz = pytz.timezone(timezone_str)
-    local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-    utc_dt = local_dt.astimezone(pytz.UTC)
     
-    # Calculate Julian Day
-    jd = swe.julday(
+    def __init__(self, timezone_str):
+        self.name = timezone_str
+        tz = pytz.timezone(timezone_str)
+        
+        if isinstance(tz, pytz.tzinfo.DstTzInfo):
+            starts = np.array([(t - UNIX_EPOCH).total_seconds() for t in tz._utc_transition_times])
+            starts[0] = -np.inf
+            self.offsets = np.array([info[0].total_seconds() for info in tz._transition_info])
+            self.dst = np.array([bool(info[1]) for info in tz._transition_info])
+        else:
+            # UTC and fixed-offset zones - check pytz agrees the offset never changes
+            offset = tz.utcoffset(UNIX_EPOCH)
+            for sample in FIXED_OFFSET_SAMPLES:
+                if tz.localize(sample).utcoffset() != offset:
+                    raise ValueError(f"{timezone_str} is not a fixed-offset timezone but has no transition table")
+            starts = np.array([-np.inf])
+            self.offsets = np.array([offset.total_seconds()])
+            self.dst = np.array([False])
+        
+        # Each period as a local wall-clock range [local_starts, local_ends)
+        self.local_starts = starts + self.offsets
+        self.local_ends = np.append(starts[1:], np.inf) + self.offsets
+        
+        # Plain lists for the single-timestamp path, where NumPy call overhead dominates
+        self.starts_list = self.local_starts.tolist()
+        self.ends_list = self.local_ends.tolist()
+        self.offsets_list = self.offsets.tolist()
+    
+    def classify(self, local_seconds):
+        """
+        Period index and DST-change flags for local times (seconds since 1970, wall clock)
+        Returns (period, ambiguous, nonexistent)
+        """
+        local_seconds = np.asarray(local_seconds, dtype=np.float64)
+        period = np.clip(np.searchsorted(self.local_starts, local_seconds, side="right") - 1, 0, len(self.offsets) - 1)
+        previous = np.maximum(period - 1, 0)
+        
+        in_period = local_seconds < self.local_ends[period]
+        in_previous = (period > 0) & (local_seconds < self.local_ends[previous])
+        return period, in_period & in_previous, ~in_period & ~in_previous
+    
+    def utc_offsets(self, local_seconds, dst_policy=None):
+        """UTC offsets in seconds for local times, resolving DST changes by dst_policy"""
+        dst_policy = dst_policy or time_settings["dst_policy"]
+        if dst_policy not in DST_POLICIES:
+            raise ValueError(f"Unknown DST policy {dst_policy!r} (expected one of {', '.join(DST_POLICIES)})")
+        
+        local_seconds = np.asarray(local_seconds, dtype=np.float64)
+        period, ambiguous, nonexistent = self.classify(local_seconds)
+        previous = np.maximum(period - 1, 0)
+        following = np.minimum(period + 1, len(self.offsets) - 1)
+        
+        if dst_policy == "raise" and (ambiguous.any() or nonexistent.any()):
+            error = pytz.exceptions.AmbiguousTimeError if ambiguous.any() else pytz.exceptions.NonExistentTimeError
+            bad = local_seconds[ambiguous | nonexistent].flat[0]
+            raise error(f"{UNIX_EPOCH + timedelta(seconds=float(bad))} in {self.name}")
+        
+        daylight = dst_policy == "daylight"
+        offsets = np.where(local_seconds < self.local_ends[period], self.offsets[period], self.offsets[previous])
+        
+        # Repeated hour: the reading whose DST flag matches the policy, else (as pytz)
+        # the earliest UTC instant for "daylight" and the latest for "standard"
+        period_matches = self.dst[period] == daylight
+        previous_matches = self.dst[previous] == daylight
+        by_instant = np.maximum if daylight else np.minimum
+        repeated = np.where(period_matches & ~previous_matches, self.offsets[period],
+                            np.where(previous_matches & ~period_matches, self.offsets[previous],
+                                     by_instant(self.offsets[period], self.offsets[previous])))
+        offsets = np.where(ambiguous, repeated, offsets)
+        
+        # Skipped hour: read on the clock in force before ("standard") or after ("daylight") the change
+        skipped = self.offsets[following] if daylight else self.offsets[period]
+        return np.where(nonexistent, skipped, offsets)
+    
+    def utc_offset(self, local_seconds, dst_policy=None):
+        """utc_offsets for a single local time"""
+        period = max(bisect.bisect_right(self.starts_list, local_seconds) - 1, 0)
+        if local_seconds < self.ends_list[period] and (period == 0 or local_seconds >= self.ends_list[period - 1]):
+            return self.offsets_list[period]
+        return float(self.utc_offsets(local_seconds, dst_policy))
+
+
+@functools.lru_cache(maxsize=None)
+def get_timezone(timezone_str):
+    """Cached pytz timezone"""
+    return pytz.timezone(timezone_str)
+
+
+@functools.lru_cache(maxsize=None)
+def get_timezone_table(timezone_str):
+    """Cached TimezoneTable"""
+    return TimezoneTable(timezone_str)
+
+
+def local_datetime_to_utc(year, month, day, hour, minute, second, timezone_str="UTC", dst_policy=None):
+    """Naive UTC datetime for a local civil date/time"""
+    local_dt = datetime(year, month, day, hour, minute, second)
+    offset = get_timezone_table(timezone_str).utc_offset((local_dt - UNIX_EPOCH).total_seconds(), dst_policy)
+    return local_dt - timedelta(seconds=offset)
+
+
+def local_time_dst_status(year, month, day, hour, minute, second, timezone_str="UTC"):
+    """"ambiguous" for a repeated wall-clock time, "nonexistent" for a skipped one, else None"""
+    local_seconds = (datetime(year, month, day, hour, minute, second) - UNIX_EPOCH).total_seconds()
+    _, ambiguous, nonexistent = get_timezone_table(timezone_str).classify(local_seconds)
+    if ambiguous:
+        return "ambiguous"
+    if nonexistent:
+        return "nonexistent"
+    return None
+
+
+def local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str="UTC", dst_policy=None):
+    """
+    Convert a local civil date/time to a Julian Day (UT)
+    dst_policy (see DST_POLICIES) defaults to time_settings["dst_policy"]
+    """
+    utc_dt = local_datetime_to_utc(year, month, day, hour, minute, second, timezone_str, dst_policy)
+
+    return swe.julday(
         utc_dt.year, utc_dt.month, utc_dt.day,
         utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
     )
+
+
+def local_datetimes_to_jd(years, months, days, hours, minutes, seconds, timezone_str="UTC", dst_policy=None):
+    """
+    Bulk local_datetime_to_jd: arrays of local date/time fields in one timezone
+    to an array of Julian Days (UT), with no per-timestamp Python work
+    """
+    dates = (np.asarray(years) - 1970).astype("datetime64[Y]") + (np.asarray(months) - 1).astype("timedelta64[M]")
+    dates = dates.astype("datetime64[D]") + (np.asarray(days) - 1).astype("timedelta64[D]")
+    local_seconds = (dates.astype(np.int64) * 86400.0 + np.asarray(hours) * 3600.0
+                     + np.asarray(minutes) * 60.0 + np.asarray(seconds))
+    
+    utc_seconds = local_seconds - get_timezone_table(timezone_str).utc_offsets(local_seconds, dst_policy)
+    return utc_seconds / 86400.0 + UNIX_EPOCH_JD
+
+
+def datetime_to_jd(dt):
+    """
+    Convert a datetime to a Julian Day (UT); naive datetimes are taken as system local time
+    """
+    utc_dt = dt.astimezone(pytz.UTC)
+    return swe.julday(
+        utc_dt.year, utc_dt.month, utc_dt.day,
+        utc_dt.hour + utc_dt.minute/60.0 + (utc_dt.second + utc_dt.microsecond/1e6)/3600.0
+    )
+
+
+def jd_to_datetime(jd, timezone_str="UTC"):
+    """
+    Convert a Julian Day (UT) back to a timezone-aware datetime
+    """
+    year, month, day, hour = swe.revjul(float(jd))
+    utc_dt = datetime(year, month, day, tzinfo=pytz.UTC) + timedelta(hours=hour)
+    return utc_dt.astimezone(get_timezone(timezone_str))
+
+
+# Number of swe.calc_ut / swe.houses results kept in memory
+EPHEMERIS_CACHE_SIZE = 20000
+
+# Julian Days are quantized to the millisecond when used as cache keys
+JD_CACHE_QUANTUM = 1.0 / 86400000.0
+
+
+class EphemerisCache:
+    """
+    Bounded LRU cache in front of swe.calc_ut and swe.houses
+    Keyed by (body, quantized JD, flags) so repeated requests for the same
+    chart are served from memory; hits and misses are counted
+    """
+
+    def __init__(self, maxsize=EPHEMERIS_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key, compute):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        value = compute()
+        if self.maxsize > 0:
+            self.entries[key] = value
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value
+
+    def calc_ut(self, jd, body, flags):
+        """Cached swe.calc_ut - returns the result tuple (ret_flag is dropped)"""
+        key = ("calc", body, round(jd / JD_CACHE_QUANTUM), flags)
+        return self._lookup(key, lambda: swe.calc_ut(jd, body, flags)[0])
+
+    def houses(self, jd, lat, lon, hsys=b'P'):
+        """Cached swe.houses - returns (cusps, ascmc)"""
+        key = ("houses", round(jd / JD_CACHE_QUANTUM), round(lat, 6), round(lon, 6), hsys)
+        return self._lookup(key, lambda: swe.houses(jd, lat, lon, hsys))
+
+    def resize(self, maxsize):
+        """Change the cache size, evicting the oldest entries if needed"""
+        self.maxsize = maxsize
+        while len(self.entries) > max(maxsize, 0):
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Hit/miss counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+ephemeris_cache = EphemerisCache()
+
+
+class EphemerisEngine:
+    """
+    Batched Swiss Ephemeris lookups
+    Computes many bodies at many instants into one contiguous NumPy array
+    instead of building a fresh dict per planet per call
+    """
+
+    def __init__(self, flags=swe.FLG_SWIEPH | swe.FLG_SPEED, cache=None):
+        self.flags = flags
+        self.cache = cache
+
+    def calc(self, jd, body, flags=None):
+        """
+        Single Swiss Ephemeris lookup - (longitude, latitude, distance, speed, ...)
+        Raises swe.Error if the body cannot be calculated
+        """
+        flags = self.flags if flags is None else flags
+        if self.cache is not None:
+            return self.cache.calc_ut(float(jd), int(body), flags)
+        result, ret_flag = swe.calc_ut(float(jd), int(body), flags)
+        return result
+
+    def positions(self, jd_array, bodies, flags=None):
+        """
+        Calculate positions for every body at every Julian Day (UT)
+        Returns a POSITION_DTYPE array shaped (len(jd_array), len(bodies));
+        bodies that cannot be calculated (e.g. missing .se1 file) are NaN
+        """
+        flags = self.flags if flags is None else flags
+        jds = np.atleast_1d(np.asarray(jd_array, dtype=np.float64))
+        body_ids = [int(body) for body in bodies]
+
+        out = np.zeros((len(jds), len(body_ids)), dtype=POSITION_DTYPE)
+        out["jd"] = jds[:, None]
+        out["body"] = body_ids
+
+        raw = np.full((len(jds), len(body_ids), 4), np.nan)
+        for j, body_id in enumerate(body_ids):
+            for i, jd in enumerate(jds):
+                try:
+                    result = self.calc(jd, body_id, flags)
+                except swe.Error:
+                    continue
+                raw[i, j] = result[0], result[1], result[2], result[3]
+
+        longitudes = raw[..., 0] % 360.0
+        out["longitude"] = longitudes
+        out["latitude"] = raw[..., 1]
+        out["distance"] = raw[..., 2]
+        out["speed"] = raw[..., 3]
+        out["sign"] = np.where(np.isnan(longitudes), -1, longitudes // 30.0).astype(np.int8)
+        out["retrograde"] = raw[..., 3] < 0
+        return out
+
+    def chart(self, jd, bodies=None, flags=None):
+        """
+        Calculate one instant and return the classic {name: position dict} chart
+        bodies is a {name: swe body id} mapping, defaulting to PLANETS
+        """
+        bodies = PLANETS if bodies is None else bodies
+        rows = self.positions([jd], bodies.values(), flags)[0]
+        return positions_to_dict(rows, bodies.keys())
+
+
+def positions_to_dict(rows, names):
+    """
+    Convert one instant's POSITION_DTYPE rows into the per-planet dicts used by the readings
+    Bodies that could not be calculated are left out
+    """
+    positions = {}
+
+    for name, row in zip(names, rows):
+        longitude = float(row["longitude"])
+        if np.isnan(longitude):
+            continue
+
+        speed = float(row["speed"])
+        positions[name] = {
+            "planet": name,
+            "sign": ZODIAC_SIGNS[int(row["sign"])],
+            "longitude": longitude,
+            "speed": speed,
+            "retrograde": bool(row["retrograde"]),
+            "degrees_in_sign": longitude % 30
+        }
+
+    return positions
+
+
+ephemeris_engine = EphemerisEngine(cache=ephemeris_cache)
+
+
+# Precomputed daily longitudes/speeds for the ten PLANETS (build with --build-daily-table)
+DAILY_TABLE_PATH = os.path.join(ephe_path, "daily_planets_1800_2200.npz")
+
+
+class DailyEphemerisTable:
+    """
+    Compact float32 table of planet longitudes and speeds at a fixed step
+    Cubic Hermite interpolation on (longitude, speed) keeps the Moon well under
+    an arcsecond at daily resolution, so transit scans become array indexing
+    """
+
+    def __init__(self, jd_start, step, bodies, longitude, speed):
+        self.jd_start = float(jd_start)
+        self.step = float(step)
+        self.bodies = [int(body) for body in bodies]
+        self.longitude = longitude
+        self.speed = speed
+        self.jd_end = self.jd_start + self.step * (len(longitude) - 1)
+
+    @classmethod
+    def load(cls, path=DAILY_TABLE_PATH):
+        with np.load(path) as data:
+            return cls(data["jd_start"], data["step"], data["bodies"], data["longitude"], data["speed"])
+
+    def covers(self, jd_array, bodies):
+        jds = np.asarray(jd_array, dtype=np.float64)
+        return (all(int(body) in self.bodies for body in bodies)
+                and jds.size > 0 and jds.min() >= self.jd_start and jds.max() <= self.jd_end)
+
+    def interpolate(self, jd_array, bodies):
+        """
+        Interpolated (longitudes, speeds), each shaped (len(jd_array), len(bodies))
+        """
+        jds = np.atleast_1d(np.asarray(jd_array, dtype=np.float64))
+        columns = [self.bodies.index(int(body)) for body in bodies]
+        
+        position = (jds - self.jd_start) / self.step
+        k = np.clip(np.floor(position).astype(np.int64), 0, len(self.longitude) - 2)
+        s = (position - k)[:, None]
+        
+        p0 = self.longitude[k][:, columns].astype(np.float64)
+        p1 = p0 + wrap_angle(self.longitude[k + 1][:, columns] - p0)
+        m0 = self.speed[k][:, columns].astype(np.float64) * self.step
+        m1 = self.speed[k + 1][:, columns].astype(np.float64) * self.step
+        
+        s2, s3 = s * s, s * s * s
+        longitudes = ((2*s3 - 3*s2 + 1) * p0 + (s3 - 2*s2 + s) * m0
+                      + (-2*s3 + 3*s2) * p1 + (s3 - s2) * m1)
+        speeds = ((6*s2 - 6*s) * p0 + (3*s2 - 4*s + 1) * m0
+                  + (-6*s2 + 6*s) * p1 + (3*s2 - 2*s) * m1) / self.step
+        
+        return longitudes % 360.0, speeds
+
+
+def build_daily_ephemeris_table(path=DAILY_TABLE_PATH, start_year=1800, end_year=2200, step_days=1.0):
+    """
+    Build step: tabulate the ten PLANETS from start_year to end_year and save as .npz
+    Use step_days=0.25 for a 6-hourly table
+    """
+    jd_start = swe.julday(start_year, 1, 1, 0.0)
+    jd_end = swe.julday(end_year, 1, 1, 0.0)
+    jds = jd_start + step_days * np.arange(int(np.ceil((jd_end - jd_start) / step_days)) + 1)
+    bodies = list(PLANETS.values())
+    
+    # Bypass the LRU cache - every instant is visited exactly once
+    engine = EphemerisEngine()
+    longitude = np.empty((len(jds), len(bodies)), dtype=np.float32)
+    speed = np.empty((len(jds), len(bodies)), dtype=np.float32)
+    
+    chunk = 10000
+    for start in range(0, len(jds), chunk):
+        rows = engine.positions(jds[start:start + chunk], bodies)
+        longitude[start:start + chunk] = rows["longitude"]
+        speed[start:start + chunk] = rows["speed"]
+        print(f"  {min(start + chunk, len(jds))}/{len(jds)} days tabulated", end="\r", file=sys.stderr)
+    
+    np.savez(path, jd_start=jd_start, step=step_days, bodies=np.array(bodies), longitude=longitude, speed=speed)
+    print(f"\n✓ Daily ephemeris table written to {path}", file=sys.stderr)
+    
+    return DailyEphemerisTable(jd_start, step_days, bodies, longitude, speed)
+
+
+daily_table = None
+
+
+def get_daily_ephemeris_table():
+    """
+    Lazily load the precomputed daily table; None when it has not been built
+    """
+    global daily_table
+    
+    if daily_table is None and os.path.exists(DAILY_TABLE_PATH):
+        try:
+            daily_table = DailyEphemerisTable.load(DAILY_TABLE_PATH)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠ Could not load {DAILY_TABLE_PATH}: {e}", file=sys.stderr)
+            return None
+    
+    return daily_table
+
+
+def approximate_positions(jd_array, bodies):
+    """
+    Planet positions from the daily table when it covers the request, otherwise from Swiss Ephemeris
+    Table rows carry longitude, speed, sign and retrograde (latitude/distance are NaN);
+    meant for scans whose hits are refined exactly afterwards
+    """
+    table = get_daily_ephemeris_table()
+    
+    if table is None or not table.covers(jd_array, bodies):
+        return ephemeris_engine.positions(jd_array, bodies)
+    
+    jds = np.atleast_1d(np.asarray(jd_array, dtype=np.float64))
+    longitudes, speeds = table.interpolate(jds, bodies)
+    
+    out = np.zeros(longitudes.shape, dtype=POSITION_DTYPE)
+    out["jd"] = jds[:, None]
+    out["body"] = [int(body) for body in bodies]
+    out["longitude"] = longitudes
+    out["latitude"] = np.nan
+    out["distance"] = np.nan
+    out["speed"] = speeds
+    out["sign"] = (longitudes // 30.0).astype(np.int8)
+    out["retrograde"] = speeds < 0
+    return out
+
+
+def longitude_offset_function(body, target_longitude):
+    """
+    Build evaluate(jd) -> (body longitude - target wrapped to +/-180, speed) for the crossing finders
+    """
+    def evaluate(jd):
+        result = ephemeris_engine.calc(jd, body)
+        return float(wrap_angle(result[0] - target_longitude)), result[3]
+    return evaluate
+
+
+def refine_crossing(evaluate, jd_low, jd_high, value_low, tolerance=ROOT_TOLERANCE_DAYS, max_iterations=60):
+    """
+    Safeguarded Newton search for the zero of evaluate inside [jd_low, jd_high]
+    evaluate(jd) returns (value, rate); steps that would leave the bracket fall back to bisection
+    """
+    jd = 0.5 * (jd_low + jd_high)
+    
+    for _ in range(max_iterations):
+        value, rate = evaluate(jd)
+        if value == 0:
+            return jd
+        
+        # Shrink the bracket around the sign change
+        if (value < 0) == (value_low < 0):
+            jd_low, value_low = jd, value
+        else:
+            jd_high = jd
+        
+        next_jd = jd - value / rate if rate else jd_low - 1.0
+        if not jd_low < next_jd < jd_high:
+            next_jd = 0.5 * (jd_low + jd_high)
+        
+        if abs(next_jd - jd) < tolerance or jd_high - jd_low < tolerance:
+            return next_jd
+        jd = next_jd
+    
+    return jd
+
+
+def find_crossings(evaluate, jds, values, rates):
+    """
+    Every zero crossing of a wrapped angular function sampled at jds
+    values and rates are the samples of evaluate (degrees, degrees/day). A sample
+    interval with no sign change but a station inside (rate changes sign while
+    heading towards zero) is probed at the estimated station, so retrograde
+    double and triple passes are not missed. Returns refined Julian Days.
+    """
+    jds = np.asarray(jds, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    rates = np.asarray(rates, dtype=np.float64)
+    
+    fa, fb = values[:-1], values[1:]
+    ra, rb = rates[:-1], rates[1:]
+    
+    # Ignore the +/-180 wrap jump; a real crossing is near zero at both ends
+    near = (np.abs(fa) < 90) & (np.abs(fb) < 90)
+    crossing = near & ((fa == 0) | (fa * fb < 0))
+    station = near & ~crossing & (ra * rb < 0) & (fa * ra < 0)
+    
+    roots = []
+    for k in np.nonzero(crossing | station)[0]:
+        a, b = jds[k], jds[k + 1]
+        
+        if fa[k] == 0:
+            roots.append(a)
+        elif crossing[k]:
+            roots.append(refine_crossing(evaluate, a, b, fa[k]))
+        else:
+            # Estimate the station from the linear change in rate, then check the turning value
+            middle = a + (b - a) * ra[k] / (ra[k] - rb[k])
+            value, _ = evaluate(middle)
+            if value * fa[k] < 0:
+                roots.append(refine_crossing(evaluate, a, middle, fa[k]))
+                roots.append(refine_crossing(evaluate, middle, b, value))
+    
+    if values[-1] == 0:
+        roots.append(jds[-1])
+    
+    return roots
+
+
+# Precomputed retrograde stations and sign ingresses for the ten PLANETS
+# (shipped with src/ephe; rebuild with --build-station-calendar)
+STATION_CALENDAR_PATH = os.path.join(ephe_path, "stations_ingresses_1900_2100.npz")
+STATION_CALENDAR_YEARS = (1900, 2100)
+
+# direction: -1 turns retrograde, +1 turns direct. shadow_jd is where the shadow
+# begins (retrograde stations) or ends (direct stations); NaN outside the calendar
+STATION_DTYPE = np.dtype([
+    ("jd", "f8"),
+    ("body", "i4"),
+    ("longitude", "f8"),
+    ("direction", "i1"),
+    ("shadow_jd", "f8")
+])
+
+INGRESS_DTYPE = np.dtype([
+    ("jd", "f8"),
+    ("body", "i4"),
+    ("sign", "i1"),
+    ("retrograde", "?")
+])
+
+STATION_SPEED_STEP_DAYS = 0.05
+
+
+def speed_rate_function(body):
+    """Build evaluate(jd) -> (speed, rate of change of speed) for locating stations"""
+    def evaluate(jd):
+        speed = ephemeris_engine.calc(jd, body)[3]
+        acceleration = (ephemeris_engine.calc(jd + STATION_SPEED_STEP_DAYS, body)[3]
+                        - ephemeris_engine.calc(jd - STATION_SPEED_STEP_DAYS, body)[3]) / (2 * STATION_SPEED_STEP_DAYS)
+        return speed, acceleration
+    return evaluate
+
+
+class StationCalendar:
+    """
+    Every retrograde station and sign ingress of the ten PLANETS over a span of years
+    Both tables are sorted by (body, jd), so "next/previous station", the shadow of
+    a retrograde and "retrograde since/until" are binary searches in one body's rows
+    """
+    
+    def __init__(self, stations, ingresses, jd_start, jd_end):
+        self.stations = stations
+        self.ingresses = ingresses
+        self.jd_start = float(jd_start)
+        self.jd_end = float(jd_end)
+    
+    @classmethod
+    def load(cls, path=STATION_CALENDAR_PATH):
+        with np.load(path) as data:
+            return cls(data["stations"], data["ingresses"], data["jd_start"], data["jd_end"])
+    
+    def save(self, path=STATION_CALENDAR_PATH):
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, stations=self.stations, ingresses=self.ingresses,
+                            jd_start=self.jd_start, jd_end=self.jd_end)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def build(cls, start_year=STATION_CALENDAR_YEARS[0], end_year=STATION_CALENDAR_YEARS[1]):
+        """Scan daily samples for speed sign changes and sign boundaries, refining each to ~0.1 s"""
+        jd_start = swe.julday(start_year, 1, 1, 0.0)
+        jd_end = swe.julday(end_year, 1, 1, 0.0)
+        jds = np.append(np.arange(jd_start, jd_end, 1.0), jd_end)
+        
+        stations = []
+        ingresses = []
+        for planet, body in PLANETS.items():
+            samples = approximate_positions(jds, [body])[:, 0]
+            longitudes, speeds = samples["longitude"], samples["speed"]
+            
+            # Stations: the speed changes sign (bracket widened a day each side, since
+            # interpolated speeds can place a turn one sample early or late)
+            evaluate_speed = speed_rate_function(body)
+            for k in np.nonzero(speeds[:-1] * speeds[1:] < 0)[0]:
+                low, high = max(jds[k] - 1.0, jd_start), min(jds[k + 1] + 1.0, jd_end)
+                station_jd = refine_crossing(evaluate_speed, low, high, evaluate_speed(low)[0])
+                stations.append((station_jd, body, ephemeris_engine.calc(station_jd, body)[0],
+                                 1 if speeds[k] < 0 else -1, np.nan))
+            
+            # Sign ingresses
+            signs = samples["sign"].astype(np.int64)
+            for boundary in np.unique(np.concatenate([signs, signs + 1]) % 12) * 30.0:
+                evaluate = longitude_offset_function(body, boundary)
+                for jd in find_crossings(evaluate, jds, wrap_angle(longitudes - boundary), speeds):
+                    speed = ephemeris_engine.calc(jd, body)[3]
+                    sign = int(boundary // 30) if speed >= 0 else int(boundary // 30 - 1) % 12
+                    ingresses.append((jd, body, sign, speed < 0))
+        
+        stations = np.array(stations, dtype=STATION_DTYPE)
+        ingresses = np.array(ingresses, dtype=INGRESS_DTYPE)
+        stations = stations[np.lexsort((stations["jd"], stations["body"]))]
+        ingresses = ingresses[np.lexsort((ingresses["jd"], ingresses["body"]))]
+        
+        cls.find_shadows(stations, jd_start, jd_end)
+        return cls(stations, ingresses, jd_start, jd_end)
+    
+    @staticmethod
+    def find_shadows(stations, jd_start, jd_end):
+        """
+        Fill shadow_jd for each retrograde/direct station pair: the planet first
+        reaches the direct-station degree before turning retrograde (pre-shadow)
+        and last leaves the retrograde-station degree after turning direct (post-shadow)
+        """
+        for k in range(len(stations) - 1):
+            retro, direct = stations[k], stations[k + 1]
+            if retro["direction"] != -1 or direct["body"] != retro["body"]:
+                continue
+            
+            body = int(retro["body"])
+            window = 1.5 * (direct["jd"] - retro["jd"]) + 30.0
+            
+            before = np.arange(max(retro["jd"] - window, jd_start), retro["jd"], 1.0)
+            after = np.arange(direct["jd"], min(direct["jd"] + window, jd_end), 1.0)
+            for jds, target, pick, row in ((before, direct["longitude"], max, k), (after, retro["longitude"], min, k + 1)):
+                if len(jds) < 2:
+                    continue
+                rows = ephemeris_engine.positions(jds, [body])[:, 0]
+                evaluate = longitude_offset_function(body, target)
+                hits = find_crossings(evaluate, jds, wrap_angle(rows["longitude"] - target), rows["speed"])
+                if hits:
+                    stations["shadow_jd"][row] = pick(hits)
+    
+    def covers(self, jd):
+        return self.jd_start <= jd <= self.jd_end
+    
+    @staticmethod
+    def body_rows(table, planet):
+        """Slice of table holding planet's rows"""
+        body = PLANETS[planet]
+        return slice(np.searchsorted(table["body"], body, side="left"),
+                     np.searchsorted(table["body"], body, side="right"))
+    
+    def station_event(self, planet, row):
+        jd = float(row["jd"])
+        return {
+            "planet": planet,
+            "jd": jd,
+            "date": jd_to_datetime(jd),
+            "station": "retrograde" if row["direction"] < 0 else "direct",
+            "longitude": float(row["longitude"]),
+            "sign": get_zodiac_sign(row["longitude"]),
+            "degrees_in_sign": float(row["longitude"]) % 30,
+            "shadow_jd": None if np.isnan(row["shadow_jd"]) else float(row["shadow_jd"])
+        }
+    
+    def station_index(self, planet, jd):
+        """(planet's rows, position of the first station after jd within them)"""
+        rows = self.stations[self.body_rows(self.stations, planet)]
+        return rows, int(np.searchsorted(rows["jd"], jd, side="right"))
+    
+    def next_station(self, planet, jd):
+        rows, k = self.station_index(planet, jd)
+        return self.station_event(planet, rows[k]) if k < len(rows) else None
+    
+    def previous_station(self, planet, jd):
+        rows, k = self.station_index(planet, jd)
+        return self.station_event(planet, rows[k - 1]) if k > 0 else None
+    
+    def next_ingress(self, planet, jd):
+        rows = self.ingresses[self.body_rows(self.ingresses, planet)]
+        k = int(np.searchsorted(rows["jd"], jd, side="right"))
+        if k >= len(rows):
+            return None
+        return {"planet": planet, "jd": float(rows[k]["jd"]), "date": jd_to_datetime(rows[k]["jd"]),
+                "sign": ZODIAC_SIGNS[int(rows[k]["sign"])], "retrograde": bool(rows[k]["retrograde"])}
+    
+    def previous_ingress(self, planet, jd):
+        rows = self.ingresses[self.body_rows(self.ingresses, planet)]
+        k = int(np.searchsorted(rows["jd"], jd, side="right"))
+        if k == 0:
+            return None
+        return {"planet": planet, "jd": float(rows[k - 1]["jd"]), "date": jd_to_datetime(rows[k - 1]["jd"]),
+                "sign": ZODIAC_SIGNS[int(rows[k - 1]["sign"])], "retrograde": bool(rows[k - 1]["retrograde"])}
+    
+    def shadow_period(self, planet, jd):
+        """
+        The retrograde cycle in force at jd (shadow included), else the next one
+        Returns {planet, pre_shadow, retrograde_station, direct_station, post_shadow}
+        with Julian Days (None where outside the calendar), or None
+        """
+        rows, k = self.station_index(planet, jd)
+        if len(rows) == 0:
+            return None
+        
+        # Start from the retrograde station that opens the cycle
+        if k > 0 and rows[k - 1]["direction"] < 0:
+            start = k - 1                                   # retrograde now
+        elif k > 0 and rows[k - 1]["direction"] > 0 and k > 1 and jd <= np.nan_to_num(rows[k - 1]["shadow_jd"]):
+            start = k - 2                                   # post-shadow
+        elif k < len(rows) and rows[k]["direction"] < 0:
+            start = k                                       # before (or in the pre-shadow of) the next one
+        elif k + 1 < len(rows):
+            start = k + 1
+        else:
+            return None
+        
+        retro = rows[start]
+        direct = rows[start + 1] if start + 1 < len(rows) else None
+        nullable = lambda value: None if value is None or np.isnan(value) else float(value)
+        return {
+            "planet": planet,
+            "pre_shadow": nullable(retro["shadow_jd"]),
+            "retrograde_station": float(retro["jd"]),
+            "direct_station": nullable(direct["jd"]) if direct is not None else None,
+            "post_shadow": nullable(direct["shadow_jd"]) if direct is not None else None
+        }
+    
+    def retrograde_status(self, planet, jd):
+        """
+        Where planet stands in its retrograde cycle at jd
+        Returns {planet, phase, since, until}: phase is "retrograde", "pre-shadow",
+        "post-shadow" or "direct"; since/until bound that phase (Julian Days or None)
+        """
+        period = self.shadow_period(planet, jd)
+        status = {"planet": planet, "phase": "direct", "since": None, "until": None}
+        if period is None:
+            return status
+        
+        bounds = [("pre-shadow", period["pre_shadow"], period["retrograde_station"]),
+                  ("retrograde", period["retrograde_station"], period["direct_station"]),
+                  ("post-shadow", period["direct_station"], period["post_shadow"])]
+        for phase, since, until in bounds:
+            if since is not None and since <= jd and (until is None or jd < until):
+                status.update(phase=phase, since=since, until=until)
+                break
+        return status
+
+
+station_calendar = None
+
+
+def build_station_calendar(path=STATION_CALENDAR_PATH, start_year=STATION_CALENDAR_YEARS[0],
+                           end_year=STATION_CALENDAR_YEARS[1]):
+    """Build step: find every station and ingress from start_year to end_year and save as .npz"""
+    print(f"⏳ Finding stations and ingresses {start_year}-{end_year}...", file=sys.stderr)
+    calendar = StationCalendar.build(start_year, end_year)
+    calendar.save(path)
+    print(f"✓ {len(calendar.stations)} stations and {len(calendar.ingresses)} ingresses written to {path}", file=sys.stderr)
+    return calendar
+
+
+def get_station_calendar(build=True):
+    """
+    Lazily load the station/ingress calendar, building and saving it on first use
+    A calendar that cannot be saved is still kept in memory for this process
+    Returns None when it is missing and build is False, or cannot be built
+    """
+    global station_calendar
+    
+    if station_calendar is None and os.path.exists(STATION_CALENDAR_PATH):
+        try:
+            station_calendar = StationCalendar.load(STATION_CALENDAR_PATH)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠ Could not load {STATION_CALENDAR_PATH}: {e}", file=sys.stderr)
+    
+    if station_calendar is None and build:
+        print(f"⏳ Finding stations and ingresses {STATION_CALENDAR_YEARS[0]}-{STATION_CALENDAR_YEARS[1]} "
+              f"(first run only)...", file=sys.stderr)
+        try:
+            station_calendar = StationCalendar.build()
+        except swe.Error as e:
+            print(f"⚠ Could not build the station calendar: {e}", file=sys.stderr)
+            return None
+        try:
+            station_calendar.save(STATION_CALENDAR_PATH)
+        except OSError as e:
+            print(f"⚠ Could not save the station calendar to {STATION_CALENDAR_PATH}: {e}", file=sys.stderr)
+    
+    return station_calendar
+
+
+def calculate_natal_positions(year, month, day, hour, minute, second, timezone_str="UTC"):
+    """
+    Calculate natal Sun and Moon positions from birth data
+    Returns sun_sign and moon_sign
+    """
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
     
     # Calculate Sun position
-    sun_result, _ = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    sun_result = ephemeris_engine.calc(jd, swe.SUN)
     sun_sign = get_zodiac_sign(sun_result[0])
     
     # Calculate Moon position
-    moon_result, _ = swe.calc_ut(jd, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    moon_result = ephemeris_engine.calc(jd, swe.MOON)
     moon_sign = get_zodiac_sign(moon_result[0])
     
     return sun_sign, moon_sign
 
 
-def calculate_houses(year, month, day, hour, minute, second, lat, lon, timezone_str="UTC"):
+# Supported house systems: Swiss Ephemeris code -> display name
+HOUSE_SYSTEMS = {
+    "P": "Placidus",
+    "K": "Koch",
+    "W": "Whole Sign",
+    "E": "Equal",
+    "O": "Porphyry",
+    "R": "Regiomontanus",
+    "C": "Campanus"
+}
+
+DEFAULT_HOUSE_SYSTEM = "P"
+
+# System used when a quadrant system has no solution (inside the polar circles)
+POLAR_FALLBACK_HOUSE_SYSTEM = "O"
+
+HOUSE_SYSTEM_DTYPE = np.dtype([
+    ("system", "S1"),
+    ("cusps", np.float64, (12,)),
+    ("ascendant", np.float64),
+    ("midheaven", np.float64)
+])
+
+
+def calculate_houses(year, month, day, hour, minute, second, lat, lon, timezone_str="UTC",
+                     house_system=DEFAULT_HOUSE_SYSTEM):
     """
-    Calculate house cusps using Placidus system
+    Calculate house cusps (Placidus unless another HOUSE_SYSTEMS code is given)
     Returns house data with cusps and angles
     """
-    # Convert to UTC
-    tz = pytz.timezone(timezone_str)
-    local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-    utc_dt = local_dt.astimezone(pytz.UTC)
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
+    return calculate_houses_for_jd(jd, lat, lon, house_system)
+
+
+def calculate_houses_for_jd(jd, lat, lon, house_system=DEFAULT_HOUSE_SYSTEM):
+    """
+    Calculate house cusps for a Julian Day (UT)
+    Quadrant systems that fail near the poles fall back to Porphyry; the
+    system actually used is in the result's "house_system"
+    """
+    row = calculate_house_systems_for_jd(jd, lat, lon, [house_system])[0]
+    if np.isnan(row["cusps"]).any():
+        # stderr, so batch JSON-lines output on stdout stays clean
+        print(f"⚠ {HOUSE_SYSTEMS[house_system]} houses are undefined at latitude {lat:.1f}° - "
+              f"using {HOUSE_SYSTEMS[POLAR_FALLBACK_HOUSE_SYSTEM]}", file=sys.stderr)
+        row = calculate_house_systems_for_jd(jd, lat, lon, [POLAR_FALLBACK_HOUSE_SYSTEM])[0]
+    return house_system_data(row)
+
+
+def calculate_house_systems(year, month, day, hour, minute, second, lat, lon, timezone_str="UTC", systems=None):
+    """
+    Several house systems for one local birth time - the timezone is converted once
+    Returns a HOUSE_SYSTEM_DTYPE array, one row per system
+    """
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
+    return calculate_house_systems_for_jd(jd, lat, lon, systems)
+
+
+def calculate_house_systems_for_jd(jd, lat, lon, systems=None):
+    """
+    Cusps and angles for several house systems at a Julian Day (UT)
+    systems defaults to every HOUSE_SYSTEMS code; a system with no solution
+    at this latitude gets NaN cusps
+    """
+    systems = list(HOUSE_SYSTEMS) if systems is None else list(systems)
+    rows = np.zeros(len(systems), dtype=HOUSE_SYSTEM_DTYPE)
+    
+    for row, system in zip(rows, systems):
+        if system not in HOUSE_SYSTEMS:
+            raise ValueError(f"Unknown house system {system!r} (expected one of {', '.join(HOUSE_SYSTEMS)})")
+        row["system"] = system.encode()
+        try:
+            cusps, ascmc = ephemeris_cache.houses(jd, lat, lon, system.encode())
+        except swe.Error:
+            row["cusps"] = np.nan
+            row["ascendant"] = row["midheaven"] = np.nan
+            continue
+        row["cusps"] = cusps[:12]
+        row["ascendant"], row["midheaven"] = ascmc[0], ascmc[1]
     
-    # Calculate Julian Day
-    jd = swe.julday(
-        utc_dt.year, utc_dt.month, utc_dt.day,
-        utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
-    )
+    return rows
+
+
+def house_system_data(row):
+    """House data dict for one HOUSE_SYSTEM_DTYPE row"""
+    return build_house_data([float(c) for c in row["cusps"]], float(row["ascendant"]), float(row["midheaven"]),
+                            row["system"].decode())
+
+
+def format_house_system_comparison(systems):
+    """Side-by-side cusp table for a HOUSE_SYSTEM_DTYPE array, one column per system"""
+    names = [HOUSE_SYSTEMS[row["system"].decode()] for row in systems]
+    width = max(8, max(len(name) for name in names) + 1)
+    lines = ["House " + "".join(f"{name:>{width}}" for name in names)]
     
-    # Calculate houses using Placidus system
-    cusps, ascmc = swe.houses(jd, lat, lon, b'P')
+    for house in range(12):
+        cells = []
+        for row in systems:
+            cusp = row["cusps"][house]
+            cells.append(f"{'—':>{width}}" if np.isnan(cusp) else f"{ZODIAC_SIGNS[int(cusp // 30)][:3]} {int(cusp % 30):2d}°".rjust(width))
+        lines.append(f"{house + 1:>5} " + "".join(cells))
     
+    return "\n".join(lines)
+
+
+def build_house_data(cusp_longitudes, ascendant, midheaven, house_system=DEFAULT_HOUSE_SYSTEM):
+    """
+    Build the house data dict from the 12 cusp longitudes (houses 1-12) and the angles
+    """
     house_data = {
+        "house_system": house_system,
         "ascendant": {
-            "longitude": ascmc[0],
-            "sign": get_zodiac_sign(ascmc[0]),
-            "degrees_in_sign": ascmc[0] % 30
+            "longitude": ascendant,
+            "sign": get_zodiac_sign(ascendant),
+            "degrees_in_sign": ascendant % 30
         },
         "midheaven": {
-            "longitude": ascmc[1],
-            "sign": get_zodiac_sign(ascmc[1]),
-            "degrees_in_sign": ascmc[1] % 30
+            "longitude": midheaven,
+            "sign": get_zodiac_sign(midheaven),
+            "degrees_in_sign": midheaven % 30
         },
         "cusps": {}
     }
     
-    # House cusps
-    for i in range(1, 13):
-        if i < len(cusps):
-            cusp_long = cusps[i]
-            house_data["cusps"][i] = {
-                "longitude": cusp_long,
-                "sign": get_zodiac_sign(cusp_long),
-                "degrees_in_sign": cusp_long % 30
-            }
-        else:
-            house_data["cusps"][i] = {
-                "longitude": 0.0,
-                "sign": "Aries",
-                "degrees_in_sign": 0.0
-            }
+    for i, cusp_long in enumerate(cusp_longitudes, 1):
+        house_data["cusps"][i] = {
+            "longitude": cusp_long,
+            "sign": get_zodiac_sign(cusp_long),
+            "degrees_in_sign": cusp_long % 30
+        }
     
     return house_data
 
@@ -271,60 +1614,65 @@ def calculate_planetary_positions(year, month, day, hour, minute, second, timezo
     Calculate positions of all planets for a given date/time
     Returns dict with planet data including sign and retrograde status
     """
-    # Convert to UTC
-    tz = pytz.timezone(timezone_str)
-    local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-    utc_dt = local_dt.astimezone(pytz.UTC)
-    
-    # Calculate Julian Day
-    jd = swe.julday(
-        utc_dt.year, utc_dt.month, utc_dt.day,
-        utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
-    )
-    
-    positions = {}
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
+    return ephemeris_engine.chart(jd)
+
+
+class HouseIndex:
+    """
+    House lookup for one set of 12 cusps
+    Cusps are rotated so the 1st house starts at 0°; a longitude's house is then
+    the number of rotated cusps at or below its own rotated offset, found with
+    one searchsorted for any number of longitudes.
+    """
     
-    # Calculate for each planet
-    for planet_name, planet_id in PLANETS.items():
-        result, ret_flag = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        
-        longitude = result[0]
-        speed = result[3]
-        
-        sign = get_zodiac_sign(longitude)
-        is_retrograde = speed < 0
+    def __init__(self, cusp_longitudes):
+        self.cusps = np.asarray(cusp_longitudes, dtype=np.float64) % 360.0
+        self.offsets = (self.cusps - self.cusps[0]) % 360.0
+        # Cusps out of zodiacal order cannot be binary-searched
+        self.ordered = bool(np.all(np.diff(self.offsets) >= 0))
+    
+    def houses(self, longitudes):
+        """House numbers (1-12) for an array of longitudes"""
+        longitudes = np.asarray(longitudes, dtype=np.float64) % 360.0
+        if self.ordered:
+            return np.searchsorted(self.offsets, (longitudes - self.cusps[0]) % 360.0, side="right")
         
-        positions[planet_name] = {
-            "planet": planet_name,
-            "sign": sign,
-            "longitude": longitude,
-            "speed": speed,
-            "retrograde": is_retrograde,
-            "degrees_in_sign": longitude % 30
-        }
+        # First house whose [cusp, next cusp) span holds the longitude, else the 1st
+        flat = longitudes.reshape(-1)
+        current = self.cusps[:, None]
+        following = np.roll(self.cusps, -1)[:, None]
+        inside = np.where(current < following,
+                          (current <= flat) & (flat < following),
+                          (flat >= current) | (flat < following))
+        return np.where(inside.any(axis=0), inside.argmax(axis=0) + 1, 1).reshape(longitudes.shape)
     
-    return positions
+    def house(self, longitude):
+        """House number (1-12) for a single longitude"""
+        return int(self.houses(longitude))
+
+
+@functools.lru_cache(maxsize=256)
+def house_index_for_cusps(cusp_longitudes):
+    """HouseIndex for a tuple of 12 cusp longitudes, built once per chart"""
+    return HouseIndex(cusp_longitudes)
+
+
+def get_house_index(house_cusps):
+    """HouseIndex for a house_data["cusps"] dict"""
+    return house_index_for_cusps(tuple(house_cusps[i]["longitude"] for i in range(1, 13)))
 
 
 def find_house_for_planet(planet_longitude, house_cusps):
     """
     Determine which house a planet is in based on its longitude
     """
-    planet_long = planet_longitude % 360
-    
-    for house_num in range(1, 13):
-        current_cusp = house_cusps[house_num]["longitude"] % 360
-        next_house_num = (house_num % 12) + 1
-        next_cusp = house_cusps[next_house_num]["longitude"] % 360
-        
-        if current_cusp < next_cusp:
-            if current_cusp <= planet_long < next_cusp:
-                return house_num
-        else:
-            if planet_long >= current_cusp or planet_long < next_cusp:
-                return house_num
-    
-    return 1
+    return get_house_index(house_cusps).house(planet_longitude)
+
+
+def find_houses(longitudes, house_cusps):
+    """House numbers (1-12) for an array of longitudes"""
+    return get_house_index(house_cusps).houses(longitudes)
 
 
 def get_retrograde_interpretation_by_element(planet, element):
@@ -546,9 +1894,8 @@ def generate_general_horoscope(current_positions, house_data, natal_sun_sign, ho
     
     # Find the house with most planets (or random if tie)
     house_planet_counts = {}
-    for planet_name, pos_data in current_positions.items():
-        house_num = find_house_for_planet(pos_data["longitude"], house_data["cusps"])
-        house_planet_counts[house_num] = house_planet_counts.get(house_num, 0) + 1
+    for house_num in find_houses([p["longitude"] for p in current_positions.values()], house_data["cusps"]):
+        house_planet_counts[int(house_num)] = house_planet_counts.get(int(house_num), 0) + 1
     
     prominent_house = max(house_planet_counts, key=house_planet_counts.get)
     house_focus = horoscope_db.get("house_daily_focus", {}).get(str(prominent_house), 
@@ -601,6 +1948,7 @@ def generate_compatibility_reading(natal_sun_sign, partner_sun_sign, current_pos
     
     # Determine compatibility type
     compat_type = determine_compatibility_type(natal_element, partner_element)
+    compatibility = horoscope_db.compatibility()
     
     reading = f"\n{'=' * 70}\n"
     reading += f"RELATIONSHIP COMPATIBILITY ANALYSIS\n"
@@ -609,14 +1957,14 @@ def generate_compatibility_reading(natal_sun_sign, partner_sun_sign, current_pos
     
     # Element dynamics
     element_key = f"{natal_element}_{partner_element}"
-    element_dynamic = horoscope_db.get("compatibility", {}).get("element_dynamics", {}).get(
+    element_dynamic = compatibility.get("element_dynamics", {}).get(
         element_key, "This pairing brings together different energetic qualities that require conscious navigation."
     )
     
     reading += f"**Elemental Dynamic:**\n{element_dynamic}\n\n"
     
     # Universal relationship pattern (random selection)
-    patterns = horoscope_db.get("compatibility", {}).get("universal_relationship_patterns", [])
+    patterns = compatibility.get("universal_relationship_patterns", [])
     if patterns:
         num_patterns = min(3, len(patterns))
         selected_patterns = random.sample(patterns, num_patterns)
@@ -626,7 +1974,7 @@ def generate_compatibility_reading(natal_sun_sign, partner_sun_sign, current_pos
         reading += "\n"
     
     # Compatibility advice based on type
-    advice_list = horoscope_db.get("compatibility", {}).get("compatibility_advice", {}).get(compat_type, [])
+    advice_list = compatibility.get("compatibility_advice", {}).get(compat_type, [])
     if advice_list:
         advice = random.choice(advice_list)
         reading += f"**Astrological Guidance:**\n{advice}\n\n"
@@ -636,34 +1984,34 @@ def generate_compatibility_reading(natal_sun_sign, partner_sun_sign, current_pos
     
     # Check for retrograde planets that affect relationships
     if current_positions.get("Venus", {}).get("retrograde"):
-        venus_retro = horoscope_db.get("compatibility", {}).get("transit_influences_on_relationships", {}).get("venus_retrograde", [])
+        venus_retro = compatibility.get("transit_influences_on_relationships", {}).get("venus_retrograde", [])
         if venus_retro:
             transit_influences.append(("Venus Retrograde", random.choice(venus_retro)))
     
     if current_positions.get("Mars", {}).get("retrograde"):
-        mars_retro = horoscope_db.get("compatibility", {}).get("transit_influences_on_relationships", {}).get("mars_retrograde", [])
+        mars_retro = compatibility.get("transit_influences_on_relationships", {}).get("mars_retrograde", [])
         if mars_retro:
             transit_influences.append(("Mars Retrograde", random.choice(mars_retro)))
     
     if current_positions.get("Mercury", {}).get("retrograde"):
-        mercury_retro = horoscope_db.get("compatibility", {}).get("transit_influences_on_relationships", {}).get("mercury_retrograde", [])
+        mercury_retro = compatibility.get("transit_influences_on_relationships", {}).get("mercury_retrograde", [])
         if mercury_retro:
             transit_influences.append(("Mercury Retrograde", random.choice(mercury_retro)))
     
     # Add other transit influences based on current positions
     # Jupiter expansion if Jupiter is prominent
-    jupiter_influence = horoscope_db.get("compatibility", {}).get("transit_influences_on_relationships", {}).get("jupiter_expansion", [])
+    jupiter_influence = compatibility.get("transit_influences_on_relationships", {}).get("jupiter_expansion", [])
     if jupiter_influence and random.random() > 0.5:  # 50% chance to include
         transit_influences.append(("Jupiter's Expansion", random.choice(jupiter_influence)))
     
     # Add Neptune or Pluto influences occasionally
     if current_positions.get("Neptune") and random.random() > 0.7:
-        neptune_influence = horoscope_db.get("compatibility", {}).get("transit_influences_on_relationships", {}).get("neptune_illusion", [])
+        neptune_influence = compatibility.get("transit_influences_on_relationships", {}).get("neptune_illusion", [])
         if neptune_influence:
             transit_influences.append(("Neptune's Veil", random.choice(neptune_influence)))
     
     if current_positions.get("Pluto") and random.random() > 0.7:
-        pluto_influence = horoscope_db.get("compatibility", {}).get("transit_influences_on_relationships", {}).get("pluto_transformation", [])
+        pluto_influence = compatibility.get("transit_influences_on_relationships", {}).get("pluto_transformation", [])
         if pluto_influence:
             transit_influences.append(("Pluto's Depth", random.choice(pluto_influence)))
     
@@ -679,10 +2027,39 @@ def generate_compatibility_reading(natal_sun_sign, partner_sun_sign, current_pos
     return reading
 
 
-def generate_personalized_reading(current_positions, house_data, natal_sun_sign, natal_moon_sign, horoscope_db):
+def format_retrograde_cycle(planet, jd, calendar):
+    """
+    One sentence on where planet is in its retrograde cycle at jd, from the station calendar
+    Empty when the calendar is missing, does not cover jd, or the planet is not near a retrograde
+    """
+    if calendar is None or not calendar.covers(jd) or planet in ["Sun", "Moon"]:
+        return ""
+    
+    status = calendar.retrograde_status(planet, jd)
+    period = calendar.shadow_period(planet, jd)
+    date = lambda value: jd_to_datetime(value).strftime("%B %d, %Y") if value is not None else "beyond the calendar"
+    
+    if status["phase"] == "retrograde":
+        text = f"{planet} has been retrograde since {date(status['since'])} and stations direct on {date(status['until'])}"
+        if period["post_shadow"] is not None:
+            text += f", clearing its shadow by {date(period['post_shadow'])}"
+        return text + "."
+    if status["phase"] == "pre-shadow":
+        return (f"{planet} entered its pre-retrograde shadow on {date(status['since'])} "
+                f"and stations retrograde on {date(status['until'])}.")
+    if status["phase"] == "post-shadow":
+        return (f"{planet} stationed direct on {date(status['since'])} "
+                f"and leaves its post-retrograde shadow on {date(status['until'])}.")
+    return ""
+
+
+def generate_personalized_reading(current_positions, house_data, natal_sun_sign, natal_moon_sign, horoscope_db, jd=None):
     """
     Generate fully personalized astrological reading with house placements
+    With jd (the moment of current_positions), retrogrades are dated from the station calendar
+    and the month's lunations and next eclipse are listed from the lunation calendar
     """
+    calendar = get_station_calendar(build=False) if jd is not None else None
     moon_sign = current_positions["Moon"]["sign"]
     sun_sign = current_positions["Sun"]["sign"]
     
@@ -746,9 +2123,42 @@ def generate_personalized_reading(current_positions, house_data, natal_sun_sign,
             # Extra emphasis if it's the chart ruler
             if retro["is_ruler"]:
                 reading += f" **This is especially significant because {retro['planet']} rules your {natal_sun_sign} Sun, making its retrograde deeply personal.**"
+            
+            cycle = format_retrograde_cycle(retro["planet"], jd, calendar) if jd is not None else ""
+            if cycle:
+                reading += f" {cycle}"
     else:
         reading += "\n• No planets are currently in retrograde - a time of forward momentum and clear direction!"
     
+    # Planets in a retrograde shadow
+    if jd is not None:
+        for planet_name, pos_data in current_positions.items():
+            if pos_data["retrograde"] or planet_name not in PLANETS:
+                continue
+            cycle = format_retrograde_cycle(planet_name, jd, calendar)
+            if cycle:
+                reading += f"\n• **{planet_name} Shadow**: {cycle}"
+    
+    # This month's lunations and the next eclipse, placed in the natal houses
+    lunation_calendar = get_lunation_calendar(build=False) if jd is not None else None
+    if lunation_calendar is not None and lunation_calendar.covers(jd):
+        now = jd_to_datetime(jd)
+        lunations = lunation_calendar.lunations_in_month(now.year, now.month)
+        if lunations:
+            reading += "\n\n**Lunations This Month:**"
+            for event in lunations:
+                house_num = find_house_for_planet(event["longitude"], house_data["cusps"])
+                phase_name = event["phase"].replace("_", " ").title()
+                reading += (f"\n• {event['date'].strftime('%B %d')}: {phase_name} in {event['sign']} "
+                            f"{event['degrees_in_sign']:.0f}° - your {house_num}th house of {HOUSE_MEANINGS[house_num]['name']}")
+        
+        eclipse = lunation_calendar.next_eclipse(jd)
+        if eclipse:
+            house_num = find_house_for_planet(eclipse["longitude"], house_data["cusps"])
+            reading += (f"\n• Next eclipse: {eclipse['type']} {eclipse['eclipse']} eclipse on "
+                        f"{eclipse['date'].strftime('%B %d, %Y')} in {eclipse['sign']} {eclipse['degrees_in_sign']:.0f}° "
+                        f"- your {house_num}th house")
+    
     # Add natal chart context
     reading += f"\n\n**Your Natal Chart Context:**\n"
     reading += f"• Rising Sign (Ascendant): {house_data['ascendant']['sign']} at {house_data['ascendant']['degrees_in_sign']:.1f}°\n"
@@ -769,81 +2179,247 @@ def calculate_aspect_angle(long1, long2):
     return diff
 
 
+# Aspect definitions: (name, angle, orb)
+ASPECT_TYPES = [
+    ("conjunction", 0, 8),
+    ("opposition", 180, 8),
+    ("trine", 120, 8),
+    ("square", 90, 8),
+    ("sextile", 60, 6)
+]
+
+# Compact aspect records produced by find_aspects
+ASPECT_DTYPE = np.dtype([
+    ("chart", "i4"),
+    ("i", "i4"),
+    ("j", "i4"),
+    ("aspect", "i1"),
+    ("angle", "f8"),
+    ("orb", "f8")
+])
+
+
+def angular_separation_matrix(longitudes_a, longitudes_b):
+    """
+    Shortest angle between every longitude in a and every longitude in b
+    a has shape (N,), b has shape (M,) or (charts, M); result is (N, M) or (charts, N, M)
+    """
+    a = np.asarray(longitudes_a, dtype=np.float64)
+    b = np.asarray(longitudes_b, dtype=np.float64)
+
+    diff = np.abs(a[:, None] - b[..., None, :]) % 360.0
+    return np.minimum(diff, 360.0 - diff)
+
+
+def find_aspects(longitudes_a, longitudes_b, aspect_types=ASPECT_TYPES, unique_pairs=False):
+    """
+    Match an N x M separation matrix against an aspect/orb table in one broadcast
+    Each pair takes the first aspect in table order whose orb it falls within
+    b may be a stack of charts (charts, M) to compare one chart against many
+    unique_pairs keeps only i < j (for aspects within a single chart)
+    Returns an ASPECT_DTYPE array in chart, i, j order
+    """
+    separation = angular_separation_matrix(longitudes_a, longitudes_b)
+    if separation.ndim == 2:
+        separation = separation[None]
+
+    targets = np.array([angle for _, angle, _ in aspect_types], dtype=np.float64)
+    orbs = np.array([orb for _, _, orb in aspect_types], dtype=np.float64)
+
+    deviation = np.abs(separation[..., None] - targets)
+    within = deviation <= orbs
+
+    matched = within.any(axis=-1)
+    if unique_pairs:
+        matched &= np.triu(np.ones(separation.shape[1:], dtype=bool), k=1)
+
+    chart_idx, i_idx, j_idx = np.nonzero(matched)
+    aspect_idx = within[chart_idx, i_idx, j_idx].argmax(axis=-1)
+
+    aspects = np.empty(len(chart_idx), dtype=ASPECT_DTYPE)
+    aspects["chart"] = chart_idx
+    aspects["i"] = i_idx
+    aspects["j"] = j_idx
+    aspects["aspect"] = aspect_idx
+    aspects["angle"] = separation[chart_idx, i_idx, j_idx]
+    aspects["orb"] = deviation[chart_idx, i_idx, j_idx, aspect_idx]
+    return aspects
+
+
 def detect_aspects(natal_positions):
     """
     Detect major aspects between natal planets
     """
-    aspects = []
     planet_list = list(natal_positions.keys())
+    longitudes = [natal_positions[p]["longitude"] for p in planet_list]
     
-    # Aspect definitions: (name, angle, orb)
-    aspect_types = [
-        ("conjunction", 0, 8),
-        ("opposition", 180, 8),
-        ("trine", 120, 8),
-        ("square", 90, 8),
-        ("sextile", 60, 6)
-    ]
-    
-    # Check each pair of planets
-    for i, planet1 in enumerate(planet_list):
-        for planet2 in planet_list[i+1:]:
-            long1 = natal_positions[planet1]["longitude"]
-            long2 = natal_positions[planet2]["longitude"]
-            
-            angle = calculate_aspect_angle(long1, long2)
-            
-            # Check if angle matches any aspect
-            for aspect_name, target_angle, orb in aspect_types:
-                if abs(angle - target_angle) <= orb:
-                    aspects.append({
-                        "type": aspect_name,
-                        "planet1": planet1,
-                        "planet2": planet2,
-                        "angle": angle
-                    })
-                    break  # Don't count the same pair twice
+    # Check each pair of planets once (first matching aspect wins)
+    hits = find_aspects(longitudes, longitudes, unique_pairs=True)
     
-    return aspects
+    return [
+        {
+            "type": ASPECT_TYPES[hit["aspect"]][0],
+            "planet1": planet_list[hit["i"]],
+            "planet2": planet_list[hit["j"]],
+            "angle": float(hit["angle"])
+        }
+        for hit in hits
+    ]
 
 
 def calculate_full_natal_chart(year, month, day, hour, minute, second, lat, lon, timezone_str="UTC"):
     """
     Calculate complete natal chart with all planets
     """
-    # Convert to UTC
-    tz = pytz.timezone(timezone_str)
-    local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-    utc_dt = local_dt.astimezone(pytz.UTC)
-    
-    # Calculate Julian Day
-    jd = swe.julday(
-        utc_dt.year, utc_dt.month, utc_dt.day,
-        utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
-    )
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
+    return ephemeris_engine.chart(jd)
+
+
+# Persistent chart store - survives restarts so returning users skip recomputation
+CHART_STORE_PATH = os.path.join(CACHE_DIR, "charts.sqlite")
+
+# Bump whenever the stored record layout or the chart maths changes
+CHART_STORE_FORMAT = 4
+
+# Files in ephe_path that charts are computed from. Generated caches written
+# alongside them (daily table, astorb indexes, calendars) are not inputs
+EPHEMERIS_INPUT_SUFFIXES = (".se1",)
+EPHEMERIS_INPUT_FILES = ("sefstars.txt", "seorbel.txt")
+
+
+def ephemeris_version(path=None):
+    """
+    Fingerprint of the ephemeris input files (name, size, mtime) plus the store format
+    Charts stored against different ephemeris files are treated as stale
+    """
+    path = ephe_path if path is None else path
+    digest = hashlib.sha1(f"format={CHART_STORE_FORMAT}".encode())
     
-    natal_positions = {}
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if not (name.endswith(EPHEMERIS_INPUT_SUFFIXES) or name in EPHEMERIS_INPUT_FILES):
+                continue
+            stat = os.stat(os.path.join(path, name))
+            digest.update(f"{name}:{stat.st_size}:{int(stat.st_mtime)}".encode())
     
-    # Calculate for each planet
-    for planet_name, planet_id in PLANETS.items():
-        result, ret_flag = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    return digest.hexdigest()[:16]
+
+
+class ChartStore:
+    """
+    SQLite-backed store of natal charts keyed by birth instant + location + house system
+    Positions and houses are kept as packed float64 blobs, so a warm lookup is
+    one timezone conversion and one indexed row read with no swe work
+    """
+
+    def __init__(self, path=CHART_STORE_PATH, version=None):
+        self.path = path
+        self.version = ephemeris_version() if version is None else version
         
-        longitude = result[0]
-        speed = result[3]
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
         
-        sign = get_zodiac_sign(longitude)
-        is_retrograde = speed < 0
+        # Batch workers share one store file, so wait on locks instead of failing
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS charts ("
+            "key TEXT PRIMARY KEY, version TEXT NOT NULL, positions BLOB NOT NULL, houses BLOB NOT NULL)"
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def make_key(jd, lat, lon, house_system=DEFAULT_HOUSE_SYSTEM):
+        """
+        Key on the UT birth instant (quantized like the ephemeris cache), so DST
+        resolution and timezone data changes can never serve another instant's chart
+        """
+        return f"{round(jd / JD_CACHE_QUANTUM)}|{lat:.6f}|{lon:.6f}|{house_system}"
+
+    def get(self, key):
+        """Return (natal_positions, house_data) or None if missing or stale"""
+        row = self.connection.execute(
+            "SELECT positions, houses FROM charts WHERE key = ? AND version = ?", (key, self.version)
+        ).fetchone()
         
-        natal_positions[planet_name] = {
-            "planet": planet_name,
-            "sign": sign,
-            "longitude": longitude,
-            "speed": speed,
-            "retrograde": is_retrograde,
-            "degrees_in_sign": longitude % 30
-        }
+        if row is None:
+            return None
+        
+        return unpack_positions(row[0]), unpack_houses(row[1])
+
+    def put(self, key, natal_positions, house_data):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO charts (key, version, positions, houses) VALUES (?, ?, ?, ?)",
+            (key, self.version, pack_positions(natal_positions), pack_houses(house_data))
+        )
+        self.connection.commit()
+
+    def purge_stale(self):
+        """Delete charts computed against other ephemeris files; returns the number removed"""
+        cursor = self.connection.execute("DELETE FROM charts WHERE version != ?", (self.version,))
+        self.connection.commit()
+        return cursor.rowcount
+
+    def close(self):
+        self.connection.close()
+
+
+def pack_positions(positions):
+    """Pack {planet: position} into (longitude, speed) float64 pairs in PLANETS order"""
+    packed = np.full((len(PLANETS), 2), np.nan)
+    for i, planet_name in enumerate(PLANETS):
+        if planet_name in positions:
+            packed[i] = positions[planet_name]["longitude"], positions[planet_name]["speed"]
+    return packed.tobytes()
+
+
+def unpack_positions(blob):
+    packed = np.frombuffer(blob, dtype=np.float64).reshape(len(PLANETS), 2)
+    
+    rows = np.zeros(len(PLANETS), dtype=POSITION_DTYPE)
+    rows["longitude"] = packed[:, 0]
+    rows["speed"] = packed[:, 1]
+    rows["sign"] = np.where(np.isnan(packed[:, 0]), -1, packed[:, 0] // 30.0).astype(np.int8)
+    rows["retrograde"] = packed[:, 1] < 0
+    
+    return positions_to_dict(rows, PLANETS.keys())
+
+
+def pack_houses(house_data):
+    """Pack the 12 cusps, Ascendant, Midheaven and the HOUSE_SYSTEMS index of the system used"""
+    values = [house_data["cusps"][i]["longitude"] for i in range(1, 13)]
+    values += [house_data["ascendant"]["longitude"], house_data["midheaven"]["longitude"]]
+    values.append(list(HOUSE_SYSTEMS).index(house_data["house_system"]))
+    return np.array(values, dtype=np.float64).tobytes()
+
+
+def unpack_houses(blob):
+    values = np.frombuffer(blob, dtype=np.float64)
+    return build_house_data([float(v) for v in values[:12]], float(values[12]), float(values[13]),
+                            list(HOUSE_SYSTEMS)[int(values[14])])
+
+
+def load_or_calculate_natal_chart(year, month, day, hour, minute, second, lat, lon, timezone_str="UTC", store=None,
+                                  house_system=DEFAULT_HOUSE_SYSTEM, dst_policy=None):
+    """
+    Natal positions and houses, served from the chart store when already known
+    The local time is converted to UT (applying dst_policy) before the lookup
+    Returns (natal_positions, house_data)
+    """
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str, dst_policy)
+    key = ChartStore.make_key(jd, lat, lon, house_system)
+    
+    if store is not None:
+        cached = store.get(key)
+        if cached is not None:
+            return cached
+    
+    natal_positions = ephemeris_engine.chart(jd)
+    house_data = calculate_houses_for_jd(jd, lat, lon, house_system)
     
-    return natal_positions
+    if store is not None:
+        store.put(key, natal_positions, house_data)
+    
+    return natal_positions, house_data
 
 
 def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
@@ -857,7 +2433,7 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
     
     # Rising sign interpretation
     asc_sign = house_data["ascendant"]["sign"]
-    rising_interp = horoscope_db.get("natal_chart", {}).get("rising_sign", {}).get(
+    rising_interp = horoscope_db.natal_chart().get("rising_sign", {}).get(
         asc_sign, "Your rising sign shapes how you meet the world."
     )
     reading += f"**Rising Sign (Ascendant): {asc_sign}**\n"
@@ -875,7 +2451,7 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
             retro = " ℞" if pos["retrograde"] else ""
             
             planet_sign_key = f"{planet}_{sign}"
-            interp = horoscope_db.get("natal_chart", {}).get("planet_in_sign", {}).get(
+            interp = horoscope_db.natal_chart().get("planet_in_sign", {}).get(
                 planet_sign_key, f"Your {planet} in {sign} shapes this planetary energy."
             )
             
@@ -890,7 +2466,7 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
         reading += f"You were born with {len(natal_retrogrades)} planet(s) in retrograde motion:\n\n"
         
         for planet in natal_retrogrades:
-            retro_interp = horoscope_db.get("natal_chart", {}).get("natal_retrograde", {}).get(
+            retro_interp = horoscope_db.natal_chart().get("natal_retrograde", {}).get(
                 planet, f"{planet} retrograde at birth indicates internal processing."
             )
             reading += f"• **{planet} Retrograde**: {retro_interp}\n\n"
@@ -916,7 +2492,7 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
             aspect_key1 = f"{planet1}_{planet2}"
             aspect_key2 = f"{planet2}_{planet1}"
             
-            aspect_interps = horoscope_db.get("natal_chart", {}).get("aspect_interpretations", {})
+            aspect_interps = horoscope_db.natal_chart().get("aspect_interpretations", {})
             
             # Try first key order
             detailed_interp = aspect_interps.get(aspect_key1, {}).get(aspect_type)
@@ -945,7 +2521,7 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
         
         for pattern in patterns:
             pattern_type = pattern["type"]
-            pattern_info = horoscope_db.get("natal_chart", {}).get("chart_patterns", {}).get(pattern_type, {})
+            pattern_info = horoscope_db.natal_chart().get("chart_patterns", {}).get(pattern_type, {})
             
             description = pattern_info.get("description", "")
             interpretation = pattern_info.get("interpretation", "")
@@ -978,7 +2554,7 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
         percentage = data["percentage"]
         level = data["level"]
         
-        element_info = horoscope_db.get("natal_chart", {}).get("elements", {}).get(element, {})
+        element_info = horoscope_db.natal_chart().get("elements", {}).get(element, {})
         keywords = element_info.get("keywords", "")
         interp = element_info.get(level, "This element influences your nature.")
         
@@ -995,7 +2571,7 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
         percentage = data["percentage"]
         level = data["level"]
         
-        mod_info = horoscope_db.get("natal_chart", {}).get("modalities", {}).get(modality, {})
+        mod_info = horoscope_db.natal_chart().get("modalities", {}).get(modality, {})
         keywords = mod_info.get("keywords", "")
         interp = mod_info.get(level, "This modality influences your approach.")
         
@@ -1008,14 +2584,14 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
     reading += f"\n**Chart Ruler - Your Dominant Energy:**\n\n"
     reading += f"**{dominant_planet}** dominates your chart (influence score: {score})\n"
     
-    dominant_interp = horoscope_db.get("natal_chart", {}).get("dominant_planet", {}).get(
+    dominant_interp = horoscope_db.natal_chart().get("dominant_planet", {}).get(
         dominant_planet, f"{dominant_planet} energy shapes your life significantly."
     )
     reading += f"{dominant_interp}\n\n"
     
     # PLANETARY HOUR (current time)
     current_hour_planet = get_planetary_hour(datetime.now())
-    hour_interp = horoscope_db.get("natal_chart", {}).get("planetary_hours", {}).get(
+    hour_interp = horoscope_db.natal_chart().get("planetary_hours", {}).get(
         current_hour_planet, "This planetary hour influences current activities."
     )
     
@@ -1028,77 +2604,116 @@ def generate_natal_chart_reading(natal_positions, house_data, horoscope_db):
     return reading
 
 
+# Aspects that make up chart patterns: name -> (angle, orb)
+PATTERN_ASPECTS = {
+    "opposition": (180, 8),
+    "trine": (120, 8),
+    "square": (90, 8),
+    "sextile": (60, 6),
+    "quincunx": (150, 3)
+}
+
+
+class AspectGraph:
+    """
+    Aspects between the bodies of one chart as a graph
+    Each body has one neighbour bitset (a Python int, bit n = body n) per aspect
+    type, built once from the separation matrix; pattern searches then walk
+    intersections of these bitsets instead of re-testing angles.
+    """
+    
+    def __init__(self, longitudes, aspects=PATTERN_ASPECTS):
+        separation = angular_separation_matrix(longitudes, longitudes)
+        self.size = len(longitudes)
+        self.neighbours = {}
+        
+        for name, (angle, orb) in aspects.items():
+            adjacent = np.abs(separation - angle) <= orb
+            np.fill_diagonal(adjacent, False)
+            packed = np.packbits(adjacent, axis=1, bitorder="little")
+            self.neighbours[name] = [int.from_bytes(row.tobytes(), "little") for row in packed]
+    
+    def adjacent(self, aspect, node, above=None):
+        """Bitset of bodies in aspect with node, optionally only those with a higher index"""
+        bits = self.neighbours[aspect][node]
+        return bits if above is None else bits >> (above + 1) << (above + 1)
+    
+    @staticmethod
+    def members(bits):
+        """Indexes of the set bits, in ascending order"""
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+    
+    def triangles(self, aspect):
+        """Every i < j < k with all three pairs in aspect, in index order"""
+        for i in range(self.size):
+            for j in self.members(self.adjacent(aspect, i, above=i)):
+                for k in self.members(self.adjacent(aspect, i, above=j) & self.neighbours[aspect][j]):
+                    yield i, j, k
+    
+    def apex_patterns(self, base_aspect, apex_aspect):
+        """Every base pair i < j in base_aspect plus each apex in apex_aspect to both, in index order"""
+        for i in range(self.size):
+            for j in self.members(self.adjacent(base_aspect, i, above=i)):
+                for apex in self.members(self.neighbours[apex_aspect][i] & self.neighbours[apex_aspect][j]):
+                    yield i, j, apex
+    
+    def crosses(self, axis_aspect="opposition", side_aspect="square"):
+        """
+        Every (a, b, c, d) with a-b and c-d on axis_aspect, a-c and b-d on side_aspect
+        Each set of four is reported once, as its lexicographically smallest ordering
+        """
+        for a in range(self.size):
+            for b in self.members(self.adjacent(axis_aspect, a, above=a)):
+                for c in self.members(self.adjacent(side_aspect, a, above=a)):
+                    for d in self.members(self.adjacent(side_aspect, b, above=a) & self.neighbours[axis_aspect][c]):
+                        # With c and d swapped it is the same cross; keep the smaller ordering
+                        swapped = (self.neighbours[side_aspect][a] >> d & 1) and (self.neighbours[side_aspect][b] >> c & 1)
+                        if c < d or not swapped:
+                            yield a, b, c, d
+
+
 def detect_chart_patterns(natal_positions):
     """
     Detect special chart patterns (Grand Trine, Grand Cross, T-Square, Stellium, Yod, Kite)
     """
     patterns = []
     planet_list = list(natal_positions.keys())
-    
-    # Helper to find planets in aspect
-    def planets_in_aspect(planet1, planet2, target_angle, orb):
-        long1 = natal_positions[planet1]["longitude"]
-        long2 = natal_positions[planet2]["longitude"]
-        angle = calculate_aspect_angle(long1, long2)
-        return abs(angle - target_angle) <= orb
+    graph = AspectGraph([natal_positions[p]["longitude"] for p in planet_list])
     
     # GRAND TRINE - 3 planets all trine each other (120° apart)
-    for i, p1 in enumerate(planet_list):
-        for j, p2 in enumerate(planet_list[i+1:], i+1):
-            for k, p3 in enumerate(planet_list[j+1:], j+1):
-                if (planets_in_aspect(p1, p2, 120, 8) and
-                    planets_in_aspect(p2, p3, 120, 8) and
-                    planets_in_aspect(p1, p3, 120, 8)):
-                    
-                    # Determine element
-                    signs = [natal_positions[p]["sign"] for p in [p1, p2, p3]]
-                    elements = [get_element(s) for s in signs]
-                    element = max(set(elements), key=elements.count)
-                    
-                    patterns.append({
-                        "type": "grand_trine",
-                        "planets": [p1, p2, p3],
-                        "element": element
-                    })
+    for i, j, k in graph.triangles("trine"):
+        p1, p2, p3 = planet_list[i], planet_list[j], planet_list[k]
+        
+        # Determine element
+        signs = [natal_positions[p]["sign"] for p in [p1, p2, p3]]
+        elements = [get_element(s) for s in signs]
+        element = max(set(elements), key=elements.count)
+        
+        patterns.append({
+            "type": "grand_trine",
+            "planets": [p1, p2, p3],
+            "element": element
+        })
     
     # GRAND CROSS - 4 planets, 2 oppositions squared to each other
-    for i, p1 in enumerate(planet_list):
-        for j, p2 in enumerate(planet_list[i+1:], i+1):
-            if planets_in_aspect(p1, p2, 180, 8):  # Opposition
-                for k, p3 in enumerate(planet_list):
-                    if p3 not in [p1, p2] and planets_in_aspect(p1, p3, 90, 8):
-                        for l, p4 in enumerate(planet_list):
-                            if (p4 not in [p1, p2, p3] and
-                                planets_in_aspect(p2, p4, 90, 8) and
-                                planets_in_aspect(p3, p4, 180, 8)):
-                                
-                                pattern_planets = sorted([p1, p2, p3, p4])
-                                if not any(p["type"] == "grand_cross" and sorted(p["planets"]) == pattern_planets for p in patterns):
-                                    patterns.append({
-                                        "type": "grand_cross",
-                                        "planets": [p1, p2, p3, p4]
-                                    })
+    for a, b, c, d in graph.crosses("opposition", "square"):
+        patterns.append({
+            "type": "grand_cross",
+            "planets": [planet_list[a], planet_list[b], planet_list[c], planet_list[d]]
+        })
     
     # T-SQUARE - 2 planets oppose, both square a 3rd (apex)
-    for i, p1 in enumerate(planet_list):
-        for j, p2 in enumerate(planet_list[i+1:], i+1):
-            if planets_in_aspect(p1, p2, 180, 8):  # Opposition
-                for apex in planet_list:
-                    if apex not in [p1, p2]:
-                        if (planets_in_aspect(p1, apex, 90, 8) and
-                            planets_in_aspect(p2, apex, 90, 8)):
-                            
-                            pattern_planets = sorted([p1, p2, apex])
-                            if not any(p["type"] == "t_square" and sorted(p["planets"]) == pattern_planets for p in patterns):
-                                patterns.append({
-                                    "type": "t_square",
-                                    "planets": [p1, p2],
-                                    "apex": apex
-                                })
+    for i, j, apex in graph.apex_patterns("opposition", "square"):
+        patterns.append({
+            "type": "t_square",
+            "planets": [planet_list[i], planet_list[j]],
+            "apex": planet_list[apex]
+        })
     
     # STELLIUM - 3+ planets in same sign or house
-    from collections import Counter
-    
     signs_count = Counter([natal_positions[p]["sign"] for p in planet_list])
     for sign, count in signs_count.items():
         if count >= 3:
@@ -1110,21 +2725,12 @@ def detect_chart_patterns(natal_positions):
             })
     
     # YOD - 2 planets sextile, both quincunx (150°) a 3rd (apex)
-    for i, p1 in enumerate(planet_list):
-        for j, p2 in enumerate(planet_list[i+1:], i+1):
-            if planets_in_aspect(p1, p2, 60, 6):  # Sextile
-                for apex in planet_list:
-                    if apex not in [p1, p2]:
-                        if (planets_in_aspect(p1, apex, 150, 3) and
-                            planets_in_aspect(p2, apex, 150, 3)):
-                            
-                            pattern_planets = sorted([p1, p2, apex])
-                            if not any(p["type"] == "yod" and sorted(p["planets"]) == pattern_planets for p in patterns):
-                                patterns.append({
-                                    "type": "yod",
-                                    "planets": [p1, p2],
-                                    "apex": apex
-                                })
+    for i, j, apex in graph.apex_patterns("sextile", "quincunx"):
+        patterns.append({
+            "type": "yod",
+            "planets": [planet_list[i], planet_list[j]],
+            "apex": planet_list[apex]
+        })
     
     return patterns
 
@@ -1220,8 +2826,8 @@ def calculate_dominant_planet(natal_positions, house_data):
     
     # Points for angular houses (1st, 4th, 7th, 10th)
     angular_houses = [1, 4, 7, 10]
-    for planet, pos_data in natal_positions.items():
-        house_num = find_house_for_planet(pos_data["longitude"], house_data["cusps"])
+    natal_houses = find_houses([p["longitude"] for p in natal_positions.values()], house_data["cusps"])
+    for planet, house_num in zip(natal_positions, natal_houses):
         if house_num in angular_houses:
             scores[planet] += 3
     
@@ -1279,36 +2885,29 @@ def calculate_transits_to_natal(current_positions, natal_positions, house_data,
     """
     Calculate current transiting planets' aspects to natal chart
     """
-    transits = []
+    current_list = list(current_positions.keys())
+    natal_list = list(natal_positions.keys())
     
-    for current_planet, current_data in current_positions.items():
-        for natal_planet, natal_data in natal_positions.items():
-            # Calculate aspect between current and natal position
-            angle = calculate_aspect_angle(current_data["longitude"], natal_data["longitude"])
-            
-            # Check for major aspects
-            aspect_types = [
-                ("conjunction", 0, 8),
-                ("opposition", 180, 8),
-                ("trine", 120, 8),
-                ("square", 90, 8),
-                ("sextile", 60, 6)
-            ]
-            
-            for aspect_name, target_angle, orb in aspect_types:
-                if abs(angle - target_angle) <= orb:
-                    # Find which natal house is being transited
-                    natal_house = find_house_for_planet(natal_data["longitude"], house_data["cusps"])
-                    
-                    transits.append({
-                        "transiting_planet": current_planet,
-                        "natal_planet": natal_planet,
-                        "aspect": aspect_name,
-                        "angle": angle,
-                        "natal_house": natal_house,
-                        "orb": abs(angle - target_angle)
-                    })
-                    break
+    hits = find_aspects(
+        [current_positions[p]["longitude"] for p in current_list],
+        [natal_positions[p]["longitude"] for p in natal_list]
+    )
+    
+    transits = []
+    for hit in hits:
+        natal_planet = natal_list[hit["j"]]
+        
+        # Find which natal house is being transited
+        natal_house = find_house_for_planet(natal_positions[natal_planet]["longitude"], house_data["cusps"])
+        
+        transits.append({
+            "transiting_planet": current_list[hit["i"]],
+            "natal_planet": natal_planet,
+            "aspect": ASPECT_TYPES[hit["aspect"]][0],
+            "angle": float(hit["angle"]),
+            "natal_house": natal_house,
+            "orb": float(hit["orb"])
+        })
     
     # Sort by orb (tighter aspects first)
     transits.sort(key=lambda x: x["orb"])
@@ -1345,74 +2944,570 @@ def calculate_lunar_phase_at_birth(natal_positions):
         return "balsamic_moon", phase_angle
 
 
-def calculate_solar_return(natal_year, natal_month, natal_day, current_year, natal_sun_longitude, lat, lon, timezone_str="UTC"):
+# Exact lunations and eclipses (shipped with src/ephe for LUNATION_CALENDAR_YEARS;
+# rebuild with --build-lunation-calendar). Other spans are cached in CACHE_DIR.
+LUNATION_CALENDAR_PATH = os.path.join(ephe_path, "lunations_eclipses_1900_2100.npz")
+LUNATION_CALENDAR_YEARS = (1900, 2100)
+SYNODIC_MONTH_DAYS = 29.530588853
+
+# Quarter lunations in order of Moon-Sun elongation (0°, 90°, 180°, 270°)
+LUNATION_PHASES = ["new_moon", "first_quarter", "full_moon", "last_quarter"]
+
+# Eclipse types by Swiss Ephemeris return flag, most specific first
+ECLIPSE_TYPES = [
+    (swe.ECL_ANNULAR_TOTAL, "hybrid"),
+    (swe.ECL_TOTAL, "total"),
+    (swe.ECL_ANNULAR, "annular"),
+    (swe.ECL_PARTIAL, "partial"),
+    (swe.ECL_PENUMBRAL, "penumbral")
+]
+
+# longitude is the Moon's for lunations and lunar eclipses, the Sun's for solar eclipses
+LUNATION_DTYPE = np.dtype([
+    ("jd", "f8"),
+    ("phase", "i1"),
+    ("longitude", "f8")
+])
+
+ECLIPSE_DTYPE = np.dtype([
+    ("jd", "f8"),
+    ("lunar", "?"),
+    ("flags", "i4"),
+    ("longitude", "f8")
+])
+
+
+def lunation_calendar_path(start_year, end_year):
+    if (start_year, end_year) == LUNATION_CALENDAR_YEARS:
+        return LUNATION_CALENDAR_PATH
+    return os.path.join(CACHE_DIR, f"lunations_eclipses_{start_year}_{end_year}.npz")
+
+
+def solve_lunations(jd_guesses, phases, engine=ephemeris_engine, max_iterations=12):
     """
-    Calculate Solar Return chart - when Sun returns to exact natal position
+    Newton iteration for the instants the Moon-Sun elongation reaches each phase's angle
+    Each guess should be within a few days of its answer; all are solved together
     """
-    # Start searching around birthday
-    search_date = datetime(current_year, natal_month, natal_day, 12, 0, 0)
-    tz = pytz.timezone(timezone_str)
-    search_date = tz.localize(search_date)
+    jds = np.array(jd_guesses, dtype=np.float64, ndmin=1)
+    targets = np.asarray(phases, dtype=np.float64) * 90.0
+    active = np.ones(len(jds), dtype=bool)
+    
+    for _ in range(max_iterations):
+        rows = engine.positions(jds[active], [swe.SUN, swe.MOON])
+        elongation = rows["longitude"][:, 1] - rows["longitude"][:, 0]
+        rate = rows["speed"][:, 1] - rows["speed"][:, 0]
+        step = wrap_angle(elongation - targets[active]) / rate
+        jds[active] -= step
+        
+        active[active] = np.abs(step) > ROOT_TOLERANCE_DAYS
+        if not active.any():
+            break
     
-    # Find exact moment Sun returns to natal position
-    # Search +/- 2 days around birthday
-    best_match = None
-    smallest_diff = 360
+    return jds
+
+
+def eclipse_type(flags):
+    """Name of the eclipse type carried in a Swiss Ephemeris return flag"""
+    for flag, name in ECLIPSE_TYPES:
+        if flags & flag:
+            return name
+    return "unknown"
+
+
+class LunationCalendar:
+    """
+    Exact new, first quarter, full and last quarter moons plus solar and lunar
+    eclipses over a span of years, each table sorted by jd so lookups are binary searches
+    """
     
-    for hour_offset in range(-48, 49):  # Search 48 hours before and after
-        test_date = search_date + timedelta(hours=hour_offset)
-        utc_date = test_date.astimezone(pytz.UTC)
+    def __init__(self, lunations, eclipses, jd_start, jd_end):
+        self.lunations = lunations
+        self.eclipses = eclipses
+        self.jd_start = float(jd_start)
+        self.jd_end = float(jd_end)
+    
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["lunations"], data["eclipses"], data["jd_start"], data["jd_end"])
+    
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, lunations=self.lunations, eclipses=self.eclipses,
+                            jd_start=self.jd_start, jd_end=self.jd_end)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def build(cls, start_year=LUNATION_CALENDAR_YEARS[0], end_year=LUNATION_CALENDAR_YEARS[1]):
+        """Solve every quarter lunation and search every eclipse from start_year to end_year"""
+        jd_start = swe.julday(start_year, 1, 1, 0.0)
+        jd_end = swe.julday(end_year, 1, 1, 0.0)
+        
+        # Bypass the LRU cache - every instant is visited once
+        engine = EphemerisEngine()
         
-        jd = swe.julday(utc_date.year, utc_date.month, utc_date.day,
-                       utc_date.hour + utc_date.minute/60.0)
+        # Mean quarter-lunation guesses from the last new moon before the span
+        sun, moon = engine.positions([jd_start], [swe.SUN, swe.MOON])[0]
+        first_new_moon = jd_start - ((moon["longitude"] - sun["longitude"]) % 360.0) / 360.0 * SYNODIC_MONTH_DAYS
+        count = int((jd_end - first_new_moon) / SYNODIC_MONTH_DAYS * 4) + 2
+        quarters = np.arange(count)
+        jds = solve_lunations(first_new_moon + quarters * SYNODIC_MONTH_DAYS / 4, quarters % 4, engine)
         
-        sun_result, _ = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        sun_long = sun_result[0]
+        keep = (jds >= jd_start) & (jds < jd_end)
+        lunations = np.zeros(int(keep.sum()), dtype=LUNATION_DTYPE)
+        lunations["jd"] = jds[keep]
+        lunations["phase"] = (quarters % 4)[keep]
+        lunations["longitude"] = engine.positions(lunations["jd"], [swe.MOON])[:, 0]["longitude"]
+        
+        eclipses = []
+        for lunar in (False, True):
+            jd = jd_start
+            while True:
+                if lunar:
+                    flags, times = swe.lun_eclipse_when(jd, swe.FLG_SWIEPH)
+                else:
+                    flags, times = swe.sol_eclipse_when_glob(jd, swe.FLG_SWIEPH)
+                maximum = times[0]
+                if maximum >= jd_end:
+                    break
+                longitude = engine.calc(maximum, swe.MOON if lunar else swe.SUN)[0]
+                eclipses.append((maximum, lunar, flags, longitude))
+                jd = maximum + 1.0
         
-        # Check how close to natal Sun position
-        diff = abs(sun_long - natal_sun_longitude)
-        if diff > 180:
-            diff = 360 - diff
+        eclipses = np.array(eclipses, dtype=ECLIPSE_DTYPE)
+        eclipses = eclipses[np.argsort(eclipses["jd"], kind="stable")]
+        return cls(lunations, eclipses, jd_start, jd_end)
+    
+    def covers(self, jd):
+        return self.jd_start <= jd <= self.jd_end
+    
+    @staticmethod
+    def lunation_event(row):
+        jd = float(row["jd"])
+        return {
+            "jd": jd,
+            "date": jd_to_datetime(jd),
+            "phase": LUNATION_PHASES[int(row["phase"])],
+            "longitude": float(row["longitude"]),
+            "sign": get_zodiac_sign(row["longitude"]),
+            "degrees_in_sign": float(row["longitude"]) % 30
+        }
+    
+    @staticmethod
+    def eclipse_event(row):
+        jd = float(row["jd"])
+        return {
+            "jd": jd,
+            "date": jd_to_datetime(jd),
+            "eclipse": "lunar" if row["lunar"] else "solar",
+            "type": eclipse_type(int(row["flags"])),
+            "longitude": float(row["longitude"]),
+            "sign": get_zodiac_sign(row["longitude"]),
+            "degrees_in_sign": float(row["longitude"]) % 30
+        }
+    
+    def lunations_between(self, jd_low, jd_high, phases=LUNATION_PHASES):
+        """Lunations with jd_low <= jd < jd_high, optionally only some phases"""
+        low, high = np.searchsorted(self.lunations["jd"], [jd_low, jd_high], side="left")
+        wanted = [LUNATION_PHASES.index(phase) for phase in phases]
+        return [self.lunation_event(row) for row in self.lunations[low:high] if row["phase"] in wanted]
+    
+    def lunations_in_month(self, year, month, timezone_str="UTC"):
+        """Lunations falling in a calendar month of local time"""
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return self.lunations_between(local_datetime_to_jd(year, month, 1, 0, 0, 0, timezone_str),
+                                      local_datetime_to_jd(next_year, next_month, 1, 0, 0, 0, timezone_str))
+    
+    def previous_lunation(self, jd, phases=("new_moon", "full_moon")):
+        """
+        Last lunation of the given phases at or before jd
+        The default is the prenatal syzygy (the new or full moon before birth)
+        """
+        wanted = [LUNATION_PHASES.index(phase) for phase in phases]
+        k = int(np.searchsorted(self.lunations["jd"], jd, side="right"))
+        for row in self.lunations[max(k - 4, 0):k][::-1]:
+            if row["phase"] in wanted:
+                return self.lunation_event(row)
+        return None
+    
+    def next_lunation(self, jd, phases=LUNATION_PHASES):
+        wanted = [LUNATION_PHASES.index(phase) for phase in phases]
+        k = int(np.searchsorted(self.lunations["jd"], jd, side="right"))
+        for row in self.lunations[k:k + 4]:
+            if row["phase"] in wanted:
+                return self.lunation_event(row)
+        return None
+    
+    def eclipse_rows(self, lunar):
+        return self.eclipses if lunar is None else self.eclipses[self.eclipses["lunar"] == lunar]
+    
+    def previous_eclipse(self, jd, lunar=None):
+        """Last eclipse at or before jd (the prenatal eclipse for a birth jd); lunar=True/False filters"""
+        rows = self.eclipse_rows(lunar)
+        k = int(np.searchsorted(rows["jd"], jd, side="right"))
+        return self.eclipse_event(rows[k - 1]) if k > 0 else None
+    
+    def next_eclipse(self, jd, lunar=None):
+        rows = self.eclipse_rows(lunar)
+        k = int(np.searchsorted(rows["jd"], jd, side="right"))
+        return self.eclipse_event(rows[k]) if k < len(rows) else None
+
+
+lunation_calendars = {}
+
+
+def build_lunation_calendar(start_year=LUNATION_CALENDAR_YEARS[0], end_year=LUNATION_CALENDAR_YEARS[1]):
+    """Build step: solve every lunation and eclipse from start_year to end_year and save as .npz"""
+    path = lunation_calendar_path(start_year, end_year)
+    print(f"⏳ Finding lunations and eclipses {start_year}-{end_year}...", file=sys.stderr)
+    calendar = LunationCalendar.build(start_year, end_year)
+    calendar.save(path)
+    print(f"✓ {len(calendar.lunations)} lunations and {len(calendar.eclipses)} eclipses written to {path}", file=sys.stderr)
+    lunation_calendars[(start_year, end_year)] = calendar
+    return calendar
+
+
+def get_lunation_calendar(start_year=LUNATION_CALENDAR_YEARS[0], end_year=LUNATION_CALENDAR_YEARS[1], build=True):
+    """
+    Lazily load the lunation/eclipse calendar for a span, building and caching it on disk on first use
+    A calendar that cannot be saved is still kept in memory for this process
+    Returns None when it is missing and build is False, or cannot be built
+    """
+    span = (start_year, end_year)
+    if span in lunation_calendars:
+        return lunation_calendars[span]
+    
+    path = lunation_calendar_path(start_year, end_year)
+    calendar = None
+    if os.path.exists(path):
+        try:
+            calendar = LunationCalendar.load(path)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠ Could not load {path}: {e}", file=sys.stderr)
+    
+    if calendar is None:
+        if not build:
+            return None
+        print(f"⏳ Finding lunations and eclipses {start_year}-{end_year} (first run only)...", file=sys.stderr)
+        try:
+            calendar = LunationCalendar.build(start_year, end_year)
+        except swe.Error as e:
+            print(f"⚠ Could not build the lunation calendar: {e}", file=sys.stderr)
+            return None
+        try:
+            calendar.save(path)
+        except OSError as e:
+            print(f"⚠ Could not save the lunation calendar to {path}: {e}", file=sys.stderr)
+    
+    lunation_calendars[span] = calendar
+    return calendar
+
+
+def solve_direct_longitude(body, target_longitude, jd_guesses, max_iterations=12):
+    """
+    Newton iteration for the instants a never-retrograde body (Sun, Moon) reaches a longitude
+    Uses the body's speed from FLG_SPEED as the derivative; each guess should be
+    within a few days of its answer. Solves every guess together in one array;
+    guesses that have not converged after max_iterations come back as NaN.
+    """
+    jds = np.array(jd_guesses, dtype=np.float64, ndmin=1)
+    active = np.ones(len(jds), dtype=bool)
+    
+    for _ in range(max_iterations):
+        rows = ephemeris_engine.positions(jds[active], [body])[:, 0]
+        step = wrap_angle(rows["longitude"] - target_longitude) / rows["speed"]
+        jds[active] -= step
         
-        if diff < smallest_diff:
-            smallest_diff = diff
-            best_match = test_date
+        still_moving = np.abs(step) >= ROOT_TOLERANCE_DAYS
+        active[active] = still_moving
+        if not active.any():
+            break
+    
+    jds[active] = np.nan
+    return jds
+
+
+def calculate_solar_return(natal_year, natal_month, natal_day, current_year, natal_sun_longitude, lat, lon, timezone_str="UTC",
+                           house_system=DEFAULT_HOUSE_SYSTEM):
+    """
+    Calculate Solar Return chart - when Sun returns to exact natal position
+    """
+    # Start from noon UT on the birthday and solve for the exact return
+    guess = swe.julday(current_year, natal_month, natal_day, 12.0)
+    return_jd = solve_direct_longitude(swe.SUN, natal_sun_longitude, [guess])[0]
+    
+    if np.isnan(return_jd):
+        return None, None, None
     
     # Calculate full chart for Solar Return moment
-    if best_match:
-        return_positions = calculate_planetary_positions(
-            best_match.year, best_match.month, best_match.day,
-            best_match.hour, best_match.minute, 0, timezone_str
-        )
-        return_houses = calculate_houses(
-            best_match.year, best_match.month, best_match.day,
-            best_match.hour, best_match.minute, 0,
-            lat, lon, timezone_str
-        )
-        return best_match, return_positions, return_houses
+    return_positions = ephemeris_engine.chart(return_jd)
+    return_houses = calculate_houses_for_jd(return_jd, lat, lon, house_system)
+    
+    return jd_to_datetime(return_jd, timezone_str), return_positions, return_houses
+
+
+def calculate_solar_returns(natal_sun_longitude, natal_month, natal_day, start_year, end_year):
+    """
+    Exact Solar Return instants for every year from start_year to end_year (inclusive)
+    Returns an array of (year, jd) records, solved together in one pass;
+    years whose solve did not converge are left out
+    """
+    years = np.arange(start_year, end_year + 1)
+    guesses = [swe.julday(int(year), natal_month, natal_day, 12.0) for year in years]
+    
+    returns = np.empty(len(years), dtype=[("year", "i4"), ("jd", "f8")])
+    returns["year"] = years
+    returns["jd"] = solve_direct_longitude(swe.SUN, natal_sun_longitude, guesses)
+    return returns[~np.isnan(returns["jd"])]
+
+
+# Sampling step (days) when bracketing returns; the Moon needs daily samples
+RETURN_SAMPLE_STEP_DAYS = {"Moon": 1.0}
+DEFAULT_RETURN_SAMPLE_STEP_DAYS = 5.0
+
+# Typical time between geocentric returns, in days; passes closer together
+# than a quarter of this belong to the same (retrograde) return
+RETURN_CYCLE_DAYS = {
+    "Sun": 365.25, "Moon": 27.32, "Mercury": 365.25, "Venus": 365.25, "Mars": 687.0,
+    "Jupiter": 4332.6, "Saturn": 10759.2, "Uranus": 30688.5, "Neptune": 60182.0, "Pluto": 90560.0
+}
+
+
+def group_passes(jds, cycle_gap):
+    """
+    Number sorted hit times into cycles: a gap longer than cycle_gap starts a new one
+    Returns [(cycle, pass, passes in that cycle)] for each jd, counting from 1
+    """
+    labels = []
+    cycle = 0
+    previous_jd = None
+    for jd in jds:
+        if previous_jd is None or jd - previous_jd > cycle_gap:
+            cycle += 1
+            pass_number = 0
+        pass_number += 1
+        previous_jd = jd
+        labels.append((cycle, pass_number))
+    
+    passes = Counter(cycle for cycle, _ in labels)
+    return [(cycle, pass_number, passes[cycle]) for cycle, pass_number in labels]
+
+
+def find_returns(planet, natal_longitude, jd_start, jd_end, lat=None, lon=None,
+                 house_system=DEFAULT_HOUSE_SYSTEM, with_charts=False):
+    """
+    Every return of planet to natal_longitude between jd_start and jd_end (UT)
+    Samples the planet once per step, brackets each crossing and refines it to
+    ~0.1 s, so retrograde planets report each pass of a multiple return.
+    Returns [{planet, jd, date, return, pass, retrograde}] in time order; return
+    counts cycles from 1 and pass counts exact hits within a cycle. With
+    with_charts, each also gets "positions" and (given lat/lon) "houses".
+    """
+    body = PLANETS[planet]
+    step = RETURN_SAMPLE_STEP_DAYS.get(planet, DEFAULT_RETURN_SAMPLE_STEP_DAYS)
+    jds = np.append(np.arange(jd_start, jd_end, step), jd_end)
+    samples = approximate_positions(jds, [body])[:, 0]
+    
+    evaluate = longitude_offset_function(body, natal_longitude)
+    hits = find_crossings(evaluate, jds, wrap_angle(samples["longitude"] - natal_longitude), samples["speed"])
+    
+    returns = []
+    jds = sorted(float(hit) for hit in hits)
+    for jd, (cycle, pass_number, _) in zip(jds, group_passes(jds, RETURN_CYCLE_DAYS.get(planet, 365.25) / 4)):
+        event = {
+            "planet": planet,
+            "jd": jd,
+            "date": jd_to_datetime(jd),
+            "return": cycle,
+            "pass": pass_number,
+            "retrograde": ephemeris_engine.calc(jd, body)[3] < 0
+        }
+        if with_charts:
+            event["positions"] = ephemeris_engine.chart(jd)
+            if lat is not None and lon is not None:
+                event["houses"] = calculate_houses_for_jd(jd, lat, lon, house_system)
+        returns.append(event)
+    
+    return returns
+
+
+def calculate_lunar_returns(natal_moon_longitude, jd_start, years=1, lat=None, lon=None,
+                            house_system=DEFAULT_HOUSE_SYSTEM, with_charts=True):
+    """Lunar return calendar for the given number of years from jd_start"""
+    return find_returns("Moon", natal_moon_longitude, jd_start, jd_start + years * 365.25, lat, lon,
+                        house_system, with_charts)
+
+
+# Secondary progressions: one ephemeris day for each year of life
+PROGRESSION_YEAR_DAYS = 365.25
+
+# Bodies followed by the progression timeline (the outer planets barely move in 100 days)
+PROGRESSED_PLANETS = ["Sun", "Moon", "Mercury", "Venus", "Mars"]
+
+# Progressed-to-natal aspects reported by the timeline: (name, angle)
+PROGRESSION_ASPECTS = [
+    ("conjunction", 0),
+    ("sextile", 60),
+    ("square", 90),
+    ("trine", 120),
+    ("opposition", 180)
+]
+
+# Lunar phases in 45° steps of Moon-Sun elongation, as in calculate_lunar_phase_at_birth
+LUNAR_PHASE_NAMES = ["new_moon", "crescent_moon", "first_quarter", "gibbous_moon",
+                     "full_moon", "disseminating_moon", "last_quarter", "balsamic_moon"]
+
+
+def progressed_jd(natal_jd, jd):
+    """Progressed-chart instant for the real-life instant jd"""
+    return natal_jd + (np.asarray(jd, dtype=np.float64) - natal_jd) / PROGRESSION_YEAR_DAYS
+
+
+def progression_life_jd(natal_jd, progressed):
+    """Real-life instant at which the progressed chart reaches the instant progressed"""
+    return natal_jd + (np.asarray(progressed, dtype=np.float64) - natal_jd) * PROGRESSION_YEAR_DAYS
+
+
+def calculate_progressions(natal_year, natal_month, natal_day, natal_hour, natal_minute, 
+                          current_date, timezone_str="UTC"):
+    """
+    Calculate secondary progressions - 1 day = 1 year
+    current_date is a datetime (naive means system local time)
+    """
+    natal_jd = local_datetime_to_jd(natal_year, natal_month, natal_day, natal_hour, natal_minute, 0, timezone_str)
+    current_jd = datetime_to_jd(current_date)
+    age_years = (current_jd - natal_jd) / PROGRESSION_YEAR_DAYS
+    
+    # Progressed instant = birth instant + age in days
+    progressed = float(progressed_jd(natal_jd, current_jd))
+    progressed_positions = ephemeris_engine.chart(progressed)
     
-    return None, None, None
+    return jd_to_datetime(progressed, timezone_str), progressed_positions, age_years
+
+
+def calculate_progression_timeline(natal_jd, natal_positions=None, years=100, planets=PROGRESSED_PLANETS,
+                                   aspects=PROGRESSION_ASPECTS):
+    """
+    Secondary progressions over a lifetime in one pass
+    Progressed positions are computed for every month of life from birth to
+    `years` in a single batched ephemeris call. Those monthly samples bracket
+    the events, which are then refined to the exact progressed instant and
+    mapped back to real-life dates:
+      ingresses    - a progressed planet changes sign
+      lunar_phases - the progressed Moon-Sun elongation enters a new 45° phase
+      aspects      - a progressed planet perfects an aspect to a natal planet
+    Returns {"jd", "age", "positions", "ingresses", "lunar_phases", "aspects"};
+    positions is a POSITION_DTYPE array (months, planets); events are sorted by date.
+    """
+    if natal_positions is None:
+        natal_positions = ephemeris_engine.chart(natal_jd)
+    
+    months = np.arange(int(years * 12) + 1)
+    life_jds = natal_jd + months * PROGRESSION_YEAR_DAYS / 12.0
+    progressed_jds = progressed_jd(natal_jd, life_jds)
+    samples = ephemeris_engine.positions(progressed_jds, [PLANETS[p] for p in planets])
+    
+    def event_fields(jd):
+        life_jd = float(progression_life_jd(natal_jd, jd))
+        return {"jd": life_jd, "date": jd_to_datetime(life_jd), "age": (life_jd - natal_jd) / PROGRESSION_YEAR_DAYS}
+    
+    ingresses = []
+    natal_aspects = []
+    for column, planet in enumerate(planets):
+        body = PLANETS[planet]
+        longitudes = samples["longitude"][:, column]
+        speeds = samples["speed"][:, column]
+        cycle_gap = RETURN_CYCLE_DAYS.get(planet, 365.25) / 4
+        if np.isnan(longitudes).any():
+            continue
+        
+        # Sign ingresses - only the boundaries the samples actually cross or touch
+        signs = samples["sign"][:, column].astype(np.int64)
+        for boundary in np.unique(np.concatenate([signs, signs + 1]) % 12) * 30.0:
+            evaluate = longitude_offset_function(body, boundary)
+            for jd in find_crossings(evaluate, progressed_jds, wrap_angle(longitudes - boundary), speeds):
+                speed = ephemeris_engine.calc(jd, body)[3]
+                sign = int(boundary // 30) if speed >= 0 else int(boundary // 30 - 1) % 12
+                ingresses.append({**event_fields(jd), "planet": planet, "sign": ZODIAC_SIGNS[sign],
+                                  "retrograde": speed < 0})
+        
+        # Progressed-to-natal aspects
+        for natal_planet, natal_data in natal_positions.items():
+            for aspect_name, angle in aspects:
+                targets = [(natal_data["longitude"] + angle) % 360]
+                if angle not in (0, 180):
+                    targets.append((natal_data["longitude"] - angle) % 360)
+                
+                # Passes are counted per target point and per cycle, as for transits
+                for target in targets:
+                    evaluate = longitude_offset_function(body, target)
+                    hits = find_crossings(evaluate, progressed_jds, wrap_angle(longitudes - target), speeds)
+                    
+                    # A planet conjunct its own natal place at birth is not an event
+                    hits = sorted(float(hit) for hit in hits if hit > natal_jd + ROOT_TOLERANCE_DAYS)
+                    for jd, (_, pass_number, passes) in zip(hits, group_passes(hits, cycle_gap)):
+                        natal_aspects.append({**event_fields(jd), "progressed_planet": planet,
+                                              "natal_planet": natal_planet, "aspect": aspect_name,
+                                              "retrograde": ephemeris_engine.calc(jd, body)[3] < 0,
+                                              "pass": pass_number, "passes": passes})
+    
+    # Progressed lunation cycle: Moon-Sun elongation through each 45° phase boundary
+    lunar_phases = []
+    if "Sun" in planets and "Moon" in planets:
+        sun = samples[:, planets.index("Sun")]
+        moon = samples[:, planets.index("Moon")]
+        elongations = (moon["longitude"] - sun["longitude"]) % 360.0
+        rates = moon["speed"] - sun["speed"]
+        
+        for phase, boundary in enumerate(range(0, 360, 45)):
+            def evaluate(jd, boundary=boundary):
+                sun_result = ephemeris_engine.calc(jd, swe.SUN)
+                moon_result = ephemeris_engine.calc(jd, swe.MOON)
+                return float(wrap_angle(moon_result[0] - sun_result[0] - boundary)), moon_result[3] - sun_result[3]
+            
+            for jd in find_crossings(evaluate, progressed_jds, wrap_angle(elongations - boundary), rates):
+                lunar_phases.append({**event_fields(jd), "phase": LUNAR_PHASE_NAMES[phase]})
+    
+    by_date = lambda event: event["jd"]
+    return {
+        "jd": life_jds,
+        "age": months / 12.0,
+        "positions": samples,
+        "ingresses": sorted(ingresses, key=by_date),
+        "lunar_phases": sorted(lunar_phases, key=by_date),
+        "aspects": sorted(natal_aspects, key=by_date)
+    }
 
 
-def calculate_progressions(natal_year, natal_month, natal_day, natal_hour, natal_minute, 
-                          current_date, timezone_str="UTC"):
+def calculate_synastry_aspects(person1_positions, partner_charts):
     """
-    Calculate secondary progressions - 1 day = 1 year
+    Interaspects between one chart and any number of partner charts in a single array pass
+    Returns one list per partner, sorted by orb (closer orb = more important)
     """
-    # Calculate age
-    birth_date = datetime(natal_year, natal_month, natal_day)
-    age_years = (current_date - birth_date).days / 365.25
-    
-    # Progressed date = birth date + age in days
-    progressed_date = birth_date + timedelta(days=age_years)
+    p1_list = list(person1_positions.keys())
+    p2_list = list(partner_charts[0].keys()) if partner_charts else []
+    
+    partner_longitudes = np.array([
+        [chart[p]["longitude"] for p in p2_list] for chart in partner_charts
+    ], dtype=np.float64).reshape(len(partner_charts), len(p2_list))
+    
+    hits = find_aspects([person1_positions[p]["longitude"] for p in p1_list], partner_longitudes)
+    
+    results = [[] for _ in partner_charts]
+    for hit in hits:
+        results[hit["chart"]].append({
+            "person1_planet": p1_list[hit["i"]],
+            "person2_planet": p2_list[hit["j"]],
+            "aspect": ASPECT_TYPES[hit["aspect"]][0],
+            "angle": float(hit["angle"]),
+            "orb": float(hit["orb"])
+        })
     
-    # Calculate planetary positions for progressed date
-    progressed_positions = calculate_planetary_positions(
-        progressed_date.year, progressed_date.month, progressed_date.day,
-        natal_hour, natal_minute, 0, timezone_str
-    )
+    for interaspects in results:
+        interaspects.sort(key=lambda x: x["orb"])
     
-    return progressed_date, progressed_positions, age_years
+    return results
 
 
 def generate_synastry_reading(person1_positions, person2_positions, person1_sun_sign, person2_sun_sign, horoscope_db):
@@ -1427,33 +3522,7 @@ def generate_synastry_reading(person1_positions, person2_positions, person1_sun_
     reading += f"Beyond sun sign compatibility, here's how your complete charts interact:\n\n"
     
     # Find interaspects
-    interaspects = []
-    
-    for p1_planet, p1_data in person1_positions.items():
-        for p2_planet, p2_data in person2_positions.items():
-            angle = calculate_aspect_angle(p1_data["longitude"], p2_data["longitude"])
-            
-            aspect_types = [
-                ("conjunction", 0, 8),
-                ("opposition", 180, 8),
-                ("trine", 120, 8),
-                ("square", 90, 8),
-                ("sextile", 60, 6)
-            ]
-            
-            for aspect_name, target_angle, orb in aspect_types:
-                if abs(angle - target_angle) <= orb:
-                    interaspects.append({
-                        "person1_planet": p1_planet,
-                        "person2_planet": p2_planet,
-                        "aspect": aspect_name,
-                        "angle": angle,
-                        "orb": abs(angle - target_angle)
-                    })
-                    break
-    
-    # Sort by importance (closer orb = more important)
-    interaspects.sort(key=lambda x: x["orb"])
+    interaspects = calculate_synastry_aspects(person1_positions, [person2_positions])[0]
     
     # Key synastry aspects to highlight
     important_combos = [
@@ -1504,57 +3573,79 @@ def generate_synastry_reading(person1_positions, person2_positions, person1_sun_
     return reading
 
 
-def predict_upcoming_transits(current_date, natal_positions, house_data, months_ahead=6):
+# Aspects tracked by the transit event engine: (name, angle)
+TRANSIT_EVENT_ASPECTS = [
+    ("conjunction", 0),
+    ("opposition", 180),
+    ("trine", 120),
+    ("square", 90)
+]
+
+SLOW_PLANETS = ["Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+
+
+def predict_transit_events(natal_positions, jd_start, jd_end, transit_planets=SLOW_PLANETS,
+                           aspects=TRANSIT_EVENT_ASPECTS, step_days=5.0):
     """
-    Predict major transits coming in the next X months
+    Exact transit hits between jd_start and jd_end
+    Samples each transiting planet once every step_days, brackets sign changes of
+    (transit - natal - aspect angle) and refines each crossing to an exact instant,
+    so retrograde passes show up as separate hits. pass/passes number the hits
+    to one target point within one transit cycle. Returns events sorted by time.
     """
-    predictions = []
+    jds = np.append(np.arange(jd_start, jd_end, step_days), jd_end)
+    samples = approximate_positions(jds, [PLANETS[p] for p in transit_planets])
     
-    # Slow-moving planets to track (more significant transits)
-    slow_planets = ["Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+    events = []
     
-    # Check each day for next 6 months
-    for days_ahead in range(0, months_ahead * 30, 7):  # Check weekly
-        future_date = current_date + timedelta(days=days_ahead)
+    for column, transit_planet in enumerate(transit_planets):
+        body = PLANETS[transit_planet]
+        longitudes = samples["longitude"][:, column]
+        speeds = samples["speed"][:, column]
+        cycle_gap = RETURN_CYCLE_DAYS.get(transit_planet, 365.25) / 4
         
-        # Calculate planetary positions for that date
-        future_positions = calculate_planetary_positions(
-            future_date.year, future_date.month, future_date.day,
-            12, 0, 0, "UTC"
-        )
-        
-        # Check for exact aspects to natal chart
-        for transit_planet in slow_planets:
-            if transit_planet not in future_positions:
-                continue
-            
-            for natal_planet, natal_data in natal_positions.items():
-                angle = calculate_aspect_angle(
-                    future_positions[transit_planet]["longitude"],
-                    natal_data["longitude"]
-                )
-                
-                # Check for exact aspects (within 1° orb)
-                aspect_types = [
-                    ("conjunction", 0, 1),
-                    ("opposition", 180, 1),
-                    ("trine", 120, 1),
-                    ("square", 90, 1)
-                ]
+        for natal_planet, natal_data in natal_positions.items():
+            for aspect_name, angle in aspects:
+                # Conjunction/opposition have one target point, the others two
+                targets = [(natal_data["longitude"] + angle) % 360]
+                if angle not in (0, 180):
+                    targets.append((natal_data["longitude"] - angle) % 360)
                 
-                for aspect_name, target_angle, orb in aspect_types:
-                    if abs(angle - target_angle) <= orb:
-                        natal_house = find_house_for_planet(natal_data["longitude"], house_data["cusps"])
-                        
-                        predictions.append({
-                            "date": future_date,
+                # Passes are counted per target point and per transit cycle
+                for target in targets:
+                    evaluate = longitude_offset_function(body, target)
+                    hits = sorted(float(hit) for hit in find_crossings(evaluate, jds, wrap_angle(longitudes - target), speeds))
+                    
+                    for jd, (_, pass_number, passes) in zip(hits, group_passes(hits, cycle_gap)):
+                        speed = ephemeris_engine.calc(jd, body)[3]
+                        events.append({
+                            "jd": jd,
+                            "date": jd_to_datetime(jd),
                             "transit_planet": transit_planet,
                             "natal_planet": natal_planet,
                             "aspect": aspect_name,
-                            "house": natal_house
+                            "retrograde": speed < 0,
+                            "pass": pass_number,
+                            "passes": passes
                         })
     
-    return predictions
+    events.sort(key=lambda x: x["jd"])
+    
+    return events
+
+
+def predict_upcoming_transits(current_date, natal_positions, house_data, months_ahead=6):
+    """
+    Predict major transits coming in the next X months
+    """
+    start_jd = datetime_to_jd(current_date)
+    events = predict_transit_events(natal_positions, start_jd, start_jd + months_ahead * 30)
+    
+    for event in events:
+        natal_longitude = natal_positions[event["natal_planet"]]["longitude"]
+        event["house"] = find_house_for_planet(natal_longitude, house_data["cusps"])
+    
+    return events
 
 
 def calculate_chiron(year, month, day, hour, minute, second, timezone_str="UTC"):
@@ -1562,14 +3653,9 @@ def calculate_chiron(year, month, day, hour, minute, second, timezone_str="UTC")
     Calculate Chiron position (with error handling for missing ephemeris files)
     """
     try:
-        tz = pytz.timezone(timezone_str)
-        local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-        utc_dt = local_dt.astimezone(pytz.UTC)
+        jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
         
-        jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day,
-                       utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0)
-        
-        result, ret_flag = swe.calc_ut(jd, swe.CHIRON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        result = ephemeris_engine.calc(jd, swe.CHIRON)
         longitude = result[0]
         sign = get_zodiac_sign(longitude)
         
@@ -1580,86 +3666,273 @@ def calculate_chiron(year, month, day, hour, minute, second, timezone_str="UTC")
         }
     except Exception as e:
         # If ephemeris files are missing, return None
-        print(f"⚠ Chiron calculation requires additional ephemeris files. Skipping Chiron reading.")
+        print(f"⚠ Chiron calculation requires additional ephemeris files. Skipping Chiron reading.", file=sys.stderr)
         return None
 
 
-def detect_fixed_star_conjunctions(natal_positions, house_data, horoscope_db):
+# Epoch of the sign/degree star positions in horoscope_database.json
+FIXED_STAR_EPOCH_JD = 2451545.0
+
+# Swiss Ephemeris star catalog, used when present in the ephemeris folder
+FIXED_STAR_CATALOG_FILE = "sefstars.txt"
+
+# Conjunction orb for fixed stars, in degrees
+FIXED_STAR_ORB = 1.0
+
+# Star catalogs are cached per epoch of this many days - a year of precession
+# moves a star about 0.014°, far inside the orb
+FIXED_STAR_EPOCH_DAYS = 365.25
+
+# Number of (database, epoch) star catalogs kept in memory
+FIXED_STAR_CACHE_SIZE = 16
+
+
+def longitude_window_ranges(longitudes, orb):
+    """
+    Windows of +/- orb around each longitude as [low, high] ranges on 0-360
+    A window crossing 0° Aries is split in two. Returns (owners, lows, highs),
+    where owners gives the index of the longitude each range belongs to.
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    lows = (longitudes - orb) % 360.0
+    highs = (longitudes + orb) % 360.0
+    wraps = lows > highs
+    owners = np.concatenate([np.arange(len(longitudes)), np.nonzero(wraps)[0]])
+    range_lows = np.concatenate([lows, np.zeros(wraps.sum())])
+    range_highs = np.concatenate([np.where(wraps, 360.0, highs), highs[wraps]])
+    return owners, range_lows, range_highs
+
+
+class FixedStarCatalog:
+    """
+    Fixed star longitudes held once in a sorted array
+    within() answers "which stars lie within orb of these points" with binary
+    search, so checking a chart against the full Swiss Ephemeris catalog costs
+    about as much as checking it against a handful of stars.
+    """
+    
+    def __init__(self, names, longitudes, star_data):
+        longitudes = np.asarray(longitudes, dtype=np.float64) % 360.0
+        self.order = np.argsort(longitudes, kind="stable")
+        self.longitudes = longitudes[self.order]
+        self.names = [names[i] for i in self.order]
+        self.star_data = [star_data[i] for i in self.order]
+    
+    def __len__(self):
+        return len(self.names)
+    
+    @classmethod
+    def from_database(cls, horoscope_db, jd=None):
+        """
+        Stars from the horoscope database; their longitudes are for
+        FIXED_STAR_EPOCH_JD and are precessed to jd (UT) when it is given
+        """
+        stars = horoscope_db.fixed_stars().get("stars", {})
+        names = list(stars.keys())
+        longitudes = np.array([ZODIAC_SIGNS.index(stars[name]["sign"]) * 30 + stars[name]["longitude"]
+                               for name in names], dtype=np.float64)
+        if jd is not None:
+            longitudes = longitudes + general_precession(jd)[2] - general_precession(FIXED_STAR_EPOCH_JD)[2]
+        return cls(names, longitudes, [stars[name] for name in names])
+    
+    @classmethod
+    def from_swisseph(cls, jd, horoscope_db=None, path=None):
+        """
+        Every star in the Swiss Ephemeris catalog, at the ecliptic of date for jd (UT)
+        Stars the horoscope database knows keep its interpretations; the rest get
+        a minimal star_data. Returns None when sefstars.txt is not installed.
+        """
+        catalog_path = os.path.join(path or ephe_path, FIXED_STAR_CATALOG_FILE)
+        if not os.path.exists(catalog_path):
+            return None
+        
+        known = horoscope_db.fixed_stars().get("stars", {}) if horoscope_db is not None else {}
+        names, longitudes, star_data = [], [], []
+        seen = set()
+        with open(catalog_path, encoding='latin-1') as f:
+            for line in f:
+                if line.startswith('#') or ',' not in line:
+                    continue
+                traditional, nomenclature = (field.strip() for field in line.split(',')[:2])
+                key = traditional or nomenclature
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                try:
+                    xx, _, _ = swe.fixstar2_ut(f"{traditional},{nomenclature}", jd, swe.FLG_SWIEPH)
+                except swe.Error:
+                    continue
+                longitude = xx[0]
+                names.append(key)
+                longitudes.append(longitude)
+                star_data.append(known.get(key, {
+                    "longitude": longitude % 30,
+                    "sign": get_zodiac_sign(longitude),
+                    "nomenclature": nomenclature
+                }))
+        
+        if not names:
+            return None
+        return cls(names, longitudes, star_data)
+    
+    def within(self, longitudes, orb=FIXED_STAR_ORB):
+        """
+        Stars within orb degrees of each longitude
+        Returns [(point index, star index, orb)] with star indexes into this catalog
+        """
+        owners, lows, highs = longitude_window_ranges(longitudes, orb)
+        first = np.searchsorted(self.longitudes, lows, side="left")
+        last = np.searchsorted(self.longitudes, highs, side="right")
+        
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        matches = []
+        for point, i, j in zip(owners, first, last):
+            for star in range(i, j):
+                matches.append((int(point), star, abs(float(wrap_angle(longitudes[point] - self.longitudes[star])))))
+        return matches
+
+
+fixed_star_catalogs = OrderedDict()
+
+
+def get_fixed_star_catalog(horoscope_db, jd=None, full_catalog=False):
+    """
+    Cached FixedStarCatalog for the database (precessed to jd when given),
+    or the full Swiss Ephemeris catalog at jd when full_catalog is set and installed
+    jd is rounded to a FIXED_STAR_EPOCH_DAYS epoch, so nearby births share one catalog
+    """
+    epoch = None if jd is None else round(jd / FIXED_STAR_EPOCH_DAYS)
+    key = (id(horoscope_db), epoch, full_catalog)
+    cached = fixed_star_catalogs.get(key)
+    if cached is not None and cached[0] is horoscope_db:
+        fixed_star_catalogs.move_to_end(key)
+        return cached[1]
+    
+    epoch_jd = None if epoch is None else epoch * FIXED_STAR_EPOCH_DAYS
+    catalog = None
+    if full_catalog and epoch_jd is not None:
+        catalog = FixedStarCatalog.from_swisseph(epoch_jd, horoscope_db)
+    if catalog is None:
+        catalog = FixedStarCatalog.from_database(horoscope_db, epoch_jd)
+    
+    fixed_star_catalogs[key] = (horoscope_db, catalog)
+    while len(fixed_star_catalogs) > FIXED_STAR_CACHE_SIZE:
+        fixed_star_catalogs.popitem(last=False)
+    return catalog
+
+
+def detect_fixed_star_conjunctions(natal_positions, house_data, horoscope_db, jd=None, full_catalog=False):
     """
     Detect if any fixed stars conjunct natal planets or angles (within 1° orb)
+    Passing the birth jd precesses the database stars to that date; full_catalog
+    also checks every star in sefstars.txt when it is installed.
     """
+    catalog = get_fixed_star_catalog(horoscope_db, jd, full_catalog)
+    
+    planets = list(natal_positions.keys())
+    points = [natal_positions[planet]["longitude"] for planet in planets]
+    points += [house_data["ascendant"]["longitude"], house_data["midheaven"]["longitude"]]
+    point_names = planets + ["Ascendant", "Midheaven"]
+    angle_start = len(planets)
+    
+    # Planets list star by star under each planet; angles list Ascendant then Midheaven under each star
+    def listing_order(match):
+        point, star, _ = match
+        rank = int(catalog.order[star])
+        return (0, point, rank) if point < angle_start else (1, rank, point)
+    
     conjunctions = []
+    for point, star, orb in sorted(catalog.within(points, FIXED_STAR_ORB), key=listing_order):
+        conjunctions.append({
+            "star": catalog.names[star],
+            "planet": point_names[point],
+            "orb": orb,
+            "star_data": catalog.star_data[star]
+        })
     
-    # Get fixed stars data
-    stars = horoscope_db.get("natal_chart", {}).get("fixed_stars", {}).get("stars", {})
+    return conjunctions
+
+
+# Ptolemaic aspects the Moon must perfect before leaving its sign
+VOC_ASPECTS = {0: "conjunction", 60: "sextile", 90: "square", 120: "trine", 180: "opposition",
+               240: "trine", 270: "square", 300: "sextile"}
+
+
+def find_moon_ingress(jd, direction=1):
+    """
+    Exact Julian Day the Moon enters its next sign (direction=1)
+    or entered its current sign (direction=-1)
+    """
+    moon = ephemeris_engine.calc(jd, swe.MOON)
+    boundary = (int(moon[0] // 30) + (1 if direction > 0 else 0)) * 30 % 360
     
-    # Check planets
-    for planet, pos_data in natal_positions.items():
-        planet_long = pos_data["longitude"]
+    guess = jd + float(wrap_angle(boundary - moon[0])) / moon[3]
+    return float(solve_direct_longitude(swe.MOON, boundary, [guess])[0])
+
+
+def moon_aspects_between(jd_start, jd_end):
+    """
+    Exact Ptolemaic aspects the Moon perfects to Sun..Pluto between jd_start and jd_end
+    The Moon always outruns the planets, so the Moon-planet angle grows steadily and
+    each aspect it passes is solved directly - no sampling. Intended for spans of a
+    few days (one Moon sign). Returns dicts sorted by time.
+    """
+    moon_start = ephemeris_engine.calc(jd_start, swe.MOON)
+    moon_end = ephemeris_engine.calc(jd_end, swe.MOON)
+    
+    hits = []
+    
+    for planet_name, body in PLANETS.items():
+        if body == swe.MOON:
+            continue
         
-        for star_name, star_data in stars.items():
-            # Calculate star's absolute longitude
-            star_sign = star_data["sign"]
-            star_deg_in_sign = star_data["longitude"]
-            
-            # Convert to absolute longitude
-            sign_order = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-            star_sign_index = sign_order.index(star_sign)
-            star_absolute_long = star_sign_index * 30 + star_deg_in_sign
+        planet_start = ephemeris_engine.calc(jd_start, body)
+        planet_end = ephemeris_engine.calc(jd_end, body)
+        
+        angle_start = (moon_start[0] - planet_start[0]) % 360
+        travelled = ((moon_end[0] - planet_end[0]) - (moon_start[0] - planet_start[0])) % 360
+        
+        for target, aspect_name in VOC_ASPECTS.items():
+            distance = (target - angle_start) % 360
+            if not 0 < distance <= travelled:
+                continue
             
-            # Check if within 1° orb
-            diff = abs(planet_long - star_absolute_long)
-            if diff > 180:
-                diff = 360 - diff
+            def evaluate(jd, body=body, target=target):
+                moon = ephemeris_engine.calc(jd, swe.MOON)
+                planet = ephemeris_engine.calc(jd, body)
+                return float(wrap_angle(moon[0] - planet[0] - target)), moon[3] - planet[3]
             
-            if diff <= 1.0:
-                conjunctions.append({
-                    "star": star_name,
-                    "planet": planet,
-                    "orb": diff,
-                    "star_data": star_data
-                })
-    
-    # Check angles (Ascendant, MC)
-    asc_long = house_data["ascendant"]["longitude"]
-    mc_long = house_data["midheaven"]["longitude"]
-    
-    for star_name, star_data in stars.items():
-        star_sign = star_data["sign"]
-        star_deg_in_sign = star_data["longitude"]
-        sign_order = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        star_sign_index = sign_order.index(star_sign)
-        star_absolute_long = star_sign_index * 30 + star_deg_in_sign
-        
-        # Check Ascendant
-        diff_asc = abs(asc_long - star_absolute_long)
-        if diff_asc > 180:
-            diff_asc = 360 - diff_asc
-        
-        if diff_asc <= 1.0:
-            conjunctions.append({
-                "star": star_name,
-                "planet": "Ascendant",
-                "orb": diff_asc,
-                "star_data": star_data
-            })
-        
-        # Check MC
-        diff_mc = abs(mc_long - star_absolute_long)
-        if diff_mc > 180:
-            diff_mc = 360 - diff_mc
-        
-        if diff_mc <= 1.0:
-            conjunctions.append({
-                "star": star_name,
-                "planet": "Midheaven",
-                "orb": diff_mc,
-                "star_data": star_data
+            hits.append({
+                "jd": float(refine_crossing(evaluate, jd_start, jd_end, -distance)),
+                "planet": planet_name,
+                "aspect": aspect_name
             })
     
-    return conjunctions
+    hits.sort(key=lambda x: x["jd"])
+    return hits
+
+
+def void_of_course_period(jd):
+    """
+    Void-of-course window for the Moon sign containing jd
+    Returns dict with sign, sign entry/exit, the last aspect before the exit
+    (None if the Moon makes no aspect in this sign) and the VOC start
+    """
+    entry = find_moon_ingress(jd, -1)
+    exit_jd = find_moon_ingress(jd, 1)
+    aspects = moon_aspects_between(entry, exit_jd)
+    
+    last_aspect = aspects[-1] if aspects else None
+    
+    return {
+        "sign": get_zodiac_sign(ephemeris_engine.calc(jd, swe.MOON)[0]),
+        "entry": entry,
+        "exit": exit_jd,
+        "last_aspect": last_aspect,
+        "aspects": aspects,
+        "start": last_aspect["jd"] if last_aspect else entry,
+        "end": exit_jd
+    }
 
 
 def check_void_of_course_moon(dt):
@@ -1667,64 +3940,49 @@ def check_void_of_course_moon(dt):
     Check if Moon is currently void of course
     Returns (is_void, last_aspect_time, next_sign_change_time)
     """
-    tz = pytz.UTC
-    utc_dt = dt.astimezone(tz)
-    
-    # Get current Moon position
-    jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day,
-                   utc_dt.hour + utc_dt.minute/60.0)
+    jd = datetime_to_jd(dt)
+    period = void_of_course_period(jd)
     
-    moon_result, _ = swe.calc_ut(jd, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
-    moon_long = moon_result[0]
-    moon_speed = moon_result[3]  # degrees per day
+    # Moon is VOC once it has made its final aspect in the sign
+    is_void = jd >= period["start"]
     
-    current_sign = get_zodiac_sign(moon_long)
-    degrees_in_sign = moon_long % 30
+    # Most recent aspect at or before now (the final one when void)
+    past_aspects = [a["jd"] for a in period["aspects"] if a["jd"] <= jd]
+    last_aspect_time = jd_to_datetime(past_aspects[-1]) if past_aspects else None
     
-    # Calculate when Moon changes sign
-    degrees_to_next_sign = 30 - degrees_in_sign
-    hours_to_next_sign = (degrees_to_next_sign / moon_speed) * 24
-    next_sign_change = utc_dt + timedelta(hours=hours_to_next_sign)
-    
-    # Look back up to 12 hours to find last aspect
-    last_aspect_time = None
-    
-    for hours_back in range(0, 13):
-        check_time = utc_dt - timedelta(hours=hours_back)
-        check_jd = swe.julday(check_time.year, check_time.month, check_time.day,
-                             check_time.hour + check_time.minute/60.0)
-        
-        check_moon_result, _ = swe.calc_ut(check_jd, swe.MOON, swe.FLG_SWIEPH)
-        check_moon_long = check_moon_result[0]
-        check_moon_sign = get_zodiac_sign(check_moon_long)
+    return is_void, last_aspect_time, jd_to_datetime(period["exit"])
+
+
+def void_of_course_calendar(jd_start, jd_end):
+    """
+    Every void-of-course Moon period overlapping jd_start..jd_end, in one pass
+    Returns dicts with start/end Julian Days, the sign and the last aspect
+    """
+    periods = []
+    entry = find_moon_ingress(jd_start, -1)
+    
+    while entry < jd_end:
+        # Step just past the boundary so the ingress search sees the new sign
+        exit_jd = find_moon_ingress(entry + 0.01, 1)
+        aspects = moon_aspects_between(entry, exit_jd)
+        last_aspect = aspects[-1] if aspects else None
+        start = last_aspect["jd"] if last_aspect else entry
         
-        # If we've crossed into previous sign, stop searching
-        if check_moon_sign != current_sign:
-            break
+        if exit_jd > jd_start:
+            periods.append({
+                "start": start,
+                "end": exit_jd,
+                "sign": get_zodiac_sign(ephemeris_engine.calc(entry + 0.01, swe.MOON)[0]),
+                "last_aspect": last_aspect
+            })
         
-        # Check if Moon made aspect to any planet at this time
-        for planet_id in [swe.SUN, swe.MERCURY, swe.VENUS, swe.MARS, 
-                         swe.JUPITER, swe.SATURN, swe.URANUS, swe.NEPTUNE, swe.PLUTO]:
-            planet_result, _ = swe.calc_ut(check_jd, planet_id, swe.FLG_SWIEPH)
-            planet_long = planet_result[0]
-            
-            angle = calculate_aspect_angle(check_moon_long, planet_long)
-            
-            # Check for major aspects
-            aspect_angles = [0, 60, 90, 120, 180]
-            for target_angle in aspect_angles:
-                if abs(angle - target_angle) <= 1.0:  # Within 1° orb
-                    if last_aspect_time is None or check_time > last_aspect_time:
-                        last_aspect_time = check_time
-    
-    # Moon is VOC if last aspect was found and we haven't changed signs yet
-    is_void = last_aspect_time is not None
+        entry = exit_jd
     
-    return is_void, last_aspect_time, next_sign_change
+    return periods
 
 
 def calculate_relocation_chart(natal_year, natal_month, natal_day, natal_hour, natal_minute,
-                               natal_tz, new_lat, new_lon, new_tz="UTC"):
+                               natal_tz, new_lat, new_lon, new_tz="UTC", house_system=DEFAULT_HOUSE_SYSTEM):
     """
     Calculate relocated chart - natal planets with new location's houses
     Shows how chart manifests differently in a new place
@@ -1738,7 +3996,7 @@ def calculate_relocation_chart(natal_year, natal_month, natal_day, natal_hour, n
     # Calculate houses for new location
     relocated_houses = calculate_houses(
         natal_year, natal_month, natal_day, natal_hour, natal_minute, 0,
-        new_lat, new_lon, natal_tz
+        new_lat, new_lon, natal_tz, house_system
     )
     
     return natal_positions, relocated_houses
@@ -1762,7 +4020,7 @@ def get_sabian_interpretation(planet_name, longitude, horoscope_db):
     degree_num = get_sabian_symbol_degree(longitude)
     
     # Look up in database
-    sabian_data = horoscope_db.get("natal_chart", {}).get("sabian_symbols", {})
+    sabian_data = horoscope_db.sabian_symbols()
     symbols = sabian_data.get("symbols", {})
     
     if str(degree_num) in symbols:
@@ -1779,118 +4037,204 @@ def get_sabian_interpretation(planet_name, longitude, horoscope_db):
         }
 
 
-def calculate_asteroid(asteroid_number, year, month, day, hour, minute, second, timezone_str="UTC"):
+# Fixed columns of Lowell's astorb.dat (0-based slices of each 267-character line)
+ASTORB_COLUMNS = {
+    "number": (0, 6),
+    "name": (7, 25),
+    "magnitude": (42, 47),
+    "epoch": (106, 114),            # yyyymmdd, TT
+    "mean_anomaly": (115, 125),
+    "arg_perihelion": (126, 136),   # J2000
+    "long_asc_node": (137, 147),    # J2000
+    "inclination": (148, 157),      # J2000
+    "eccentricity": (158, 168),
+    "semi_major_axis": (169, 181),  # AU
+}
+
+ASTORB_DTYPE = np.dtype([
+    ("number", np.int32),
+    ("name", "S18"),
+    ("magnitude", np.float32),
+    ("epoch", np.float64),          # Julian Day (TT)
+    ("mean_anomaly", np.float64),
+    ("arg_perihelion", np.float64),
+    ("long_asc_node", np.float64),
+    ("inclination", np.float64),
+    ("eccentricity", np.float64),
+    ("semi_major_axis", np.float64),
+])
+
+# Index files written next to astorb.dat
+ASTORB_INDEX_PARTS = ("records", "rows", "names", "name_rows")
+
+
+def parse_astorb_line(line):
     """
-    Calculate asteroid position using Swiss Ephemeris
-    Returns position data or None if calculation fails
+    Parse one astorb.dat line into an ASTORB_DTYPE tuple
+    Returns None for unnumbered objects and malformed lines
     """
+    def field(name):
+        start, end = ASTORB_COLUMNS[name]
+        return line[start:end].strip()
+    
     try:
-        # Convert to UTC and get Julian Date
-        tz = pytz.timezone(timezone_str)
-        local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-        utc_dt = local_dt.astimezone(pytz.UTC)
-        decimal_hour = utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
-        jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, decimal_hour)
+        number = int(field("number"))
+        epoch = field("epoch")
+        return (
+            number,
+            field("name").encode('latin-1'),
+            float(field("magnitude") or "nan"),
+            swe.julday(int(epoch[0:4]), int(epoch[4:6]), int(epoch[6:8]), 0.0),
+            float(field("mean_anomaly")),
+            float(field("arg_perihelion")),
+            float(field("long_asc_node")),
+            float(field("inclination")),
+            float(field("eccentricity")),
+            float(field("semi_major_axis")),
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+class AstorbIndex:
+    """
+    Binary index of astorb.dat, built once and memory-mapped afterwards
+    records: ASTORB_DTYPE rows sorted by number
+    rows: dense number -> row array (-1 where missing), so a number lookup is O(1)
+    names/name_rows: sorted lower-case names and their rows, probed with searchsorted
+    """
+
+    def __init__(self, records, rows, names, name_rows):
+        self.records = records
+        self.rows = rows
+        self.names = names
+        self.name_rows = name_rows
+
+    @staticmethod
+    def index_paths(astorb_path):
+        directory = os.path.dirname(os.path.abspath(astorb_path))
+        return {part: os.path.join(directory, f"astorb_{part}.npy") for part in ASTORB_INDEX_PARTS}
+
+    @classmethod
+    def build(cls, astorb_path):
+        """Parse astorb.dat once and write the index files"""
+        parsed = []
+        with open(astorb_path, 'r', encoding='latin-1') as f:
+            for line in f:
+                row = parse_astorb_line(line)
+                if row is not None:
+                    parsed.append(row)
         
-        # Use Swiss Ephemeris to calculate asteroid position
-        se_num = swe.AST_OFFSET + asteroid_number
-        result, ret_flag = swe.calc_ut(jd, se_num, swe.FLG_SWIEPH)
+        records = np.array(parsed, dtype=ASTORB_DTYPE)
+        records = records[np.argsort(records["number"], kind="stable")]
         
-        longitude = result[0]
-        speed = result[3] if len(result) > 3 else 0.0
+        rows = np.full(int(records["number"].max(initial=0)) + 1, -1, dtype=np.int32)
+        rows[records["number"]] = np.arange(len(records), dtype=np.int32)
         
-        # Normalize longitude to 0-360
-        longitude = longitude % 360.0
+        lower_names = np.char.lower(records["name"])
+        name_order = np.argsort(lower_names, kind="stable").astype(np.int32)
         
-        sign = get_zodiac_sign(longitude)
+        paths = cls.index_paths(astorb_path)
+        for part, array in (("records", records), ("rows", rows),
+                            ("names", lower_names[name_order]), ("name_rows", name_order)):
+            tmp_path = f"{paths[part]}.{os.getpid()}.tmp.npy"
+            np.save(tmp_path, array)
+            os.replace(tmp_path, paths[part])
         
-        return {
-            "longitude": longitude,
-            "sign": sign,
-            "degrees_in_sign": longitude % 30,
-            "speed": speed,
-            "retrograde": speed < 0
-        }
+        return cls.load(astorb_path)
+
+    @classmethod
+    def load(cls, astorb_path):
+        """Memory-map the index, or return None if it is missing or older than astorb.dat"""
+        paths = cls.index_paths(astorb_path)
+        try:
+            source_mtime = os.path.getmtime(astorb_path)
+            if any(os.path.getmtime(paths[part]) < source_mtime for part in ASTORB_INDEX_PARTS):
+                return None
+            return cls(*(np.load(paths[part], mmap_mode="r") for part in ASTORB_INDEX_PARTS))
+        except (OSError, ValueError):
+            return None
+
+    def __len__(self):
+        return len(self.records)
+
+    def record(self, number):
+        """Record for a numbered asteroid, or None"""
+        if not 0 < number < len(self.rows):
+            return None
+        row = self.rows[number]
+        return self.records[row] if row >= 0 else None
+
+    def select(self, numbers):
+        """Records for an array of asteroid numbers, skipping numbers not in the catalog"""
+        numbers = np.asarray(numbers, dtype=np.int64)
+        numbers = numbers[(numbers > 0) & (numbers < len(self.rows))]
+        rows = self.rows[numbers]
+        return self.records[rows[rows >= 0]]
+
+    def find_name(self, name):
+        """Records whose name matches exactly (case-insensitive), in number order"""
+        key = name.lower().strip().encode('latin-1', 'replace')
+        start = np.searchsorted(self.names, key, side="left")
+        end = np.searchsorted(self.names, key, side="right")
+        return self.records[np.sort(self.name_rows[start:end])]
+
+
+# Loaded AstorbIndex per astorb.dat path
+astorb_indexes = {}
+
+
+def get_astorb_index(ephe_path):
+    """
+    AstorbIndex for ephe_path/astorb.dat, building it on first use
+    Returns None when astorb.dat is not available
+    """
+    astorb_path = os.path.join(ephe_path, "astorb.dat")
+    
+    if astorb_path not in astorb_indexes:
+        if not os.path.exists(astorb_path):
+            return None
         
-    except Exception as e:
-        return None
+        index = AstorbIndex.load(astorb_path)
+        if index is None:
+            print("🔭 Indexing astorb.dat (one-time)...", file=sys.stderr)
+            try:
+                index = AstorbIndex.build(astorb_path)
+            except Exception as e:
+                print(f"⚠ Could not index astorb.dat: {e}", file=sys.stderr)
+                return None
+        astorb_indexes[astorb_path] = index
+    
+    return astorb_indexes[astorb_path]
+
+
+def astorb_record_to_elements(record):
+    """Orbital element dict for one ASTORB_DTYPE record"""
+    return {
+        'number': int(record["number"]),
+        'name': record["name"].decode('latin-1'),
+        'magnitude': round(float(record["magnitude"]), 2),
+        'epoch': float(record["epoch"]),
+        'mean_anomaly': float(record["mean_anomaly"]),
+        'arg_perihelion': float(record["arg_perihelion"]),
+        'long_asc_node': float(record["long_asc_node"]),
+        'inclination': float(record["inclination"]),
+        'eccentricity': float(record["eccentricity"]),
+        'semi_major_axis': float(record["semi_major_axis"])
+    }
 
 
 def parse_astorb_for_asteroid(asteroid_number, ephe_path):
     """
-    Parse astorb.dat to extract orbital elements for a specific asteroid
-    Returns dict with orbital elements or None if not found
+    Orbital elements for a specific asteroid from the astorb.dat index
+    Returns dict with orbital elements (epoch as a TT Julian Day) or None if not found
     """
-    import os
-    
-    astorb_path = os.path.join(ephe_path, "astorb.dat")
-    
-    if not os.path.exists(astorb_path):
+    index = get_astorb_index(ephe_path)
+    if index is None:
         return None
     
-    try:
-        with open(astorb_path, 'r', encoding='latin-1') as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                
-                if len(line) < 200:  # astorb.dat lines are ~267 chars
-                    continue
-                
-                try:
-                    # Parse asteroid number (columns 1-6)
-                    num_str = line[0:6].strip()
-                    num = int(num_str)
-                    
-                    if num == asteroid_number:
-                        # Found our asteroid! Parse orbital elements
-                        # Format based on astorb.dat specification
-                        
-                        # Epoch (columns 107-115) - Julian Date
-                        epoch_str = line[106:115].strip()
-                        epoch = float(epoch_str) if epoch_str else 2451545.0
-                        
-                        # Mean anomaly at epoch (columns 116-125) in degrees
-                        mean_anom_str = line[115:125].strip()
-                        mean_anomaly = float(mean_anom_str) if mean_anom_str else 0.0
-                        
-                        # Argument of perihelion (columns 126-135) in degrees
-                        arg_peri_str = line[125:135].strip()
-                        arg_perihelion = float(arg_peri_str) if arg_peri_str else 0.0
-                        
-                        # Longitude of ascending node (columns 136-145) in degrees
-                        long_node_str = line[135:145].strip()
-                        long_asc_node = float(long_node_str) if long_node_str else 0.0
-                        
-                        # Inclination (columns 146-155) in degrees
-                        incl_str = line[145:155].strip()
-                        inclination = float(incl_str) if incl_str else 0.0
-                        
-                        # Eccentricity (columns 70-79)
-                        ecc_str = line[70:79].strip()
-                        eccentricity = float(ecc_str) if ecc_str else 0.0
-                        
-                        # Semi-major axis (columns 92-103) in AU
-                        a_str = line[92:103].strip()
-                        semi_major_axis = float(a_str) if a_str else 1.0
-                        
-                        return {
-                            'epoch': epoch,
-                            'mean_anomaly': mean_anomaly,
-                            'arg_perihelion': arg_perihelion,
-                            'long_asc_node': long_asc_node,
-                            'inclination': inclination,
-                            'eccentricity': eccentricity,
-                            'semi_major_axis': semi_major_axis
-                        }
-                
-                except (ValueError, IndexError):
-                    continue
-        
-        return None
-        
-    except Exception as e:
-        return None
+    record = index.record(asteroid_number)
+    return astorb_record_to_elements(record) if record is not None else None
 
 
 def calculate_major_asteroid_direct(asteroid_number, year, month, day, hour, minute, second, timezone_str="UTC"):
@@ -1900,20 +4244,15 @@ def calculate_major_asteroid_direct(asteroid_number, year, month, day, hour, min
     These should always have .se1 files available
     """
     try:
-        tz = pytz.timezone(timezone_str)
-        local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-        utc_dt = local_dt.astimezone(pytz.UTC)
-        
-        decimal_hour = utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
-        jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, decimal_hour)
+        jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
         
         se_asteroid_num = swe.AST_OFFSET + asteroid_number
         
-        # Use Swiss Ephemeris with SWIEPH flag (reads .se1 files)
-        result, ret_flag = swe.calc_ut(jd, se_asteroid_num, swe.FLG_SWIEPH)
+        # Swiss Ephemeris lookup (reads .se1 files) through the shared position cache
+        result = ephemeris_engine.calc(jd, se_asteroid_num)
         
         longitude = result[0]
-        speed = result[3] if len(result) > 3 else 0.0
+        speed = result[3]
         sign = get_zodiac_sign(longitude)
         
         return {
@@ -1924,341 +4263,455 @@ def calculate_major_asteroid_direct(asteroid_number, year, month, day, hour, min
             "retrograde": speed < 0 if speed != 0 else False
         }
         
-    except Exception as e:
-        print(f"⚠ Major asteroid #{asteroid_number} calculation failed: {e}")
-        return None
+    except Exception as e:
+        print(f"⚠ Major asteroid #{asteroid_number} calculation failed: {e}", file=sys.stderr)
+        return None
+
+# Two-body propagation of astorb.dat orbits (asteroids without .se1 files)
+GAUSS_K = 0.01720209895                  # Gaussian gravitational constant, rad/day
+SPEED_OF_LIGHT_AU_PER_DAY = 173.1446326847
+KEPLER_SPEED_STEP = 0.05                 # days either side for the central-difference speed
+EARTH_FLAGS = swe.FLG_SWIEPH | swe.FLG_J2000 | swe.FLG_XYZ | swe.FLG_TRUEPOS | swe.FLG_SPEED
+
+
+def general_precession(jd_tt):
+    """
+    IAU 2006 ecliptic precession angles from J2000 to jd_tt, in degrees
+    Returns (pi_A, Pi_A, p_A): ecliptic inclination, node of the moving ecliptic,
+    and general precession in longitude
+    """
+    t = (np.asarray(jd_tt, dtype=np.float64) - 2451545.0) / 36525.0
+    pi_a = ((((-0.0000000022 * t + 0.000000113) * t - 0.00012559) * t - 0.0334926) * t + 46.998973) * t
+    big_pi_a = ((((0.000000072 * t - 0.00004797) * t - 0.0005371) * t + 0.157992) * t - 867.95758) * t + 629546.7936
+    p_a = ((((-0.0000000383 * t - 0.000023857) * t + 0.00007964) * t + 1.1054348) * t + 5028.796195) * t
+    return pi_a / 3600.0, big_pi_a / 3600.0, p_a / 3600.0
+
+
+def precess_ecliptic_from_j2000(longitudes, latitudes, jd_tt):
+    """Rotate J2000 ecliptic longitudes/latitudes (degrees) to the mean ecliptic and equinox of jd_tt"""
+    pi_a, big_pi_a, p_a = (np.radians(angle) for angle in general_precession(jd_tt))
+    lon = np.radians(longitudes)
+    lat = np.radians(latitudes)
+    
+    a = np.cos(pi_a) * np.cos(lat) * np.sin(big_pi_a - lon) - np.sin(pi_a) * np.sin(lat)
+    b = np.cos(lat) * np.cos(big_pi_a - lon)
+    c = np.cos(pi_a) * np.sin(lat) + np.sin(pi_a) * np.cos(lat) * np.sin(big_pi_a - lon)
+    
+    return np.degrees(p_a + big_pi_a - np.arctan2(a, b)) % 360.0, np.degrees(np.arcsin(np.clip(c, -1.0, 1.0)))
+
+
+def solve_kepler(mean_anomaly, eccentricity, tolerance=1e-12, max_iterations=30):
+    """Eccentric anomaly (radians) for arrays of mean anomalies and eccentricities (e < 1)"""
+    mean_anomaly = np.remainder(mean_anomaly + np.pi, 2 * np.pi) - np.pi
+    eccentric = np.where(eccentricity < 0.8, mean_anomaly, np.pi * np.sign(mean_anomaly))
+    
+    for _ in range(max_iterations):
+        step = (eccentric - eccentricity * np.sin(eccentric) - mean_anomaly) / (1.0 - eccentricity * np.cos(eccentric))
+        eccentric = eccentric - step
+        if np.nanmax(np.abs(step), initial=0.0) < tolerance:
+            break
+    
+    return eccentric
+
+
+def heliocentric_ecliptic_j2000(elements, jd_tt):
+    """
+    Heliocentric J2000 ecliptic positions (AU) from ASTORB_DTYPE elements at jd_tt
+    jd_tt may be a scalar or an array broadcastable against elements; returns (..., 3)
+    Hyperbolic or malformed orbits come back as NaN
+    """
+    a = elements["semi_major_axis"]
+    e = elements["eccentricity"]
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_motion = GAUSS_K / a ** 1.5
+        mean_anomaly = np.radians(elements["mean_anomaly"]) + mean_motion * (jd_tt - elements["epoch"])
+        eccentric = solve_kepler(mean_anomaly, np.where(e < 1.0, e, np.nan))
+        
+        x_orbit = a * (np.cos(eccentric) - e)
+        y_orbit = a * np.sqrt(1.0 - e * e) * np.sin(eccentric)
+    
+    peri = np.radians(elements["arg_perihelion"])
+    node = np.radians(elements["long_asc_node"])
+    incl = np.radians(elements["inclination"])
+    cos_peri, sin_peri = np.cos(peri), np.sin(peri)
+    cos_node, sin_node = np.cos(node), np.sin(node)
+    cos_incl, sin_incl = np.cos(incl), np.sin(incl)
+    
+    x = (x_orbit * (cos_node * cos_peri - sin_node * sin_peri * cos_incl)
+         - y_orbit * (cos_node * sin_peri + sin_node * cos_peri * cos_incl))
+    y = (x_orbit * (sin_node * cos_peri + cos_node * sin_peri * cos_incl)
+         - y_orbit * (sin_node * sin_peri - cos_node * cos_peri * cos_incl))
+    z = x_orbit * sin_peri * sin_incl + y_orbit * cos_peri * sin_incl
+    
+    return np.stack([x, y, z], axis=-1)
+
+
+def geocentric_ecliptic_from_elements(elements, jd):
+    """
+    Apparent geocentric ecliptic-of-date coordinates for many asteroids at one instant (UT)
+    The Earth comes from Swiss Ephemeris (geocentric Sun, J2000 XYZ); the asteroid is
+    corrected for light-time and annual aberration, then precessed and nutated to date.
+    Returns (longitudes, latitudes, distances) in degrees / AU
+    """
+    jd_tt = jd + swe.deltat(jd)
+    sun = ephemeris_engine.calc(jd, swe.SUN, EARTH_FLAGS)
+    earth_position = -np.array(sun[0:3])
+    earth_velocity = -np.array(sun[3:6])
+    
+    light_time = 0.0
+    for _ in range(2):
+        geocentric = heliocentric_ecliptic_j2000(elements, jd_tt - light_time) - earth_position
+        distances = np.sqrt(np.sum(geocentric * geocentric, axis=-1))
+        light_time = distances / SPEED_OF_LIGHT_AU_PER_DAY
+    
+    # First-order annual aberration: shift the direction by the Earth's velocity over c
+    with np.errstate(invalid="ignore", divide="ignore"):
+        apparent = geocentric / distances[..., None] + earth_velocity / SPEED_OF_LIGHT_AU_PER_DAY
+    
+    longitudes = np.degrees(np.arctan2(apparent[..., 1], apparent[..., 0]))
+    latitudes = np.degrees(np.arctan2(apparent[..., 2], np.hypot(apparent[..., 0], apparent[..., 1])))
+    longitudes, latitudes = precess_ecliptic_from_j2000(longitudes, latitudes, jd_tt)
+    
+    nutation_longitude = ephemeris_engine.calc(jd, swe.ECL_NUT, swe.FLG_SWIEPH)[2]
+    return (longitudes + nutation_longitude) % 360.0, latitudes, distances
+
+
+def propagate_asteroids(elements, jd, with_speed=True):
+    """
+    Two-body positions for an array of ASTORB_DTYPE elements at one instant (UT)
+    Returns a POSITION_DTYPE array with one row per asteroid (body = AST_OFFSET + number);
+    speed is a central difference over KEPLER_SPEED_STEP days when with_speed is set
+    """
+    elements = np.atleast_1d(elements)
+    longitudes, latitudes, distances = geocentric_ecliptic_from_elements(elements, jd)
+    
+    out = np.zeros(len(elements), dtype=POSITION_DTYPE)
+    out["jd"] = jd
+    out["body"] = swe.AST_OFFSET + elements["number"]
+    out["longitude"] = longitudes
+    out["latitude"] = latitudes
+    out["distance"] = distances
+    
+    if with_speed:
+        before = geocentric_ecliptic_from_elements(elements, jd - KEPLER_SPEED_STEP)[0]
+        after = geocentric_ecliptic_from_elements(elements, jd + KEPLER_SPEED_STEP)[0]
+        out["speed"] = wrap_angle(after - before) / (2 * KEPLER_SPEED_STEP)
+    
+    out["sign"] = np.where(np.isnan(longitudes), -1, longitudes // 30.0).astype(np.int8)
+    out["retrograde"] = out["speed"] < 0
+    return out
+
+
+def calculate_asteroid(asteroid_number, year, month, day, hour, minute, second, timezone_str="UTC"):
+    """
+    Swiss Ephemeris position when the .se1 file exists, otherwise a two-body
+    position from the astorb.dat elements; None if neither is available
+    """
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
+    chart = ephemeris_engine.chart(jd, {"asteroid": swe.AST_OFFSET + asteroid_number})
+    if "asteroid" in chart:
+        return chart["asteroid"]
+    
+    index = get_astorb_index(ephe_path)
+    elements = index.select([asteroid_number]) if index is not None else []
+    if len(elements) == 0:
+        return None
+    
+    return positions_to_dict(propagate_asteroids(elements, jd), ["asteroid"]).get("asteroid")
+
+# Asteroids propagated per batch in a catalog sweep (bounds peak memory)
+CATALOG_SWEEP_BATCH = 50000
+
+
+def sweep_asteroid_conjunctions(natal_positions, jd, orb=1.0, named_only=True, batch_size=CATALOG_SWEEP_BATCH):
+    """
+    Every catalogued asteroid within orb degrees of a natal point at jd (UT)
+    The astorb.dat catalog is propagated in batches; each batch is sorted by
+    longitude and the natal windows are found with binary search (split in two
+    where a window crosses 0° Aries). named_only skips provisional designations.
+    Returns [{number, name, longitude, sign, degrees_in_sign, natal_planet, orb}] sorted by orb
+    """
+    index = get_astorb_index(ephe_path)
+    if index is None or not natal_positions:
+        return []
+    
+    natal_names = list(natal_positions.keys())
+    natal_longitudes = np.array([natal_positions[p]["longitude"] for p in natal_names])
+    
+    # Each natal window as one or two [low, high] ranges on 0-360
+    range_planets, range_lows, range_highs = longitude_window_ranges(natal_longitudes, orb)
+    
+    hits = []
+    for start in range(0, len(index.records), batch_size):
+        records = index.records[start:start + batch_size]
+        if named_only:
+            # Unnamed numbered asteroids carry their provisional designation ("1999 AB12")
+            records = records[~np.char.isdigit(records["name"].astype("S1"))]
+        if len(records) == 0:
+            continue
+        
+        longitudes = propagate_asteroids(records, jd, with_speed=False)["longitude"]
+        order = np.argsort(longitudes)
+        sorted_longitudes = longitudes[order]
+        
+        first = np.searchsorted(sorted_longitudes, range_lows, side="left")
+        last = np.searchsorted(sorted_longitudes, range_highs, side="right")
+        
+        for planet, i, j in zip(range_planets, first, last):
+            for row in order[i:j]:
+                hits.append((records[row], float(longitudes[row]), natal_names[planet], natal_longitudes[planet]))
+    
+    results = []
+    for record, longitude, natal_planet, natal_longitude in hits:
+        results.append({
+            "number": int(record["number"]),
+            "name": record["name"].decode('latin-1'),
+            "longitude": longitude,
+            "sign": get_zodiac_sign(longitude),
+            "degrees_in_sign": longitude % 30,
+            "natal_planet": natal_planet,
+            "orb": abs(float(wrap_angle(longitude - natal_longitude)))
+        })
+    
+    results.sort(key=lambda x: x["orb"])
+    return results
+
+# Minimum trigram overlap (Jaccard) for a fuzzy name match
+NAME_MATCH_MIN_SIMILARITY = 0.3
+
+# Fuzzy candidates re-ranked by edit distance per query
+NAME_MATCH_CANDIDATES = 200
+
+
+def name_trigrams(name):
+    """Trigram codes of a lower-case latin-1 name, padded so prefixes weigh more"""
+    padded = b"  " + name + b" "
+    return {(padded[i] << 16) | (padded[i + 1] << 8) | padded[i + 2] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b):
+    """Levenshtein distance between two strings"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+class AsteroidNameIndex:
+    """
+    Ranked name search over named minor planets
+    Names are kept sorted (lower-case) so exact and prefix lookups are a bisect -
+    a sorted array does the job of a prefix trie at a fraction of the memory.
+    A trigram posting list (CSR layout: sorted trigram keys, offsets, name ids)
+    finds fuzzy candidates, which are then ranked by edit distance.
+    """
+
+    ARRAYS = ("lower", "display", "numbers", "number_order",
+              "trigram_counts", "trigram_keys", "trigram_offsets", "trigram_postings")
+
+    def __init__(self, lower, display, numbers, number_order, trigram_counts, trigram_keys, trigram_offsets, trigram_postings):
+        self.lower = lower
+        self.display = display
+        self.numbers = numbers
+        self.number_order = number_order
+        self.trigram_counts = trigram_counts
+        self.trigram_keys = trigram_keys
+        self.trigram_offsets = trigram_offsets
+        self.trigram_postings = trigram_postings
+
+    @classmethod
+    def build(cls, names, numbers):
+        """Build from parallel sequences of display names and asteroid numbers"""
+        lower = [name.lower().encode('latin-1', 'replace') for name in names]
+        order = sorted(range(len(lower)), key=lambda i: (lower[i], numbers[i]))
+        
+        lower = np.array([lower[i] for i in order], dtype="S18")
+        display = np.array([names[i].encode('latin-1', 'replace') for i in order], dtype="S18")
+        numbers = np.array([numbers[i] for i in order], dtype=np.int32)
+        
+        codes, ids = [], []
+        trigram_counts = np.zeros(len(lower), dtype=np.uint8)
+        for name_id, name in enumerate(lower):
+            trigrams = name_trigrams(name)
+            trigram_counts[name_id] = min(len(trigrams), 255)
+            codes.extend(trigrams)
+            ids.extend([name_id] * len(trigrams))
+        
+        codes = np.array(codes, dtype=np.uint32)
+        ids = np.array(ids, dtype=np.int32)
+        by_code = np.argsort(codes, kind="stable")
+        trigram_keys, starts = np.unique(codes[by_code], return_index=True)
+        trigram_offsets = np.append(starts, len(codes)).astype(np.int64)
+        
+        number_order = np.argsort(numbers, kind="stable").astype(np.int32)
+        
+        return cls(lower, display, numbers, number_order, trigram_counts, trigram_keys, trigram_offsets, ids[by_code])
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(*(data[name] for name in cls.ARRAYS))
+
+    def save(self, path):
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, **{name: getattr(self, name) for name in self.ARRAYS})
+        os.replace(tmp_path, path)
+
+    def __len__(self):
+        return len(self.lower)
+
+    def name_for_number(self, number):
+        """Display name for an asteroid number, or None if it is not indexed"""
+        position = np.searchsorted(self.numbers, number, sorter=self.number_order)
+        if position == len(self.numbers) or self.numbers[self.number_order[position]] != number:
+            return None
+        return self.display[self.number_order[position]].decode('latin-1')
+
+    def prefix_rows(self, key, limit=None):
+        """Rows whose lower-case name starts with key (bytes), shortest names first"""
+        start = np.searchsorted(self.lower, key, side="left")
+        end = np.searchsorted(self.lower, key + b"\xff", side="left")
+        rows = np.arange(start, end)
+        order = np.lexsort((self.numbers[rows], np.char.str_len(self.lower[rows])))
+        return rows[order[:limit]]
+
+    def fuzzy_rows(self, key):
+        """Rows sharing enough trigrams with key, as (row, similarity) best first"""
+        query = name_trigrams(key)
+        positions = np.searchsorted(self.trigram_keys, np.fromiter(query, dtype=np.uint32))
+        postings = [
+            self.trigram_postings[self.trigram_offsets[p]:self.trigram_offsets[p + 1]]
+            for p, code in zip(positions, query)
+            if p < len(self.trigram_keys) and self.trigram_keys[p] == code
+        ]
+        if not postings:
+            return []
+        
+        rows, shared = np.unique(np.concatenate(postings), return_counts=True)
+        similarity = shared / (len(query) + self.trigram_counts[rows].astype(np.int64) - shared)
+        
+        keep = similarity >= NAME_MATCH_MIN_SIMILARITY
+        rows, similarity = rows[keep], similarity[keep]
+        best = np.argsort(-similarity, kind="stable")[:NAME_MATCH_CANDIDATES]
+        return list(zip(rows[best], similarity[best]))
+
+    def search(self, query, limit=10):
+        """
+        Top matches for query: exact names, then nicknames from NAME_ASTEROID_ALIASES,
+        then prefix matches, then fuzzy matches ranked by edit distance
+        Returns [{name, number, match}]
+        """
+        text = query.lower().strip()
+        if not text:
+            return []
+        key = text.encode('latin-1', 'replace')
+        
+        results = []
+        seen = set()
+        
+        def add(number, name, match):
+            if number not in seen and len(results) < limit:
+                seen.add(number)
+                results.append({"name": name, "number": number, "match": match})
+        
+        # Shortest prefix matches first, so exact names lead
+        prefix = self.prefix_rows(key, limit + 1)
+        for row in prefix:
+            if self.lower[row] == key:
+                add(int(self.numbers[row]), self.display[row].decode('latin-1'), "exact")
+        
+        if text in NAME_ASTEROID_ALIASES:
+            number = NAME_ASTEROID_ALIASES[text]
+            add(number, self.name_for_number(number) or query.strip().title(), "alias")
+        
+        for row in prefix:
+            add(int(self.numbers[row]), self.display[row].decode('latin-1'), "prefix")
+        
+        if len(results) < limit:
+            ranked = sorted(
+                self.fuzzy_rows(key),
+                key=lambda item: (edit_distance(text, self.lower[item[0]].decode('latin-1')), -item[1], self.numbers[item[0]])
+            )
+            for row, _ in ranked:
+                add(int(self.numbers[row]), self.display[row].decode('latin-1'), "fuzzy")
+        
+        return results
+
+
+# Loaded AsteroidNameIndex per astorb.dat path ("aliases" for the built-in list)
+asteroid_name_indexes = {}
 
-def calculate_major_asteroids(year, month, day, hour, minute, second, timezone_str="UTC"):
-    """Big 6 using your existing .se1 files - ALREADY WORKS"""
-    major_numbers = {"Ceres": 1, "Pallas": 2, "Juno": 3, "Vesta": 4, "Eros": 433, "Psyche": 16}
-    asteroids = {}
+
+def get_asteroid_name_index(ephe_path=None):
+    """
+    Name index over astorb.dat in ephe_path, built on first use and kept as an .npz
+    Falls back to an index of NAME_ASTEROID_ALIASES when astorb.dat is unavailable
+    """
+    astorb_index = get_astorb_index(ephe_path) if ephe_path else None
     
-    for name, num in major_numbers.items():
-        pos = calculate_asteroid(num, year, month, day, hour, minute, second, timezone_str)
-        if pos:
-            asteroids[name] = pos
+    if astorb_index is None:
+        if "aliases" not in asteroid_name_indexes:
+            asteroid_name_indexes["aliases"] = AsteroidNameIndex.build(
+                [name.title() for name in NAME_ASTEROID_ALIASES], list(NAME_ASTEROID_ALIASES.values())
+            )
+        return asteroid_name_indexes["aliases"]
     
-    return asteroids
-
-def calculate_asteroid(asteroid_number, year, month, day, hour, minute, second, timezone_str="UTC"):
-    """Try Swiss Ephemeris, return None if file missing (expected behavior)"""
-    try:
-        # Your existing Swiss Ephemeris code
-        tz = pytz.timezone(timezone_str)
-        local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-        utc_dt = local_dt.astimezone(pytz.UTC)
-        decimal_hour = utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
-        jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, decimal_hour)
+    astorb_path = os.path.join(ephe_path, "astorb.dat")
+    if astorb_path not in asteroid_name_indexes:
+        index_path = os.path.join(ephe_path, "astorb_name_index.npz")
+        index = None
         
-        se_num = swe.AST_OFFSET + asteroid_number
-        result, ret_flag = swe.calc_ut(jd, se_num, swe.FLG_SWIEPH)
+        try:
+            if os.path.getmtime(index_path) >= os.path.getmtime(astorb_path):
+                index = AsteroidNameIndex.load(index_path)
+        except (OSError, ValueError, KeyError):
+            index = None
         
-        longitude = result[0]
-        speed = result[3] if len(result) > 3 else 0.0
-        sign = get_zodiac_sign(longitude)
+        if index is None:
+            print("🔭 Building asteroid name index (one-time)...", file=sys.stderr)
+            records = astorb_index.records
+            index = AsteroidNameIndex.build(
+                [name.decode('latin-1') for name in records["name"]], records["number"].tolist()
+            )
+            try:
+                index.save(index_path)
+            except Exception as e:
+                print(f"⚠ Could not save asteroid name index: {e}", file=sys.stderr)
         
-        return {
-            "longitude": longitude, "sign": sign, "degrees_in_sign": longitude % 30,
-            "speed": speed, "retrograde": speed < 0
-        }
-    except:
-        return None  # Expected for missing ephemeris files
+        asteroid_name_indexes[astorb_path] = index
+    
+    return asteroid_name_indexes[astorb_path]
+
 
-def search_astorb_for_names(search_term, ephe_path):
+def search_astorb_for_names(search_term, ephe_path, limit=10):
     """
     Search astorb.dat for asteroid names matching the search term
-    Returns list of {name, number} dictionaries
+    Returns ranked list of {name, number, match} dictionaries
     """
-    import os
-    
-    astorb_path = os.path.join(ephe_path, 'astorb.dat')
-    
-    if not os.path.exists(astorb_path):
-        print("⚠ astorb.dat not found. Using limited name database.")
+    if get_astorb_index(ephe_path) is None:
+        print("⚠ astorb.dat not found. Using limited name database.", file=sys.stderr)
         return []
     
-    matches = []
-    search_lower = search_term.lower().strip()
-    
-    try:
-        with open(astorb_path, 'r', encoding='latin-1') as f:
-            for line in f:
-                # Skip empty lines
-                if not line.strip():
-                    continue
-                
-                # Parse the line
-                # Format: "     1 Ceres              ..."
-                # Number is first 6 chars, name starts at char 7
-                
-                if len(line) < 20:
-                    continue
-                
-                try:
-                    # Extract number (first 6 chars, strip spaces)
-                    num_str = line[0:6].strip()
-                    asteroid_num = int(num_str)
-                    
-                    # Extract name (chars 7-25, strip spaces)
-                    asteroid_name = line[7:25].strip()
-                    
-                    # Check if name matches search term
-                    if search_lower in asteroid_name.lower():
-                        matches.append({
-                            "name": asteroid_name,
-                            "number": asteroid_num
-                        })
-                        
-                        # Limit to 10 matches to avoid overwhelming output
-                        if len(matches) >= 10:
-                            break
-                            
-                except (ValueError, IndexError):
-                    continue
-        
-        return matches
-        
-    except Exception as e:
-        print(f"⚠ Error reading astorb.dat: {e}")
-        return []
+    return get_asteroid_name_index(ephe_path).search(search_term, limit)
+
 
-def search_asteroid_by_name(search_name, ephe_path=None):
+def search_asteroid_by_name(search_name, ephe_path=None, limit=10):
     """
-    Search for asteroids by name - now searches astorb.dat dynamically!
-    Falls back to hardcoded list if astorb.dat not available
+    Search for asteroids by name using the astorb.dat name index
+    Falls back to the built-in NAME_ASTEROID_ALIASES list if astorb.dat is not available
     """
     if ephe_path:
-        # Try searching astorb.dat first
-        matches = search_astorb_for_names(search_name, ephe_path)
+        matches = search_astorb_for_names(search_name, ephe_path, limit)
         if matches:
             return matches
     
-    # Fallback to hardcoded names if astorb.dat search fails
-    matches = []
-    search_name_lower = search_name.lower().strip()
-    
-    # Existing hardcoded dictionary
-    common_names = {
-        # Male names
-        "michael": 4793, "mike": 4793,
-        "james": 2335, "jim": 2335, "jimmy": 2335,
-        "john": 1583,
-        "robert": 2071, "rob": 2071, "bob": 2071,
-        "david": 2603, "dave": 2603,
-        "william": 2866, "will": 2866, "bill": 2866,
-        "richard": 3972, "rick": 3972, "dick": 3972,
-        "joseph": 3556, "joe": 3556,
-        "thomas": 2555, "tom": 2555,
-        "charles": 2906, "charlie": 2906,
-        "christopher": 4858, "chris": 4858,
-        "daniel": 2504, "dan": 2504,
-        "matthew": 10133, "matt": 10133,
-        "anthony": 2404, "tony": 2404,
-        "mark": 3791,
-        "donald": 3395, "don": 3395,
-        "steven": 3225, "steve": 3225,
-        "paul": 3317,
-        "andrew": 3671, "andy": 3671,
-        "joshua": 6534, "josh": 6534,
-        "kenneth": 3873, "ken": 3873,
-        "kevin": 6913,
-        "brian": 3225,
-        "george": 2603,
-        "edward": 3205, "ed": 3205, "eddie": 3205,
-        "ronald": 3544, "ron": 3544,
-        "timothy": 4655, "tim": 4655,
-        "jason": 2335,
-        "jeffrey": 21656, "jeff": 21656,
-        "ryan": 5024,
-        "jacob": 12524,
-        "gary": 2700,
-        "nicholas": 3937, "nick": 3937,
-        "eric": 12796,
-        "jonathan": 6446,
-        "stephen": 3225,
-        "larry": 12238,
-        "justin": 3936,
-        "scott": 2597,
-        "brandon": 21656,
-        "benjamin": 11548, "ben": 11548,
-        "samuel": 3097, "sam": 3097,
-        "frank": 2829,
-        "gregory": 21656, "greg": 21656,
-        "raymond": 2071,
-        "alexander": 8966, "alex": 8966,
-        "patrick": 1687, "pat": 1687,
-        "jack": 5372,
-        "dennis": 3214,
-        "jerry": 3112,
-        "tyler": 11548,
-        "aaron": 3277,
-        "henry": 3516,
-        "douglas": 3873,
-        "peter": 1987,
-        "adam": 13070,
-        "nathan": 12238,
-        "zachary": 11548, "zach": 11548,
-        "kyle": 21656,
-        "walter": 1677,
-        "harold": 2906,
-        "jeremy": 21656,
-        "ethan": 21656,
-        "carl": 1727,
-        "arthur": 2597,
-        "terry": 3873,
-        "joe": 3556,
-        
-        # Female names
-        "mary": 2779,
-        "patricia": 436, "pat": 436, "patty": 436,
-        "jennifer": 6249, "jenny": 6249, "jen": 6249,
-        "linda": 882,
-        "barbara": 234, "barb": 234,
-        "elizabeth": 412, "liz": 412, "beth": 412, "betty": 412,
-        "susan": 793, "sue": 793,
-        "jessica": 2239, "jess": 2239,
-        "sarah": 1039, "sara": 1039,
-        "karen": 1537,
-        "nancy": 2870,
-        "lisa": 3561,
-        "betty": 2487,
-        "margaret": 371, "maggie": 371, "meg": 371,
-        "sandra": 1288, "sandy": 1288,
-        "ashley": 2569,
-        "kimberly": 2696, "kim": 2696,
-        "emily": 291,
-        "donna": 1323,
-        "michelle": 1376,
-        "carol": 2085,
-        "amanda": 725,
-        "melissa": 1390,
-        "deborah": 1251, "debbie": 1251, "deb": 1251,
-        "stephanie": 1277,
-        "rebecca": 4713, "becky": 4713,
-        "sharon": 1984,
-        "laura": 952,
-        "cynthia": 1143, "cindy": 1143,
-        "kathleen": 2093, "kathy": 2093,
-        "amy": 3375,
-        "angela": 965,
-        "shirley": 2441,
-        "anna": 265,
-        "brenda": 323,
-        "pamela": 1939, "pam": 1939,
-        "emma": 283,
-        "nicole": 1547,
-        "helen": 101,
-        "samantha": 796, "sam": 796,
-        "katherine": 2093, "kate": 2093, "katie": 2093,
-        "christine": 1244, "chris": 1244,
-        "debra": 1251,
-        "rachel": 971,
-        "catherine": 2093,
-        "carolyn": 2085,
-        "janet": 2301,
-        "ruth": 1259,
-        "maria": 170,
-        "heather": 1092,
-        "diane": 1376,
-        "virginia": 50,
-        "julie": 1192,
-        "joyce": 1946,
-        "victoria": 12,
-        "olivia": 224,
-        "kelly": 2907,
-        "christina": 1244,
-        "lauren": 9084,
-        "joan": 1502,
-        "evelyn": 715,
-        "judith": 664,
-        "megan": 2940,
-        "cheryl": 1575,
-        "andrea": 8955,
-        "hannah": 1086,
-        "jacqueline": 8558, "jackie": 8558,
-        "martha": 205,
-        "gloria": 294,
-        "teresa": 295,
-        "ann": 1087, "anne": 1087,
-        "sara": 1039,
-        "madison": 9387,
-        "frances": 1015,
-        "kathryn": 2093,
-        "janice": 2301,
-        "jean": 1815,
-        "abigail": 21656,
-        "sophia": 251,
-        "grace": 2873,
-        "denise": 1877,
-        "judy": 2301,
-        "christina": 1244,
-        "rose": 223,
-        "diana": 78,
-        "brittany": 9502,
-        "natalie": 1428,
-        "danielle": 2700,
-        "sophia": 251,
-        "alexis": 2815,
-        "lori": 3561,
-        
-        # Mythological
-        "apollo": 1862,
-        "athena": 881,
-        "zeus": 5731,
-        "hera": 103,
-        "artemis": 105,
-        "aphrodite": 1388,
-        "hermes": 69230,
-        "ares": 2174,
-        "hades": 27928,
-        "poseidon": 4341,
-        "demeter": 1108,
-        "hestia": 46,
-        "dionysus": 3671,
-        "persephone": 399,
-        "hecate": 100,
-        "pan": 4450,
-        "prometheus": 1809,
-        "orpheus": 3361,
-        "medusa": 149,
-        "pandora": 55,
-        "europa": 52,
-        "io": 85,
-        "ganymede": 1036,
-        "selene": 580,
-        "helios": 895,
-        "eos": 221,
-        "nyx": 3908,
-        "gaia": 1184,
-        "uranus": 2207,
-        "kronos": 10811,
-        "rhea": 577,
-        "titan": 1809,
-        "atlas": 1198,
-        "hercules": 532,
-        "perseus": 9876,
-        "theseus": 1841,
-        "jason": 2335,
-        "achilles": 588,
-        "hector": 624,
-        "odysseus": 1143,
-        "penelope": 201,
-        "helen": 101,
-        "paris": 3317,
-        "cassandra": 114,
-        "electra": 130,
-        "orion": 1327,
-        "andromeda": 31,
-        "pegasus": 1620
-    }
-    
-    if search_name_lower in common_names:
-        matches.append({
-            "name": search_name.title(),
-            "number": common_names[search_name_lower]
-        })
-    
-    return matches
+    return get_asteroid_name_index().search(search_name, limit)
 
 def calculate_major_asteroids(year, month, day, hour, minute, second, lat, lon, timezone_str="UTC"):
     """
@@ -2273,52 +4726,149 @@ def calculate_major_asteroids(year, month, day, hour, minute, second, lat, lon,
         "Psyche": 16
     }
     
-    asteroids = {}
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
+    bodies = {name: swe.AST_OFFSET + number for name, number in major_numbers.items()}
     
-    for name, number in major_numbers.items():
-        position = calculate_asteroid(number, year, month, day, hour, minute, second, timezone_str)
-        if position:
-            asteroids[name] = position
-    
-    return asteroids
+    return ephemeris_engine.chart(jd, bodies)
+
 
+# Theme scans only look for tight conjunctions
+THEME_ASPECT_TYPES = [("conjunction", 0, 3)]
 
-def scan_thematic_asteroids(natal_positions, house_data, theme, year, month, day, hour, minute, second, timezone_str):
+
+# Number of (theme, birth instant) position sets ThematicAsteroidScanner keeps
+THEMATIC_CACHE_SIZE = 1024
+
+
+class ThematicAsteroidScanner:
     """
-    Calculate all asteroids in a thematic group and check for aspects to natal planets
+    Thematic asteroid groups (love, career, healing, ...) from horoscope_database.json
+    Theme membership is read from the database once. Positions for every requested
+    theme are computed in one batched ephemeris call - asteroids without .se1 files
+    fall back to their astorb.dat orbit - and LRU-cached per (theme, birth instant).
     """
-    thematic_asteroids = {
-        "love_and_romance": {433: "Eros", 763: "Cupido", 1221: "Amor", 447: "Valentine", 80: "Sappho", 1388: "Aphrodite"},
-        "career_and_success": {19: "Fortuna", 151: "Abundantia"},
-        "spiritual_and_karmic": {3811: "Karma", 128: "Nemesis", 896: "Sphinx"},
-        "healing": {10: "Hygiea", 2878: "Panacea"},
-        "creative_arts": {7: "Iris", 22: "Kalliope", 27: "Euterpe", 62: "Erato", 81: "Terpsichore"}
-    }
-    
-    if theme not in thematic_asteroids:
-        return []
-    
-    results = []
-    
-    for ast_num, ast_name in thematic_asteroids[theme].items():
-        ast_pos = calculate_asteroid(ast_num, year, month, day, hour, minute, second, timezone_str)
+
+    def __init__(self, horoscope_db, cache_size=THEMATIC_CACHE_SIZE):
+        self.database = horoscope_db
+        groups = (horoscope_db.natal_chart().get("asteroids", {})
+                  .get("major_asteroids", {}).get("16", {}).get("thematic_groups", {}))
         
-        if not ast_pos:
-            continue
+        self.themes = {
+            theme: {
+                "description": info.get("description", f"Asteroids for theme: {theme}"),
+                "asteroids": {int(number): desc for number, desc in info.get("asteroids", {}).items()}
+            }
+            for theme, info in groups.items()
+        }
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def theme_positions(self, themes, jd):
+        """
+        {theme: {asteroid number: position dict}} for jd (UT), computing all uncached themes together
+        Asteroids that cannot be calculated are left out
+        """
+        jd_key = round(jd / JD_CACHE_QUANTUM)
+        missing_themes = [theme for theme in themes if (theme, jd_key) not in self.cache]
+        
+        if missing_themes:
+            numbers = sorted({number for theme in missing_themes for number in self.themes[theme]["asteroids"]})
+            rows = ephemeris_engine.positions([jd], [swe.AST_OFFSET + number for number in numbers])[0]
+            
+            # No .se1 file: use the astorb.dat elements instead
+            unavailable = np.isnan(rows["longitude"])
+            index = get_astorb_index(ephe_path) if unavailable.any() else None
+            if index is not None:
+                propagated = propagate_asteroids(index.select(np.array(numbers)[unavailable]), jd)
+                positions_by_number = {int(row["body"]) - swe.AST_OFFSET: row for row in propagated}
+                for i, number in enumerate(numbers):
+                    if unavailable[i] and number in positions_by_number:
+                        rows[i] = positions_by_number[number]
+            
+            positions = positions_to_dict(rows, numbers)
+            for theme in missing_themes:
+                self.cache[(theme, jd_key)] = {
+                    number: positions[number] for number in self.themes[theme]["asteroids"] if number in positions
+                }
+        
+        result = {}
+        for theme in themes:
+            self.cache.move_to_end((theme, jd_key))
+            result[theme] = self.cache[(theme, jd_key)]
+        
+        # Evict least recently used instants only after reading this request's entries
+        while len(self.cache) > max(self.cache_size, 0):
+            self.cache.popitem(last=False)
+        
+        return result
+
+    def scan(self, natal_positions, jd, themes=None, house_data=None):
+        """
+        Scan themes (default: all) for asteroids conjunct natal planets
+        Returns {theme: [{number, description, position, house, conjunctions: [(planet, orb)]}]}
+        """
+        themes = list(self.themes) if themes is None else [theme for theme in themes if theme in self.themes]
+        natal_names = list(natal_positions.keys())
+        natal_longitudes = [natal_positions[p]["longitude"] for p in natal_names]
         
-        # Check for conjunctions to natal planets (within 3° orb)
-        for planet_name, planet_data in natal_positions.items():
-            angle_diff = calculate_aspect_angle(ast_pos["longitude"], planet_data["longitude"])
+        results = {}
+        for theme, positions in self.theme_positions(themes, jd).items():
+            numbers = list(positions.keys())
+            houses = find_houses([positions[n]["longitude"] for n in numbers], house_data["cusps"]) if house_data else None
+            hits = find_aspects([positions[n]["longitude"] for n in numbers], natal_longitudes,
+                                aspect_types=THEME_ASPECT_TYPES)
             
-            if angle_diff <= 3:  # Conjunction
-                results.append({
-                    "asteroid_name": ast_name,
-                    "asteroid_number": ast_num,
-                    "asteroid_position": ast_pos,
-                    "natal_planet": planet_name,
-                    "aspect": "conjunction",
-                    "orb": angle_diff
-                })
+            conjunctions = {number: [] for number in numbers}
+            for hit in hits:
+                conjunctions[numbers[hit["i"]]].append((natal_names[hit["j"]], float(hit["orb"])))
+            
+            results[theme] = [
+                {
+                    "number": number,
+                    "description": self.themes[theme]["asteroids"][number],
+                    "position": positions[number],
+                    "house": int(houses[k]) if house_data else None,
+                    "conjunctions": conjunctions[number]
+                }
+                for k, number in enumerate(numbers)
+            ]
+        
+        return results
+
+
+# Scanner for the most recently used horoscope database
+thematic_scanner = None
+
+
+def get_thematic_scanner(horoscope_db):
+    global thematic_scanner
+    if thematic_scanner is None or thematic_scanner.database is not horoscope_db:
+        thematic_scanner = ThematicAsteroidScanner(horoscope_db)
+    return thematic_scanner
+
+
+def scan_thematic_asteroids(natal_positions, house_data, theme, year, month, day, hour, minute, second, timezone_str,
+                            horoscope_db=None):
+    """
+    Calculate all asteroids in a thematic group and check for conjunctions to natal planets
+    """
+    if horoscope_db is None:
+        horoscope_db = load_horoscope_database()
+    
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
+    scan = get_thematic_scanner(horoscope_db).scan(natal_positions, jd, [theme], house_data)
+    
+    results = []
+    for asteroid in scan.get(theme, []):
+        for planet_name, orb in asteroid["conjunctions"]:
+            results.append({
+                "asteroid_name": asteroid["description"].split(" - ")[0],
+                "asteroid_number": asteroid["number"],
+                "asteroid_position": asteroid["position"],
+                "natal_planet": planet_name,
+                "aspect": "conjunction",
+                "orb": orb
+            })
     
     return results
 
@@ -2328,29 +4878,12 @@ def calculate_fictitious_body(index, year, month, day, hour, minute, second, tim
     Calculate position of a fictitious planet defined in seorbel.txt.
     index is the 1-based index as in HYPOTHETICAL_BODY_MAP values.
     """
-    try:
-        tz = pytz.timezone(timezone_str)
-        local_dt = tz.localize(datetime(year, month, day, hour, minute, second))
-        utc_dt = local_dt.astimezone(pytz.UTC)
-        decimal_hour = utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0
-        jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, decimal_hour)
-
-        ipl = swe.FICT_OFFSET_1 + index  # Swiss Ephemeris fictitious planet index
+    jd = local_datetime_to_jd(year, month, day, hour, minute, second, timezone_str)
 
-        result, ret_flag = swe.calc_ut(jd, ipl, swe.FLG_SWIEPH)
-        longitude = result[0]
-        speed = result[3] if len(result) > 3 else 0.0
-        sign = get_zodiac_sign(longitude)
+    ipl = swe.FICT_OFFSET_1 + index  # Swiss Ephemeris fictitious planet index
 
-        return {
-            "longitude": longitude,
-            "sign": sign,
-            "degrees_in_sign": longitude % 30,
-            "speed": speed,
-            "retrograde": speed < 0
-        }
-    except Exception:
-        return None
+    chart = ephemeris_engine.chart(jd, {"fictitious": ipl})
+    return chart.get("fictitious")
 
 
 
@@ -2367,11 +4900,289 @@ def ordinal(n: int) -> str:
     return f"{n}th"
 
 
+# Batch mode: one birth record in, one JSON line out
+# Per-process state for batch runs (set up once by init_batch_worker)
+batch_state = {"store": None, "horoscope_db": None}
+
+
+def parse_birth_fields(record, prefix=""):
+    """
+    Read one person's birth data from a batch record
+    Accepts date/time strings ("1990-05-17", "14:30[:15]") or separate year..second fields
+    Returns (year, month, day, hour, minute, second, lat, lon, timezone) or None if absent
+    """
+    if record.get(f"{prefix}date"):
+        year, month, day = (int(part) for part in str(record[f"{prefix}date"]).split("-"))
+        time_parts = [int(part) for part in str(record.get(f"{prefix}time") or "12:00").split(":")]
+        hour, minute, second = (time_parts + [0, 0])[:3]
+    elif record.get(f"{prefix}year"):
+        year, month, day = (int(record[f"{prefix}{field}"]) for field in ("year", "month", "day"))
+        hour, minute, second = (int(record.get(f"{prefix}{field}") or 0) for field in ("hour", "minute", "second"))
+    else:
+        return None
+    
+    lat = float(record[f"{prefix}lat"])
+    lon = float(record[f"{prefix}lon"])
+    timezone_str = record.get(f"{prefix}timezone") or "UTC"
+    
+    return year, month, day, hour, minute, second, lat, lon, timezone_str
+
+
+class BatchInputError(dict):
+    """{"line", "error"} record yielded for an input line that could not be parsed"""
+
+
+def read_batch_records(stream, input_format="auto"):
+    """
+    Yield birth records as dicts from CSV (with a header row) or JSON lines
+    With input_format="auto" a first line starting with "{" means JSON lines;
+    a JSON line that does not parse yields a BatchInputError instead
+    """
+    lines = ((number, line) for number, line in enumerate(stream, 1) if line.strip())
+    first = next(lines, None)
+    if first is None:
+        return
+    
+    if input_format == "auto":
+        input_format = "jsonl" if first[1].lstrip().startswith("{") else "csv"
+    
+    if input_format == "jsonl":
+        for number, line in itertools.chain([first], lines):
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield BatchInputError(line=number, error=f"{type(e).__name__}: {e}")
+    else:
+        lines = (line for _, line in itertools.chain([first], lines))
+        yield from csv.DictReader(lines)
+
+
+def json_default(value):
+    """json.dumps fallback for numpy scalars and datetimes"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def init_batch_worker(store_path=None):
+    """Open the ephemeris files, chart store and horoscope database once per process"""
+    # Forked workers inherit the parent's open .se1 handles, which share one file
+    # offset; concurrent reads through them return corrupted positions
+    swe.close()
+    swe.set_ephe_path(ephe_path)
+    batch_state["store"] = ChartStore(store_path) if store_path else None
+    batch_state["horoscope_db"] = load_horoscope_database()
+
+
+def process_batch_record(record, transit_jd, months_ahead=0, readings=False, asteroid_orb=0.0,
+                         house_system=DEFAULT_HOUSE_SYSTEM, compare_houses=False, dst_policy=None):
+    """
+    Run one record through the natal, transit and (if partner fields are given) synastry pipeline
+    Birth times are converted with dst_policy (default: time_settings["dst_policy"])
+    Failures are reported in the result instead of stopping the batch
+    """
+    if isinstance(record, BatchInputError):
+        return dict(record)
+    
+    result = {"id": None}
+    
+    try:
+        if not isinstance(record, dict):
+            raise TypeError(f"record must be a JSON object, not {type(record).__name__}")
+        result["id"] = record.get("id")
+        
+        birth = parse_birth_fields(record)
+        if birth is None:
+            raise ValueError("record has no date or year field")
+        
+        natal_jd = local_datetime_to_jd(*birth[:6], birth[8], dst_policy)
+        natal_positions, house_data = load_or_calculate_natal_chart(*birth, store=batch_state["store"],
+                                                                    house_system=house_system, dst_policy=dst_policy)
+        result["natal"] = {
+            "positions": natal_positions,
+            "houses": house_data,
+            "house_system_used": house_data["house_system"],
+            "aspects": detect_aspects(natal_positions),
+        }
+        
+        if compare_houses:
+            systems = calculate_house_systems_for_jd(natal_jd, birth[6], birth[7])
+            result["house_systems"] = {
+                row["system"].decode(): None if np.isnan(row["ascendant"]) else house_system_data(row)
+                for row in systems
+            }
+        
+        current_positions = ephemeris_engine.chart(transit_jd)
+        result["transits"] = calculate_transits_to_natal(
+            current_positions, natal_positions, house_data, batch_state["horoscope_db"]
+        )
+        
+        if months_ahead > 0:
+            events = predict_transit_events(natal_positions, transit_jd, transit_jd + months_ahead * 30)
+            for event in events:
+                natal_longitude = natal_positions[event["natal_planet"]]["longitude"]
+                event["house"] = find_house_for_planet(natal_longitude, house_data["cusps"])
+            result["upcoming_transits"] = events
+        
+        if asteroid_orb > 0:
+            result["asteroid_conjunctions"] = sweep_asteroid_conjunctions(natal_positions, natal_jd, orb=asteroid_orb)
+        
+        partner = parse_birth_fields(record, prefix="partner_")
+        if partner is not None:
+            partner_positions = ephemeris_engine.chart(local_datetime_to_jd(*partner[:6], partner[8], dst_policy))
+            result["synastry"] = calculate_synastry_aspects(natal_positions, [partner_positions])[0]
+        
+        if readings:
+            result["reading"] = generate_natal_chart_reading(natal_positions, house_data, batch_state["horoscope_db"])
+    
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    
+    return result
+
+
+# Records per task sent to a ChartPool worker
+CHART_POOL_BATCH_SIZE = 32
+
+
+def run_chart_batch(function, items):
+    """Worker side of ChartPool: apply function to one batch of items"""
+    return [function(item) for item in items]
+
+
+def calculate_natal_chart_job(birth, readings=True, house_system=DEFAULT_HOUSE_SYSTEM, dst_policy=None):
+    """
+    Natal chart for one (year, month, day, hour, minute, second, lat, lon, timezone) tuple
+    Returns {"positions", "houses", "reading"}; runs inside a ChartPool worker
+    """
+    natal_positions, house_data = load_or_calculate_natal_chart(*birth, store=batch_state["store"],
+                                                                house_system=house_system, dst_policy=dst_policy)
+    
+    result = {"positions": natal_positions, "houses": house_data}
+    if readings:
+        result["reading"] = generate_natal_chart_reading(natal_positions, house_data, batch_state["horoscope_db"])
+    return result
+
+
+class ChartPool:
+    """
+    Pool of chart worker processes
+    Every worker opens its own ephemeris files, chart store and horoscope database
+    once (init_batch_worker). Items are sent in batches and results come back in
+    input order; at most max_in_flight batches are outstanding, so a huge or
+    endless input is only read as fast as the workers keep up.
+    With workers=1 everything runs in the calling process. dst_policy applies to
+    natal_charts; it is passed with each job, never set process-wide.
+    """
+
+    def __init__(self, workers=None, store_path=None, batch_size=CHART_POOL_BATCH_SIZE, max_in_flight=None,
+                 dst_policy=None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight or self.workers * 2
+        self.dst_policy = dst_policy
+        
+        if self.workers > 1:
+            self.pool = multiprocessing.Pool(self.workers, initializer=init_batch_worker, initargs=(store_path,))
+        else:
+            self.pool = None
+            init_batch_worker(store_path)
+
+    def imap(self, function, items):
+        """
+        Yield function(item) for every item, in order
+        function must be a module-level callable (or functools.partial of one)
+        """
+        items = iter(items)
+        
+        if self.pool is None:
+            for item in items:
+                yield function(item)
+            return
+        
+        pending = deque()
+        while True:
+            batch = list(itertools.islice(items, self.batch_size))
+            if batch:
+                pending.append(self.pool.apply_async(run_chart_batch, (function, batch)))
+            
+            # Backpressure: wait on the oldest batch before reading further
+            if pending and (len(pending) >= self.max_in_flight or not batch):
+                yield from pending.popleft().get()
+            
+            if not batch and not pending:
+                return
+
+    def natal_charts(self, births, readings=True, house_system=DEFAULT_HOUSE_SYSTEM):
+        """calculate_natal_chart_job over an iterable of birth tuples, in order"""
+        return self.imap(functools.partial(calculate_natal_chart_job, readings=readings, house_system=house_system,
+                                           dst_policy=self.dst_policy), births)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        elif batch_state["store"] is not None:
+            batch_state["store"].close()
+            batch_state["store"] = None
+
+    def terminate(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        else:
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+def run_batch(input_stream, output_stream, workers=1, store_path=None, transit_date=None,
+              months_ahead=0, readings=False, input_format="auto", asteroid_orb=0.0,
+              house_system=DEFAULT_HOUSE_SYSTEM, compare_houses=False, dst_policy=None):
+    """
+    Stream records from input_stream to JSON lines on output_stream, in input order
+    Records go through a ChartPool, so memory stays bounded on very large inputs
+    Returns the number of records processed
+    """
+    if transit_date is None:
+        transit_date = datetime.now(pytz.UTC)
+    transit_jd = datetime_to_jd(transit_date)
+    
+    process = functools.partial(process_batch_record, transit_jd=transit_jd,
+                                months_ahead=months_ahead, readings=readings, asteroid_orb=asteroid_orb,
+                                house_system=house_system, compare_houses=compare_houses, dst_policy=dst_policy)
+    records = read_batch_records(input_stream, input_format)
+    count = 0
+    
+    with ChartPool(workers, store_path, dst_policy=dst_policy) as pool:
+        for result in pool.imap(process, records):
+            output_stream.write(json.dumps(result, default=json_default, ensure_ascii=False) + "\n")
+            count += 1
+            if count % pool.batch_size == 0:
+                output_stream.flush()
+    
+    output_stream.flush()
+    return count
+
+
 def main():
     try:
         """Main function"""
         # Load horoscope database
         horoscope_db = load_horoscope_database()
+        db_stats = horoscope_db.load_stats()
+        print(f"📚 Horoscope database ready ({db_stats['source']}, {db_stats['load_seconds'] * 1000:.1f} ms)")
 
         print("=" * 70)
         print("PERSONALIZED ASTROLOGICAL TRANSIT CALCULATOR")
@@ -2405,6 +5216,30 @@ def main():
 
         birth_tz = input("Birth timezone (e.g., UTC, Europe/London, America/New_York): ").strip() or "UTC"
 
+        dst_status = local_time_dst_status(natal_year, natal_month, natal_day, natal_hour, natal_minute, 0, birth_tz)
+        dst_policy = time_settings["dst_policy"]
+        if dst_policy == "raise":
+            dst_reading = "it cannot be converted under the 'raise' DST policy"
+        elif dst_status == "ambiguous":
+            dst_reading = f"reading it as {dst_policy} time"
+        else:
+            dst_reading = f"reading it on {dst_policy} time"
+        if dst_status == "ambiguous":
+            print(f"⚠ {natal_hour:02d}:{natal_minute:02d} happened twice that day in {birth_tz} (clocks went back) "
+                  f"- {dst_reading}")
+        elif dst_status == "nonexistent":
+            print(f"⚠ {natal_hour:02d}:{natal_minute:02d} was skipped that day in {birth_tz} (clocks went forward) "
+                  f"- {dst_reading}")
+
+        # House system
+        print("\n🏠 HOUSE SYSTEM")
+        print("-" * 70)
+        print("  " + ", ".join(f"{code} = {name}" for code, name in HOUSE_SYSTEMS.items()))
+        house_system = input("House system (press Enter for Placidus): ").strip().upper() or DEFAULT_HOUSE_SYSTEM
+        if house_system not in HOUSE_SYSTEMS:
+            print(f"⚠ Unknown house system '{house_system}' - using Placidus")
+            house_system = DEFAULT_HOUSE_SYSTEM
+
         # Auto-calculate Sun and Moon signs from birth data
         print("\n⭐ Calculating your natal Sun and Moon signs...")
         natal_sun_sign, natal_moon_sign = calculate_natal_positions(
@@ -2551,6 +5386,15 @@ def main():
 
         print(f"\n✓ Collected {len(search_name)} names to search\n")
 
+        # Ask about the whole-catalog sweep (needs astorb.dat)
+        do_catalog_sweep = 'n'
+        if os.path.exists(os.path.join(ephe_path, "astorb.dat")):
+            print("\n" + "=" * 70)
+            print("ASTEROID CATALOG SWEEP (Optional)")
+            print("-" * 70)
+            print("Find every named asteroid within 1° of your natal planets")
+            do_catalog_sweep = input("Would you like to sweep the full asteroid catalog? (y/n): ").lower().strip()
+
         # Ask about Thematic Asteroid Scanning
         print("\n" + "=" * 70)
         print("THEMATIC ASTEROID SCANNER (Optional)")
@@ -2561,29 +5405,21 @@ def main():
 
         selected_themes = []
         if do_thematic == 'y':
+            theme_keys = list(get_thematic_scanner(horoscope_db).themes)
+
             print("\nAvailable themes:")
-            print("1. Love & Romance")
-            print("2. Career & Success")
-            print("3. Spiritual & Karmic")
-            print("4. Healing")
-            print("5. Creative Arts")
+            for number, theme_key in enumerate(theme_keys, 1):
+                print(f"{number}. {theme_key.replace('_and_', ' & ').replace('_', ' ').title()}")
             print("A. All themes")
 
-            theme_choice = input("\nSelect themes (1-5, A for all, or comma-separated): ").strip().upper()
+            theme_choice = input(f"\nSelect themes (1-{len(theme_keys)}, A for all, or comma-separated): ").strip().upper()
 
             if theme_choice == 'A':
-                selected_themes = ["love_and_romance", "career_and_success", "spiritual_and_karmic", "healing", "creative_arts"]
+                selected_themes = theme_keys
             else:
-                theme_map = {
-                    "1": "love_and_romance",
-                    "2": "career_and_success",
-                    "3": "spiritual_and_karmic",
-                    "4": "healing",
-                    "5": "creative_arts"
-                }
                 for choice in theme_choice.replace(",", " ").split():
-                    if choice in theme_map:
-                        selected_themes.append(theme_map[choice])
+                    if choice.isdigit() and 1 <= int(choice) <= len(theme_keys):
+                        selected_themes.append(theme_keys[int(choice) - 1])
 
         # Get transit time (current positions)
         print("\n" + "=" * 70)
@@ -2612,9 +5448,13 @@ def main():
         # Calculate natal houses
         house_data = calculate_houses(
             natal_year, natal_month, natal_day, natal_hour, natal_minute, 0,
-            birth_lat, birth_lon, birth_tz
+            birth_lat, birth_lon, birth_tz, house_system
         )
 
+        # Natal moment and positions, shared by every section below
+        natal_jd = local_datetime_to_jd(natal_year, natal_month, natal_day, natal_hour, natal_minute, 0, birth_tz)
+        natal_chart_positions = ephemeris_engine.chart(natal_jd)
+
         # Calculate current planetary positions
         current_positions = calculate_planetary_positions(
             transit_year, transit_month, transit_day, 
@@ -2624,16 +5464,22 @@ def main():
         # Generate natal chart reading if requested
         if do_natal == 'y':
             print("\n⏳ Calculating natal chart...")
-            natal_chart_positions = calculate_full_natal_chart(
-                natal_year, natal_month, natal_day, natal_hour, natal_minute, 0,
-                birth_lat, birth_lon, birth_tz
-            )
-
             natal_reading = generate_natal_chart_reading(
                 natal_chart_positions, house_data, horoscope_db
             )
             print(natal_reading)
 
+            # Every supported house system for the same birth moment, side by side
+            house_systems = calculate_house_systems(
+                natal_year, natal_month, natal_day, natal_hour, natal_minute, 0,
+                birth_lat, birth_lon, birth_tz
+            )
+            print(f"\n{'=' * 70}")
+            print(f"HOUSE SYSTEMS COMPARED (your chart uses {HOUSE_SYSTEMS[house_system]})")
+            print(f"{'=' * 70}\n")
+            print(format_house_system_comparison(house_systems))
+            print(f"\n{'=' * 70}\n")
+
             # ADD CHIRON READING (separate from main chart)
             print("\n⏳ Calculating Chiron placement...")
             chiron_data = calculate_chiron(
@@ -2644,8 +5490,8 @@ def main():
                 chiron_sign = chiron_data["sign"]
                 chiron_deg = chiron_data["degrees_in_sign"]
 
-                chiron_desc = horoscope_db.get("natal_chart", {}).get("chiron", {}).get("description", "")
-                chiron_interp = horoscope_db.get("natal_chart", {}).get("chiron", {}).get("chiron_in_sign", {}).get(
+                chiron_desc = horoscope_db.natal_chart().get("chiron", {}).get("description", "")
+                chiron_interp = horoscope_db.natal_chart().get("chiron", {}).get("chiron_in_sign", {}).get(
                     chiron_sign, "Chiron in this sign indicates a unique wound and healing gift."
                 )
 
@@ -2660,15 +5506,19 @@ def main():
             # FIXED STARS
             print("\n⏳ Checking for fixed star conjunctions...")
             fixed_star_conjunctions = detect_fixed_star_conjunctions(
-                natal_chart_positions, house_data, horoscope_db
+                natal_chart_positions, house_data, horoscope_db, jd=natal_jd, full_catalog=True
             )
+            
+            # Stars only in sefstars.txt have no interpretation - list them briefly
+            catalog_only = [c for c in fixed_star_conjunctions if "interpretation" not in c["star_data"]]
+            fixed_star_conjunctions = [c for c in fixed_star_conjunctions if "interpretation" in c["star_data"]]
 
             if fixed_star_conjunctions:
                 print(f"\n{'=' * 70}")
                 print(f"FIXED STARS - Ancient Celestial Influences")
                 print(f"{'=' * 70}\n")
 
-                stars_desc = horoscope_db.get("natal_chart", {}).get("fixed_stars", {}).get("description", "")
+                stars_desc = horoscope_db.fixed_stars().get("description", "")
                 print(f"{stars_desc}\n")
 
                 for conjunction in fixed_star_conjunctions:
@@ -2687,6 +5537,14 @@ def main():
                 print(f"{'=' * 70}\n")
             else:
                 print("ℹ No major fixed star conjunctions found in your chart (within 1° orb).\n")
+            
+            if catalog_only:
+                print("**Other catalog stars within 1°:**")
+                for conjunction in catalog_only:
+                    nomenclature = conjunction["star_data"].get("nomenclature", "")
+                    print(f"• {conjunction['star']} ({nomenclature}) conjunct {conjunction['planet']} "
+                          f"(within {conjunction['orb']:.2f}°)")
+                print()
 
             # SABIAN SYMBOLS
             print("\n⏳ Calculating Sabian Symbols for key placements...")
@@ -2695,7 +5553,7 @@ def main():
             print(f"SABIAN SYMBOLS - The Oracular Degrees")
             print(f"{'=' * 70}\n")
 
-            sabian_desc = horoscope_db.get("natal_chart", {}).get("sabian_symbols", {}).get(
+            sabian_desc = horoscope_db.sabian_symbols().get(
                 "description", "Each of the 360 degrees has a unique symbolic meaning."
             )
             print(f"{sabian_desc}\n")
@@ -2708,7 +5566,7 @@ def main():
             print(f"SABIAN SYMBOLS - The Oracular Degrees")
             print(f"{'=' * 70}\n")
 
-            sabian_desc = horoscope_db.get("natal_chart", {}).get("sabian_symbols", {}).get(
+            sabian_desc = horoscope_db.sabian_symbols().get(
                 "description", "Each of the 360 degrees has a unique symbolic meaning."
             )
             print(f"{sabian_desc}\n")
@@ -2779,7 +5637,7 @@ def main():
 
             # ADD LUNAR PHASE
             lunar_phase, phase_angle = calculate_lunar_phase_at_birth(natal_chart_positions)
-            phase_info = horoscope_db.get("natal_chart", {}).get("lunar_phases", {}).get(lunar_phase, {})
+            phase_info = horoscope_db.natal_chart().get("lunar_phases", {}).get(lunar_phase, {})
 
             print(f"\n{'=' * 70}")
             print(f"LUNAR PHASE AT BIRTH")
@@ -2787,6 +5645,19 @@ def main():
             print(f"**{phase_info.get('phase', 'Unknown')}** ({phase_angle:.1f}° from Sun)")
             print(f"*{phase_info.get('keywords', '')}*\n")
             print(f"{phase_info.get('interpretation', '')}\n")
+            
+            # Prenatal lunation and eclipse from the lunation calendar
+            lunation_calendar = get_lunation_calendar(build=False)
+            if lunation_calendar is not None and lunation_calendar.covers(natal_jd):
+                syzygy = lunation_calendar.previous_lunation(natal_jd)
+                eclipse = lunation_calendar.previous_eclipse(natal_jd)
+                if syzygy:
+                    syzygy_name = "New Moon" if syzygy["phase"] == "new_moon" else "Full Moon"
+                    print(f"**Prenatal {syzygy_name}:** {syzygy['sign']} {syzygy['degrees_in_sign']:.1f}° "
+                          f"on {syzygy['date'].strftime('%B %d, %Y')}")
+                if eclipse:
+                    print(f"**Prenatal Eclipse:** {eclipse['type'].title()} {eclipse['eclipse']} eclipse in "
+                          f"{eclipse['sign']} {eclipse['degrees_in_sign']:.1f}° on {eclipse['date'].strftime('%B %d, %Y')}\n")
             print(f"{'=' * 70}\n")
 
         # TRANSITS TO NATAL CHART
@@ -2810,7 +5681,7 @@ def main():
                     house = transit["natal_house"]
 
                     # Get interpretation
-                    transit_interp = horoscope_db.get("natal_chart", {}).get("transits", {}).get(aspect, {}).get(
+                    transit_interp = horoscope_db.natal_chart().get("transits", {}).get(aspect, {}).get(
                         trans_planet, f"This transit activates your natal {natal_planet}."
                     )
 
@@ -2841,7 +5712,8 @@ def main():
                     aspect = prediction["aspect"]
                     house = prediction["house"]
 
-                    print(f"**{date}**: {trans} {aspect.title()} Natal {natal} (House {house})")
+                    passes = f", pass {prediction['pass']} of {prediction['passes']}" if prediction["passes"] > 1 else ""
+                    print(f"**{date}**: {trans} {aspect.title()} Natal {natal} (House {house}{passes})")
 
                 print(f"\n{'=' * 70}\n")
 
@@ -2854,12 +5726,12 @@ def main():
                 birth_lat, birth_lon, birth_tz
             )
 
-            asteroid_desc = horoscope_db.get("natal_chart", {}).get("asteroids", {}).get(
+            asteroid_desc = horoscope_db.natal_chart().get("asteroids", {}).get(
                 "description", "Asteroids add nuanced archetypal energies to your chart."
             )
             print(f"{asteroid_desc}\n")
 
-            major_data = horoscope_db.get("natal_chart", {}).get("asteroids", {}).get("major_asteroids", {})
+            major_data = horoscope_db.natal_chart().get("asteroids", {}).get("major_asteroids", {})
 
         # Major asteroid search results
         if do_major_asteroids == 'y':
@@ -2871,10 +5743,10 @@ def main():
             print("=" * 70 + "\n")
 
             # Get description from JSON
-            asteroid_desc = horoscope_db.get("natal_chart", {}).get("asteroids", {}).get("description", "")
+            asteroid_desc = horoscope_db.natal_chart().get("asteroids", {}).get("description", "")
             print(f"{asteroid_desc}\n\n")
 
-            major_data = horoscope_db.get("natal_chart", {}).get("asteroids", {}).get("major_asteroids", {})
+            major_data = horoscope_db.natal_chart().get("asteroids", {}).get("major_asteroids", {})
 
         for ast_name, ast_position in major_asteroids.items():
             sign = ast_position["sign"]
@@ -2981,117 +5853,69 @@ def main():
 
         print("=" * 70 + "\n")
 
-        # Themmatic Asteroid Scan
-        if selected_themes:
-            print("\n" + "="*70)
-            print("THEMATIC ASTEROID SCAN")
-            print("="*70 + "\n")
-
-            # ADD THIS LINE - load themes data from JSON
-            themes_data = horoscope_db.get("natal_chart", {}).get("asteroids", {}).get("major_asteroids", {}).get("16", {}).get("thematic_groups", {})
-
-            any_success = False
-            for theme_key in selected_themes:
-                theme_info = themes_data.get(theme_key, {})
-                print(f"🔮 {theme_info.get('description', theme_key)}\n")
-
-                theme_asteroids = theme_info.get("asteroids", {})
-                theme_success = False
-
-                for ast_num_str, ast_desc in theme_asteroids.items():
-                    ast_num = int(ast_num_str)
-                    pos = calculate_asteroid(ast_num, natal_year, natal_month, natal_day, natal_hour, natal_minute, 0, birth_tz)
-
-                    if pos:
-                        any_success = theme_success = True
-                        house = find_house_for_planet(pos["longitude"], house_data["cusps"])
-                        print(f"  **{ast_desc}**")
-                        print(f"    ↳ {pos['sign']} {pos['degrees_in_sign']:.1f}° (House {house})\n")
-                    else:
-                        print(f"  **{ast_desc}** (#{ast_num})")
-                        print(f"    ↳ ⚠️ Ephemeris not available\n")
-
-                if not theme_success:
-                    print("  (No positions calculated - add .se1 files manually for full results)\n")
-                print()
-
-            if not any_success:
-                print("💡 TIP: Download specific .se1 files from Dropbox /long_ast/ast0/ for full thematic analysis")
+        # Whole-catalog asteroid sweep
+        if do_catalog_sweep == 'y':
+            print("\n" + "=" * 70)
+            print("ASTEROID CATALOG SWEEP")
+            print("=" * 70 + "\n")
+            print("⏳ Sweeping the asteroid catalog...")
 
-            print("="*70 + "\n")
+            conjunctions = sweep_asteroid_conjunctions(natal_chart_positions, natal_jd, orb=1.0)
 
+            print(f"✓ {len(conjunctions)} named asteroids within 1° of your natal planets\n")
+            for planet_name in natal_chart_positions:
+                planet_hits = [hit for hit in conjunctions if hit["natal_planet"] == planet_name]
+                if planet_hits:
+                    closest = ", ".join(f"{hit['name']} (#{hit['number']}, {hit['orb']:.2f}°)" for hit in planet_hits[:5])
+                    print(f"  **{planet_name}** - {len(planet_hits)} asteroids, closest: {closest}")
 
-        # THEMATIC SCAN RESULTS  
-        if selected_themes:
-            print("\n======================================================================")
-            print("THEMATIC ASTEROID SCAN")
-            print("======================================================================\n")
+            print("\n  Positions come from astorb.dat orbital elements, so expect small")
+            print("  errors for birth dates far from the catalog epoch.")
+            print("=" * 70 + "\n")
 
+        # Thematic asteroid scan
         if selected_themes:
             print("\n" + "=" * 70)
             print("THEMATIC ASTEROID SCAN")
             print("=" * 70 + "\n")
 
-        # CALCULATE NATAL POSITIONS FOR ASPECT CHECKING
-        natal_chart_positions = calculate_full_natal_chart(natal_year, natal_month, natal_day, natal_hour, natal_minute, 0, birth_lat, birth_lon, birth_tz)
-
-        themes_data = horoscope_db.get("natal_chart", {}).get("asteroids", {}).get("major_asteroids", {}).get("16", {}).get("thematic_groups", {})
-
-        for theme_key in selected_themes:
-            theme_info = themes_data.get(theme_key, {})
-            theme_desc = theme_info.get("description", f"Asteroids for theme: {theme_key}")
+            scanner = get_thematic_scanner(horoscope_db)
+            theme_scan = scanner.scan(natal_chart_positions, natal_jd, selected_themes, house_data)
 
-            print(f"🔮 {theme_desc}\n")
-
-            theme_asteroids = theme_info.get("asteroids", {})
-
-            if theme_asteroids:
-                found_any = False
-
-                for ast_num_str, ast_desc in theme_asteroids.items():
-                    ast_num = int(ast_num_str)
-
-                    # Calculate the asteroid position
-                    ast_pos = calculate_asteroid(ast_num, natal_year, natal_month, natal_day, natal_hour, natal_minute, 0, birth_tz)
-
-                    if ast_pos:
-                        found_any = True
-                        house = find_house_for_planet(ast_pos["longitude"], house_data["cusps"])
-                        retro = " ℞" if ast_pos["retrograde"] else ""
+            for theme_key in selected_themes:
+                print(f"🔮 {scanner.themes[theme_key]['description']}\n")
 
-                        print(f"  **{ast_desc}**")
-                        print(f"    ↳ {ast_pos['sign']} {ast_pos['degrees_in_sign']:.1f}°{retro} in House {house}")
+                for asteroid in theme_scan.get(theme_key, []):
+                    ast_pos = asteroid["position"]
+                    house = asteroid["house"]
+                    retro = " ℞" if ast_pos["retrograde"] else ""
 
-                        # Check for conjunctions to natal planets
-                        aspects_found = []
-                        # Try this first - most likely:
-                        # Maybe it's called this:
-                        for planet_name, planet_data in natal_chart_positions.items():
-                            angle_diff = calculate_aspect_angle(ast_pos["longitude"], planet_data["longitude"])
-                            if angle_diff <= 3:  # Tight 3° conjunction
-                                aspects_found.append(f"conjunct your natal {planet_name}")
+                    print(f"  **{asteroid['description']}**")
+                    print(f"    ↳ {ast_pos['sign']} {ast_pos['degrees_in_sign']:.1f}°{retro} in House {house}")
 
-                        if aspects_found:
-                            print(f"    ✨ {', '.join(aspects_found)} - highly significant!")
+                    if asteroid["conjunctions"]:
+                        aspects_found = [f"conjunct your natal {planet_name}" for planet_name, _ in asteroid["conjunctions"]]
+                        print(f"    ✨ {', '.join(aspects_found)} - highly significant!")
 
-                        # Add house meaning
-                        house_info = HOUSE_MEANINGS.get(house, {})
-                        if house_info:
-                            print(f"    This asteroid activates your {house}th house of {house_info.get('description', 'life')}.")
+                    # Add house meaning
+                    house_info = HOUSE_MEANINGS.get(house, {})
+                    if house_info:
+                        print(f"    This asteroid activates your {house}th house of {house_info.get('description', 'life')}.")
 
-                        print()
+                    print()
 
-                if not found_any:
+                if not theme_scan.get(theme_key):
                     print(f"  (No asteroids in this theme could be calculated from available data)\n")
-            else:
-                print(f"  (Theme data not available in database)\n")
 
-            print()
+                print()
 
-        print("=" * 70 + "\n")
+            if not any(theme_scan.get(theme_key) for theme_key in selected_themes):
+                print("💡 TIP: Download specific .se1 files from Dropbox /long_ast/ast0/ for full thematic analysis")
+
+            print("=" * 70 + "\n")
 
         # HYPOTHETICAL / FICTITIOUS BODIES (FUN SECTION)
-        hypo_cfg = horoscope_db.get("natal_chart", {}).get("hypothetical_bodies", {})
+        hypo_cfg = horoscope_db.natal_chart().get("hypothetical_bodies", {})
         hypo_desc = hypo_cfg.get("description", "")
         hypo_bodies = hypo_cfg.get("bodies", {})
 
@@ -3189,7 +6013,7 @@ def main():
 
             sr_date, sr_positions, sr_houses = calculate_solar_return(
                 natal_year, natal_month, natal_day, solar_return_year,
-                natal_sun_long, birth_lat, birth_lon, birth_tz
+                natal_sun_long, birth_lat, birth_lon, birth_tz, house_system
             )
 
             if sr_date and sr_positions and sr_houses:
@@ -3199,7 +6023,7 @@ def main():
                 print(f"Valid from Birthday {solar_return_year} to Birthday {solar_return_year + 1}")
                 print(f"{'=' * 70}\n")
 
-                sr_desc = horoscope_db.get("natal_chart", {}).get("solar_return", {}).get(
+                sr_desc = horoscope_db.natal_chart().get("solar_return", {}).get(
                     "interpretation", 
                     "Your Solar Return chart shows the themes and energies of your current year."
                 )
@@ -3253,6 +6077,20 @@ def main():
                             meaning = house_meanings.get(house, "this life area")
                             print(f"• **House {house}** ({count} planets): Focus on {meaning}")
 
+                # Lunar returns over the Solar Return year, each with its own chart
+                lunar_returns = calculate_lunar_returns(
+                    natal_chart_positions["Moon"]["longitude"], datetime_to_jd(sr_date),
+                    years=1, lat=birth_lat, lon=birth_lon, house_system=house_system
+                )
+                if lunar_returns:
+                    print(f"\n**Lunar Returns This Year** (monthly emotional reset):\n")
+                    for lunar_return in lunar_returns:
+                        lr_date = lunar_return["date"].astimezone(get_timezone(birth_tz))
+                        lr_asc = lunar_return["houses"]["ascendant"]["sign"]
+                        lr_moon_house = find_house_for_planet(natal_chart_positions["Moon"]["longitude"],
+                                                              lunar_return["houses"]["cusps"])
+                        print(f"• {lr_date.strftime('%b %d, %Y %I:%M %p')}: {lr_asc} rising, Moon in House {lr_moon_house}")
+
                 print(f"\n{'=' * 70}\n")
             else:
                 print("⚠ Could not calculate Solar Return. Please check your birth data.\n")
@@ -3273,7 +6111,7 @@ def main():
                 print(f"Your Age: {int(age_years)} years")
                 print(f"{'=' * 70}\n")
 
-                prog_desc = horoscope_db.get("natal_chart", {}).get("progressions", {}).get(
+                prog_desc = horoscope_db.natal_chart().get("progressions", {}).get(
                     "interpretation",
                     "Secondary progressions show your psychological development."
                 )
@@ -3310,6 +6148,32 @@ def main():
                     print(f"Your emotional needs and security focus are currently colored by {prog_moon_sign}.")
                     print(f"The progressed Moon changes signs roughly every 2.5 years, showing evolving emotional themes.\n")
 
+                # Life chapters: progressed milestones over the coming decade
+                timeline = calculate_progression_timeline(natal_jd, natal_chart_positions, years=age_years + 10)
+                lunar_phase_info = horoscope_db.natal_chart().get("lunar_phases", {})
+
+                chapters = [e for e in timeline["ingresses"] + timeline["lunar_phases"] if e["age"] >= age_years]
+                coming_aspects = [e for e in timeline["aspects"] if age_years <= e["age"] < age_years + 1]
+
+                if chapters:
+                    print(f"**Life Chapters - The Next 10 Years:**\n")
+                    for event in sorted(chapters, key=lambda e: e["jd"]):
+                        when = event["date"].strftime('%B %Y')
+                        if "phase" in event:
+                            phase_name = lunar_phase_info.get(event["phase"], {}).get("phase", event["phase"].replace("_", " ").title())
+                            print(f"• {when} (age {event['age']:.1f}): progressed lunation enters the {phase_name} phase")
+                        else:
+                            retro = " ℞" if event["retrograde"] else ""
+                            print(f"• {when} (age {event['age']:.1f}): progressed {event['planet']}{retro} enters {event['sign']}")
+                    print()
+
+                if coming_aspects:
+                    print(f"**Progressed Aspects Perfecting This Year:**\n")
+                    for event in coming_aspects:
+                        print(f"• {event['date'].strftime('%B %Y')}: progressed {event['progressed_planet']} "
+                              f"{event['aspect']} natal {event['natal_planet']}")
+                    print()
+
                 print(f"{'=' * 70}\n")
 
         # ADD RELOCATION CHART
@@ -3318,7 +6182,7 @@ def main():
 
             reloc_positions, reloc_houses = calculate_relocation_chart(
                 natal_year, natal_month, natal_day, natal_hour, natal_minute,
-                birth_tz, relocation_data["lat"], relocation_data["lon"], relocation_data["tz"]
+                birth_tz, relocation_data["lat"], relocation_data["lon"], relocation_data["tz"], house_system
             )
 
             print(f"\n{'=' * 70}")
@@ -3400,8 +6264,8 @@ def main():
         print(f"VOID OF COURSE MOON")
         print(f"{'=' * 70}\n")
 
-        voc_desc = horoscope_db.get("natal_chart", {}).get("void_of_course_moon", {}).get("description", "")
-        voc_advice = horoscope_db.get("natal_chart", {}).get("void_of_course_moon", {}).get("advice", "")
+        voc_desc = horoscope_db.natal_chart().get("void_of_course_moon", {}).get("description", "")
+        voc_advice = horoscope_db.natal_chart().get("void_of_course_moon", {}).get("advice", "")
 
         if is_void:
             print("⚠ **The Moon is currently VOID OF COURSE**\n")
@@ -3429,8 +6293,12 @@ def main():
         print("YOUR PERSONALIZED ASTROLOGICAL READING")
         print("=" * 70)
 
+        transit_jd = local_datetime_to_jd(
+            transit_year, transit_month, transit_day,
+            transit_hour, transit_minute, transit_second, transit_tz
+        )
         reading = generate_personalized_reading(
-            current_positions, house_data, natal_sun_sign, natal_moon_sign, horoscope_db
+            current_positions, house_data, natal_sun_sign, natal_moon_sign, horoscope_db, jd=transit_jd
         )
 
         print(f"\n{reading}\n")
@@ -3447,5 +6315,87 @@ def main():
         input("\n\nPress ENTER to exit...")
 
 
+def parse_command_line(argv=None):
+    """
+    Command line: no arguments runs the interactive calculator,
+    "batch" processes birth records headless
+    """
+    parser = argparse.ArgumentParser(description="Personalized astrological transit calculator")
+    parser.add_argument("--build-daily-table", action="store_true",
+                        help="precompute the daily planet table used by the transit search, then exit")
+    parser.add_argument("--build-station-calendar", action="store_true",
+                        help="recompute the retrograde station and sign ingress calendar, then exit")
+    parser.add_argument("--build-lunation-calendar", action="store_true",
+                        help="recompute the lunation and eclipse calendar, then exit")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    batch = subparsers.add_parser(
+        "batch", help="read birth records (CSV or JSON lines) and write one JSON result per line",
+        description="Fields: id, date (YYYY-MM-DD) or year/month/day, time (HH:MM[:SS]) or hour/minute/second, "
+                    "lat, lon, timezone; add the same fields with a partner_ prefix for synastry."
+    )
+    batch.add_argument("--input", default="-", help="input file (default: stdin)")
+    batch.add_argument("--output", default="-", help="output file (default: stdout)")
+    batch.add_argument("--format", choices=["auto", "csv", "jsonl"], default="auto", help="input format")
+    batch.add_argument("--workers", type=int, default=1, help="worker processes; 0 uses every core (default: 1)")
+    batch.add_argument("--store", nargs="?", const=CHART_STORE_PATH, default=None,
+                       help=f"cache natal charts in a chart store (default path: {CHART_STORE_PATH})")
+    batch.add_argument("--transit-date", help="ISO date/time in UTC for transits (default: now)")
+    batch.add_argument("--months-ahead", type=int, default=0,
+                       help="also list exact transit events over this many months")
+    batch.add_argument("--readings", action="store_true", help="include the natal chart reading text")
+    batch.add_argument("--asteroid-sweep", type=float, default=0.0, metavar="ORB",
+                       help="list every named astorb.dat asteroid within ORB degrees of a natal planet")
+    batch.add_argument("--house-system", choices=list(HOUSE_SYSTEMS), default=DEFAULT_HOUSE_SYSTEM,
+                       help="house system code: " + ", ".join(f"{code} {name}" for code, name in HOUSE_SYSTEMS.items()))
+    batch.add_argument("--compare-houses", action="store_true",
+                       help="also include the cusps of every supported house system")
+    batch.add_argument("--dst-policy", choices=DST_POLICIES, default=time_settings["dst_policy"],
+                       help="birth times inside a daylight-saving change: read as standard or daylight time, "
+                            "or report the record as an error (default: standard)")
+    
+    return parser.parse_args(argv)
+
+
+def run_batch_command(args):
+    """Open the batch input/output streams and run the batch"""
+    transit_date = None
+    if args.transit_date:
+        transit_date = datetime.fromisoformat(args.transit_date)
+        if transit_date.tzinfo is None:
+            transit_date = pytz.UTC.localize(transit_date)
+    
+    input_stream = sys.stdin if args.input == "-" else open(args.input, 'r', encoding='utf-8', newline='')
+    output_stream = sys.stdout if args.output == "-" else open(args.output, 'w', encoding='utf-8')
+    
+    try:
+        start = time.perf_counter()
+        count = run_batch(input_stream, output_stream, workers=args.workers, store_path=args.store,
+                          transit_date=transit_date, months_ahead=args.months_ahead,
+                          readings=args.readings, input_format=args.format,
+                          asteroid_orb=args.asteroid_sweep, house_system=args.house_system,
+                          compare_houses=args.compare_houses, dst_policy=args.dst_policy)
+        elapsed = time.perf_counter() - start
+        print(f"✓ Processed {count} records in {elapsed:.1f}s", file=sys.stderr)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+
 if __name__ == "__main__":
-    main()
+    # Needed for ChartPool workers in the bundled executable
+    multiprocessing.freeze_support()
+    args = parse_command_line()
+    
+    if args.build_daily_table:
+        build_daily_ephemeris_table()
+    elif args.build_station_calendar:
+        build_station_calendar()
+    elif args.build_lunation_calendar:
+        build_lunation_calendar()
+    elif args.command == "batch":
+        run_batch_command(args)
+    else:
+        main()